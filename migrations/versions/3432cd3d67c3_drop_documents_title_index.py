@@ -0,0 +1,28 @@
+"""Drop the unused documents.title index
+
+Revision ID: 3432cd3d67c3
+Revises: 7410c67a77a9
+Create Date: 2025-07-13 11:06:54.382917
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3432cd3d67c3"
+down_revision: str | Sequence[str] | None = "7410c67a77a9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # No query filters or sorts on title; the index only slowed down writes
+    op.drop_index("ix_documents_title", table_name="documents")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_documents_title", "documents", ["title"])
@@ -0,0 +1,35 @@
+"""Add a GIN index on job params
+
+Revision ID: 3f9a6c1e8b47
+Revises: e7b2d4f81a03
+Create Date: 2025-07-12 09:41:52.207816
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9a6c1e8b47"
+down_revision: str | Sequence[str] | None = "e7b2d4f81a03"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # jsonb_path_ops only serves @> containment, but is smaller and faster
+    # than the default jsonb_ops for it
+    op.create_index(
+        "ix_jobs_params_gin",
+        "jobs",
+        ["params"],
+        postgresql_using="gin",
+        postgresql_ops={"params": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_jobs_params_gin", table_name="jobs")
@@ -0,0 +1,91 @@
+"""Convert vector_documents.embedding to halfvec(1536)
+
+Revision ID: 5b7e1c4d9a21
+Revises: 2ec9b2e8a63e
+Create Date: 2025-07-06 10:24:13.512904
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b7e1c4d9a21"
+down_revision: str | Sequence[str] | None = "2ec9b2e8a63e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Drop objects bound to the vector type before changing the column type
+    op.execute("DROP INDEX IF EXISTS ix_vector_documents_embedding_hnsw")
+    op.execute(
+        "ALTER TABLE vector_documents DROP CONSTRAINT IF EXISTS check_embedding_dimensions"
+    )
+
+    # Store embeddings as FP16 to halve storage and HNSW graph size
+    op.execute(
+        """
+        ALTER TABLE vector_documents
+        ALTER COLUMN embedding TYPE halfvec(1536)
+        USING embedding::halfvec(1536)
+    """
+    )
+
+    op.execute(
+        """
+        ALTER TABLE vector_documents
+        ADD CONSTRAINT check_embedding_dimensions
+        CHECK (vector_dims(embedding) = 1536)
+    """
+    )
+
+    # The index is rebuilt here anyway, so it picks up the parameters tuned for
+    # corpora beyond 100K embeddings (see configure_hnsw_params). Enough memory
+    # and workers keep the graph in memory and build it in parallel.
+    op.execute("SET LOCAL maintenance_work_mem = '2GB'")
+    op.execute("SET LOCAL max_parallel_maintenance_workers = 7")
+
+    op.execute(
+        """
+        CREATE INDEX ix_vector_documents_embedding_hnsw
+        ON vector_documents
+        USING hnsw (embedding halfvec_cosine_ops)
+        WITH (m = 24, ef_construction = 128)
+    """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_vector_documents_embedding_hnsw")
+    op.execute(
+        "ALTER TABLE vector_documents DROP CONSTRAINT IF EXISTS check_embedding_dimensions"
+    )
+
+    op.execute(
+        """
+        ALTER TABLE vector_documents
+        ALTER COLUMN embedding TYPE vector(1536)
+        USING embedding::vector(1536)
+    """
+    )
+
+    op.execute(
+        """
+        ALTER TABLE vector_documents
+        ADD CONSTRAINT check_embedding_dimensions
+        CHECK (vector_dims(embedding) = 1536)
+    """
+    )
+
+    op.execute(
+        """
+        CREATE INDEX ix_vector_documents_embedding_hnsw
+        ON vector_documents
+        USING hnsw (embedding vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64)
+    """
+    )
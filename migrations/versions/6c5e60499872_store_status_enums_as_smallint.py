@@ -0,0 +1,91 @@
+"""Store status and job type enums as SMALLINT codes
+
+Revision ID: 6c5e60499872
+Revises: 3f9a6c1e8b47
+Create Date: 2025-07-13 10:05:31.772104
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6c5e60499872"
+down_revision: str | Sequence[str] | None = "3f9a6c1e8b47"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, enum type, labels in code order, default label). The codes
+# are frozen here so later model changes cannot alter what this revision does;
+# they match REPOSITORY_STATUS_CODES, JOB_TYPE_CODES and JOB_STATUS_CODES.
+ENUM_COLUMNS: tuple[tuple[str, str, str, tuple[str, ...], str | None], ...] = (
+    (
+        "repositories",
+        "status",
+        "repositorystatus",
+        ("pending", "cloning", "processing", "completed", "failed"),
+        "pending",
+    ),
+    (
+        "jobs",
+        "job_type",
+        "jobtype",
+        ("clone", "analysis", "embedding", "indexing", "cleanup"),
+        None,
+    ),
+    (
+        "jobs",
+        "status",
+        "jobstatus",
+        ("pending", "running", "completed", "failed", "cancelled"),
+        "pending",
+    ),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, type_name, labels, default in ENUM_COLUMNS:
+        cases = " ".join(
+            f"WHEN '{label}' THEN {code}" for code, label in enumerate(labels)
+        )
+        # The enum default cannot be cast to smallint, so it goes first
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"""
+            ALTER TABLE {table}
+            ALTER COLUMN {column} TYPE smallint
+            USING CASE {column}::text {cases} END
+        """
+        )
+        if default is not None:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"SET DEFAULT {labels.index(default)}"
+            )
+        op.execute(f"DROP TYPE {type_name}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, type_name, labels, default in ENUM_COLUMNS:
+        values = ", ".join(f"'{label}'" for label in labels)
+        cases = " ".join(
+            f"WHEN {code} THEN '{label}'" for code, label in enumerate(labels)
+        )
+        op.execute(f"CREATE TYPE {type_name} AS ENUM ({values})")
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"""
+            ALTER TABLE {table}
+            ALTER COLUMN {column} TYPE {type_name}
+            USING (CASE {column} {cases} END)::{type_name}
+        """
+        )
+        if default is not None:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'"
+            )
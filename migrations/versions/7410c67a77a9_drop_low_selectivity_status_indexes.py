@@ -0,0 +1,37 @@
+"""Drop low-selectivity status and job type indexes
+
+Revision ID: 7410c67a77a9
+Revises: 6c5e60499872
+Create Date: 2025-07-13 10:42:08.190533
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7410c67a77a9"
+down_revision: str | Sequence[str] | None = "6c5e60499872"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index, table, column); a handful of distinct values makes these indexes
+# slower than a scan, and ix_jobs_type_status covers job_type as its prefix
+STATUS_INDEXES: tuple[tuple[str, str, str], ...] = (
+    ("ix_repositories_status", "repositories", "status"),
+    ("ix_jobs_job_type", "jobs", "job_type"),
+    ("ix_jobs_status", "jobs", "status"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for index, table, _ in STATUS_INDEXES:
+        op.drop_index(index, table_name=table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for index, table, column in STATUS_INDEXES:
+        op.create_index(index, table, [column])
@@ -0,0 +1,181 @@
+"""Partition vector_documents by repository_id hash
+
+Revision ID: 8d3f6a2b7c10
+Revises: 5b7e1c4d9a21
+Create Date: 2025-07-08 16:41:37.208113
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d3f6a2b7c10"
+down_revision: str | Sequence[str] | None = "5b7e1c4d9a21"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+PARTITION_COUNT = 16
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the id sequence alive while the old table is replaced
+    op.execute("ALTER SEQUENCE vector_documents_id_seq OWNED BY NONE")
+    op.execute("ALTER TABLE vector_documents RENAME TO vector_documents_unpartitioned")
+    # Renaming a table keeps its index names; free vector_documents_pkey
+    op.execute(
+        "ALTER INDEX vector_documents_pkey RENAME TO vector_documents_unpartitioned_pkey"
+    )
+
+    # The partition key must be part of the primary key, so repository_id
+    # becomes NOT NULL; rows without a repository make the copy below fail
+    op.execute(
+        """
+        CREATE TABLE vector_documents (
+            id INTEGER NOT NULL DEFAULT nextval('vector_documents_id_seq'),
+            content TEXT NOT NULL,
+            title VARCHAR(500),
+            source_url VARCHAR(2000),
+            embedding halfvec(1536) NOT NULL,
+            document_type VARCHAR(100),
+            repository_id INTEGER NOT NULL
+                REFERENCES repositories (id) ON DELETE CASCADE,
+            document_id INTEGER REFERENCES documents (id) ON DELETE CASCADE,
+            file_path VARCHAR(1000),
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT vector_documents_pkey PRIMARY KEY (repository_id, id),
+            CONSTRAINT check_embedding_dimensions
+                CHECK (vector_dims(embedding) = 1536)
+        ) PARTITION BY HASH (repository_id)
+    """
+    )
+
+    for remainder in range(PARTITION_COUNT):
+        op.execute(
+            f"""
+            CREATE TABLE vector_documents_p{remainder}
+            PARTITION OF vector_documents
+            FOR VALUES WITH (MODULUS {PARTITION_COUNT}, REMAINDER {remainder})
+        """
+        )
+
+    op.execute(
+        """
+        INSERT INTO vector_documents (
+            id, content, title, source_url, embedding, document_type,
+            repository_id, document_id, file_path, created_at, updated_at
+        )
+        SELECT
+            id, content, title, source_url, embedding, document_type,
+            repository_id, document_id, file_path, created_at, updated_at
+        FROM vector_documents_unpartitioned
+    """
+    )
+
+    op.execute("DROP TABLE vector_documents_unpartitioned")
+    op.execute("ALTER SEQUENCE vector_documents_id_seq OWNED BY vector_documents.id")
+
+    # Indexes on the parent cascade to every partition. repository_id alone is
+    # covered by the primary key prefix.
+    op.create_index(
+        "ix_vector_documents_document_id", "vector_documents", ["document_id"]
+    )
+    op.create_index(
+        "ix_vector_documents_document_type", "vector_documents", ["document_type"]
+    )
+    op.create_index(
+        "ix_vector_documents_repo_type",
+        "vector_documents",
+        ["repository_id", "document_type"],
+    )
+    op.create_index(
+        "ix_vector_documents_created_at", "vector_documents", ["created_at"]
+    )
+
+    # Each partition gets its own, smaller HNSW graph
+    op.execute("SET LOCAL maintenance_work_mem = '2GB'")
+    op.execute("SET LOCAL max_parallel_maintenance_workers = 7")
+    op.execute(
+        """
+        CREATE INDEX ix_vector_documents_embedding_hnsw
+        ON vector_documents
+        USING hnsw (embedding halfvec_cosine_ops)
+        WITH (m = 24, ef_construction = 128)
+    """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER SEQUENCE vector_documents_id_seq OWNED BY NONE")
+    op.execute("ALTER TABLE vector_documents RENAME TO vector_documents_partitioned")
+    op.execute(
+        "ALTER INDEX vector_documents_pkey RENAME TO vector_documents_partitioned_pkey"
+    )
+
+    op.execute(
+        """
+        CREATE TABLE vector_documents (
+            id INTEGER NOT NULL DEFAULT nextval('vector_documents_id_seq'),
+            content TEXT NOT NULL,
+            title VARCHAR(500),
+            source_url VARCHAR(2000),
+            embedding halfvec(1536) NOT NULL,
+            document_type VARCHAR(100),
+            repository_id INTEGER REFERENCES repositories (id) ON DELETE CASCADE,
+            document_id INTEGER REFERENCES documents (id) ON DELETE CASCADE,
+            file_path VARCHAR(1000),
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT vector_documents_pkey PRIMARY KEY (id),
+            CONSTRAINT check_embedding_dimensions
+                CHECK (vector_dims(embedding) = 1536)
+        )
+    """
+    )
+
+    op.execute(
+        """
+        INSERT INTO vector_documents
+        SELECT
+            id, content, title, source_url, embedding, document_type,
+            repository_id, document_id, file_path, created_at, updated_at
+        FROM vector_documents_partitioned
+    """
+    )
+
+    # Dropping the parent drops every partition
+    op.execute("DROP TABLE vector_documents_partitioned")
+    op.execute("ALTER SEQUENCE vector_documents_id_seq OWNED BY vector_documents.id")
+
+    op.create_index(
+        "ix_vector_documents_repository_id", "vector_documents", ["repository_id"]
+    )
+    op.create_index(
+        "ix_vector_documents_document_id", "vector_documents", ["document_id"]
+    )
+    op.create_index(
+        "ix_vector_documents_document_type", "vector_documents", ["document_type"]
+    )
+    op.create_index(
+        "ix_vector_documents_repo_type",
+        "vector_documents",
+        ["repository_id", "document_type"],
+    )
+    op.create_index(
+        "ix_vector_documents_created_at", "vector_documents", ["created_at"]
+    )
+
+    op.execute("SET LOCAL maintenance_work_mem = '2GB'")
+    op.execute("SET LOCAL max_parallel_maintenance_workers = 7")
+    op.execute(
+        """
+        CREATE INDEX ix_vector_documents_embedding_hnsw
+        ON vector_documents
+        USING hnsw (embedding halfvec_cosine_ops)
+        WITH (m = 24, ef_construction = 128)
+    """
+    )
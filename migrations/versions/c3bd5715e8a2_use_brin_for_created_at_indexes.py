@@ -0,0 +1,45 @@
+"""Use BRIN indexes for created_at columns
+
+Revision ID: c3bd5715e8a2
+Revises: 3432cd3d67c3
+Create Date: 2025-07-13 11:08:46.513920
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3bd5715e8a2"
+down_revision: str | Sequence[str] | None = "3432cd3d67c3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# created_at only grows, so it correlates with heap order and a BRIN index
+# serves the same range scans as a B-tree at a fraction of the size
+CREATED_AT_TABLES: tuple[str, ...] = (
+    "repositories",
+    "documents",
+    "jobs",
+    "vector_documents",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in CREATED_AT_TABLES:
+        op.drop_index(f"ix_{table}_created_at", table_name=table)
+        op.execute(
+            f"""
+            CREATE INDEX ix_{table}_created_at ON {table}
+            USING BRIN (created_at) WITH (pages_per_range = 32)
+        """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in CREATED_AT_TABLES:
+        op.drop_index(f"ix_{table}_created_at", table_name=table)
+        op.create_index(f"ix_{table}_created_at", table, ["created_at"])
@@ -0,0 +1,48 @@
+"""Store jobs.params and jobs.result as jsonb
+
+Revision ID: c41a7e9d2f58
+Revises: 8d3f6a2b7c10
+Create Date: 2025-07-10 09:12:48.604217
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c41a7e9d2f58"
+down_revision: str | Sequence[str] | None = "8d3f6a2b7c10"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+JSON_COLUMNS = ("params", "result")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # jsonb is stored pre-parsed, so reads skip re-parsing the JSON text
+    for column in JSON_COLUMNS:
+        op.alter_column(
+            "jobs",
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            existing_nullable=True,
+            postgresql_using=f"{column}::jsonb",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in JSON_COLUMNS:
+        op.alter_column(
+            "jobs",
+            column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=True,
+            postgresql_using=f"{column}::json",
+        )
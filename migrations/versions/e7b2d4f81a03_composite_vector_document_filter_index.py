@@ -0,0 +1,46 @@
+"""Replace vector_documents type indexes with a composite filter index
+
+Revision ID: e7b2d4f81a03
+Revises: c41a7e9d2f58
+Create Date: 2025-07-11 14:03:26.418390
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7b2d4f81a03"
+down_revision: str | Sequence[str] | None = "c41a7e9d2f58"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # One index serves "repository + type, newest first"; document_type is
+    # only ever filtered together with a repository
+    op.create_index(
+        "ix_vector_documents_repo_type_created",
+        "vector_documents",
+        ["repository_id", "document_type", sa.text("created_at DESC")],
+    )
+    op.drop_index("ix_vector_documents_repo_type", table_name="vector_documents")
+    op.drop_index("ix_vector_documents_document_type", table_name="vector_documents")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_vector_documents_document_type", "vector_documents", ["document_type"]
+    )
+    op.create_index(
+        "ix_vector_documents_repo_type",
+        "vector_documents",
+        ["repository_id", "document_type"],
+    )
+    op.drop_index(
+        "ix_vector_documents_repo_type_created", table_name="vector_documents"
+    )
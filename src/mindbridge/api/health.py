@@ -1,12 +1,15 @@
 """Health check API endpoints."""
 
 import asyncio
+import time
 from datetime import UTC, datetime
 from enum import Enum
+from typing import TypedDict
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from sqlalchemy import text
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 
 from mindbridge.__about__ import __version__
 from mindbridge.database.connection import get_async_engine
@@ -27,16 +30,60 @@ class HealthStatus(str, Enum):
 class HealthResponse(BaseModel):
     """Health check response model."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     status: HealthStatus
     timestamp: str
     version: str
 
 
+class ReadinessChecks(TypedDict):
+    """Per-service readiness results."""
+
+    database: str
+    redis: str
+
+
 class ReadinessResponse(BaseModel):
     """Readiness check response model."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     status: HealthStatus
-    checks: dict[str, str]
+    checks: ReadinessChecks
+
+
+# Upper bound for the database query so a hung server cannot wedge /ready
+DATABASE_PING_TIMEOUT_SECONDS = 0.5
+
+# Overall deadline per probe, including pool checkout and connection setup
+HEALTH_PROBE_TIMEOUT_SECONDS = 1.0
+
+# Readiness results are reused for this many seconds to absorb probe bursts
+READINESS_CACHE_TTL_SECONDS = 2.0
+
+_readiness_cache: tuple[float, ReadinessResponse] | None = None
+_readiness_lock = asyncio.Lock()
+
+# Static parts of the /health body, serialized once at import; only the
+# timestamp is spliced in at request time
+_HEALTH_BODY_PREFIX, _, _HEALTH_BODY_SUFFIX = orjson.dumps(
+    {
+        "status": HealthStatus.HEALTHY.value,
+        "timestamp": "__timestamp__",
+        "version": __version__,
+    }
+).partition(b"__timestamp__")
+
+# Serialized /health body, rebuilt at most once per wall-clock second
+_health_body_cache: tuple[int, bytes] | None = None
+
+
+def clear_readiness_cache() -> None:
+    """Drop the cached readiness result so the next probe re-checks services."""
+    global _readiness_cache, _readiness_lock
+    _readiness_cache = None
+    _readiness_lock = asyncio.Lock()
 
 
 async def check_database_health() -> bool:
@@ -47,9 +94,14 @@ async def check_database_health() -> bool:
     """
     try:
         engine = get_async_engine()
-        async with engine.get_session() as session:
-            await session.execute(text("SELECT 1"))
-            return True
+        await asyncio.wait_for(
+            engine.ping(timeout=DATABASE_PING_TIMEOUT_SECONDS),
+            timeout=HEALTH_PROBE_TIMEOUT_SECONDS,
+        )
+        return True
+    except TimeoutError:
+        logger.warning("Database health check timed out")
+        return False
     except Exception:
         logger.exception("Database health check failed")
         return False
@@ -65,17 +117,19 @@ async def check_redis_health() -> bool:
         from mindbridge.cache.redis_cache import get_redis_cache
 
         cache = get_redis_cache()
-        await cache.connect()
-        result = await cache.ping()
-        await cache.disconnect()
-        return bool(result)
+        return await asyncio.wait_for(
+            cache.ping(), timeout=HEALTH_PROBE_TIMEOUT_SECONDS
+        )
+    except TimeoutError:
+        logger.warning("Redis health check timed out")
+        return False
     except Exception:
         logger.exception("Redis health check failed")
         return False
 
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """Basic health check endpoint.
 
     Returns:
@@ -83,15 +137,31 @@ async def health_check() -> HealthResponse:
     """
     logger.info("Health check requested")
 
-    return HealthResponse(
-        status=HealthStatus.HEALTHY,
-        timestamp=datetime.now(UTC).isoformat().replace("+00:00", "Z"),
-        version=__version__,
-    )
+    return Response(content=_get_health_body(), media_type="application/json")
+
+
+def _get_health_body() -> bytes:
+    """Return the serialized health response for the current second.
+
+    Returns:
+        JSON encoded HealthResponse.
+    """
+    global _health_body_cache
+
+    now = datetime.now(UTC)
+    second = int(now.timestamp())
+    cached = _health_body_cache
+    if cached is not None and cached[0] == second:
+        return cached[1]
+
+    timestamp = now.isoformat().replace("+00:00", "Z")
+    body = _HEALTH_BODY_PREFIX + timestamp.encode() + _HEALTH_BODY_SUFFIX
+    _health_body_cache = (second, body)
+    return body
 
 
 @router.get("/ready", response_model=ReadinessResponse)
-async def readiness_check() -> ReadinessResponse:
+async def readiness_check() -> ORJSONResponse:
     """Readiness check endpoint that verifies dependencies.
 
     Returns:
@@ -102,25 +172,51 @@ async def readiness_check() -> ReadinessResponse:
     """
     logger.info("Readiness check requested")
 
-    # Check individual services concurrently
-    db_healthy, redis_healthy = await asyncio.gather(
-        check_database_health(), check_redis_health()
-    )
+    response = await _get_readiness()
+    checks = response.checks
 
-    checks = {
-        "database": "healthy" if db_healthy else "unhealthy",
-        "redis": "healthy" if redis_healthy else "unhealthy",
-    }
+    if response.status != HealthStatus.HEALTHY:
+        logger.warning("Readiness check failed", checks=checks)
+        raise HTTPException(status_code=503, detail=response.model_dump(mode="json"))
 
-    # Determine overall status
-    all_healthy = db_healthy and redis_healthy
-    overall_status = HealthStatus.HEALTHY if all_healthy else HealthStatus.UNHEALTHY
+    logger.info("Readiness check passed", checks=checks)
+    return ORJSONResponse(content={"status": response.status.value, "checks": checks})
 
-    response = ReadinessResponse(status=overall_status, checks=checks)
 
-    if not all_healthy:
-        logger.warning("Readiness check failed", checks=checks)
-        raise HTTPException(status_code=503, detail=response.model_dump())
+async def _get_readiness() -> ReadinessResponse:
+    """Return the cached readiness result, re-checking services once it expires.
 
-    logger.info("Readiness check passed", checks=checks)
-    return response
+    Returns:
+        Readiness status with individual service health checks.
+    """
+    global _readiness_cache
+
+    cached = _readiness_cache
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    async with _readiness_lock:
+        # Another request may have refreshed the cache while we waited
+        cached = _readiness_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        # Check individual services concurrently
+        db_healthy, redis_healthy = await asyncio.gather(
+            check_database_health(), check_redis_health()
+        )
+
+        checks: ReadinessChecks = {
+            "database": "healthy" if db_healthy else "unhealthy",
+            "redis": "healthy" if redis_healthy else "unhealthy",
+        }
+
+        # Determine overall status
+        all_healthy = db_healthy and redis_healthy
+        overall_status = HealthStatus.HEALTHY if all_healthy else HealthStatus.UNHEALTHY
+
+        response = ReadinessResponse.model_construct(
+            status=overall_status, checks=checks
+        )
+        _readiness_cache = (time.monotonic() + READINESS_CACHE_TTL_SECONDS, response)
+        return response
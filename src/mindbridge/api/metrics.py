@@ -1,7 +1,12 @@
 """Metrics collection API endpoints."""
 
-from fastapi import APIRouter, Response
-from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from collections.abc import Iterator
+
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
+from prometheus_client.metrics_core import Metric
+from prometheus_client.registry import CollectorRegistry
 
 from mindbridge.observability.logging_config import get_logger
 
@@ -9,16 +14,34 @@ logger = get_logger(__name__)
 router = APIRouter(tags=["metrics"])
 
 
-@router.get("/metrics", response_class=Response)
-async def get_metrics() -> Response:
+class _SingleMetricRegistry(CollectorRegistry):
+    """Registry stand-in exposing one metric family to ``generate_latest``."""
+
+    def __init__(self, metric: Metric) -> None:
+        super().__init__()
+        self._metric = metric
+
+    def collect(self) -> Iterator[Metric]:
+        yield self._metric
+
+
+def _iter_exposition() -> Iterator[bytes]:
+    """Yield the Prometheus exposition one metric family at a time.
+
+    Yields:
+        Text-format exposition bytes for a single metric family.
+    """
+    for metric in REGISTRY.collect():
+        yield generate_latest(_SingleMetricRegistry(metric))
+
+
+@router.get("/metrics", response_class=StreamingResponse)
+async def get_metrics() -> StreamingResponse:
     """Prometheus metrics endpoint.
 
     Returns:
-        Prometheus formatted metrics data.
+        Prometheus formatted metrics data, streamed per metric family.
     """
     logger.debug("Metrics endpoint requested")
 
-    # Generate Prometheus metrics
-    metrics_data = generate_latest()
-
-    return Response(content=metrics_data, media_type=CONTENT_TYPE_LATEST)
+    return StreamingResponse(_iter_exposition(), media_type=CONTENT_TYPE_LATEST)
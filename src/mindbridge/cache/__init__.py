@@ -1,6 +1,6 @@
 """Cache module for Redis-based caching operations."""
 
 from . import redis_cache
-from .redis_cache import RedisCache, get_redis_cache
+from .redis_cache import RedisCache, close_redis_cache, get_redis_cache
 
-__all__ = ["redis_cache", "get_redis_cache", "RedisCache"]
+__all__ = ["redis_cache", "get_redis_cache", "close_redis_cache", "RedisCache"]
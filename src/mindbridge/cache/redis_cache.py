@@ -1,34 +1,143 @@
 """Redis cache implementation with async support."""
 
+import functools
 import os
+import threading
+from dataclasses import dataclass
 
-from mindbridge.cache.exceptions import CacheConfigurationError
+import redis.asyncio as aioredis
+from redis.asyncio.connection import BlockingConnectionPool
+from redis.exceptions import RedisError
+
+from mindbridge.cache.exceptions import CacheConfigurationError, CacheConnectionError
 
 
 class RedisCache:
-    """Minimal Redis cache implementation for health checks."""
+    """Redis cache backed by a shared blocking connection pool."""
+
+    def __init__(self, pool: BlockingConnectionPool) -> None:
+        """Initialize Redis cache.
 
-    def __init__(self) -> None:
-        """Initialize Redis cache."""
-        self._is_connected = False
+        Args:
+            pool: Connection pool shared by every client of this Redis server
+        """
+        self._pool = pool
+        self._client = aioredis.Redis(connection_pool=pool)
+
+    @property
+    def client(self) -> aioredis.Redis:
+        """Get the pooled Redis client."""
+        return self._client
 
     async def connect(self) -> None:
-        """Connect to Redis server."""
-        self._is_connected = True
+        """Warm up one pooled connection."""
+        await self.ping()
 
     async def disconnect(self) -> None:
-        """Disconnect from Redis server."""
-        self._is_connected = False
+        """Close the client and all pooled connections."""
+        await self._client.aclose()
+        await self._pool.disconnect()
 
     async def ping(self) -> bool:
-        """Ping Redis server to check connection."""
-        return self._is_connected
+        """Ping Redis server over a pooled connection.
 
+        Returns:
+            True if Redis answered the ping
 
-def get_redis_cache() -> RedisCache:
-    """Get the global Redis cache instance."""
+        Raises:
+            CacheConnectionError: If Redis cannot be reached
+        """
+        try:
+            return bool(await self._client.ping())
+        except RedisError as e:
+            raise CacheConnectionError("Redis ping failed", cause=e) from e
+
+
+@dataclass(frozen=True)
+class RedisConfig:
+    """Redis connection settings parsed from the environment."""
+
+    redis_url: str
+    pool_size: int
+    pool_timeout: int
+    health_check_interval: int
+
+
+@functools.lru_cache(maxsize=1)
+def _redis_config() -> RedisConfig:
+    """Parse Redis settings from the environment once.
+
+    Returns:
+        RedisConfig: Parsed Redis settings
+
+    Raises:
+        CacheConfigurationError: If Redis URL is not configured
+    """
     redis_url = os.getenv("REDIS_URL")
     if not redis_url:
         raise CacheConfigurationError("REDIS_URL environment variable is required")
 
-    return RedisCache()
+    return RedisConfig(
+        redis_url=redis_url,
+        pool_size=int(os.getenv("REDIS_POOL_SIZE", "20")),
+        pool_timeout=int(os.getenv("REDIS_POOL_TIMEOUT", "5")),
+        health_check_interval=int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30")),
+    )
+
+
+# Global connection pool (keyed by config) and cache instance; the lock keeps
+# threads that race on first use from building a second pool
+_connection_pool: tuple[RedisConfig, BlockingConnectionPool] | None = None
+_redis_cache: RedisCache | None = None
+_redis_cache_lock = threading.Lock()
+
+
+def _get_connection_pool(config: RedisConfig) -> BlockingConnectionPool:
+    """Get the shared connection pool for a Redis configuration.
+
+    Args:
+        config: Redis connection settings
+
+    Returns:
+        BlockingConnectionPool: Pool parsed once per configuration
+    """
+    global _connection_pool
+
+    if _connection_pool is None or _connection_pool[0] != config:
+        pool = BlockingConnectionPool.from_url(
+            config.redis_url,
+            max_connections=config.pool_size,
+            timeout=config.pool_timeout,
+            health_check_interval=config.health_check_interval,
+        )
+        _connection_pool = (config, pool)
+
+    return _connection_pool[1]
+
+
+def get_redis_cache() -> RedisCache:
+    """Get the global Redis cache instance.
+
+    Returns:
+        RedisCache: Shared cache instance
+
+    Raises:
+        CacheConfigurationError: If Redis URL is not configured
+    """
+    global _redis_cache
+
+    if _redis_cache is None:
+        with _redis_cache_lock:
+            if _redis_cache is None:
+                _redis_cache = RedisCache(_get_connection_pool(_redis_config()))
+
+    return _redis_cache
+
+
+async def close_redis_cache() -> None:
+    """Close the global Redis cache and its connection pool."""
+    global _connection_pool, _redis_cache
+    if _redis_cache is not None:
+        await _redis_cache.disconnect()
+        _redis_cache = None
+    _connection_pool = None
@@ -1,5 +1,6 @@
 """Database package for mindbridge application."""
 
+from .bulk import bulk_copy_vector_documents, bulk_insert_vector_documents
 from .connection import DatabaseEngine, get_async_engine
 from .health import DatabaseHealthChecker
 from .models import Base, VectorDocument
@@ -10,4 +11,6 @@ __all__ = [
     "Base",
     "VectorDocument",
     "DatabaseHealthChecker",
+    "bulk_copy_vector_documents",
+    "bulk_insert_vector_documents",
 ]
@@ -0,0 +1,161 @@
+"""Bulk ingest helpers for vector documents."""
+
+import struct
+from collections.abc import Iterable, Mapping, Sequence
+from itertools import batched
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import Executable, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from .models import DEFAULT_INSERT_BATCH_SIZE, VectorDocument
+
+if TYPE_CHECKING:
+    from asyncpg import Connection
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+EMBEDDING_DIMENSIONS = 1536
+
+# Columns written by binary COPY. COPY bypasses the ORM's client-side timestamp
+# defaults, so created_at/updated_at come from the server defaults here, while
+# bulk_insert_vector_documents binds them as parameters like any other column
+VECTOR_DOCUMENT_COPY_COLUMNS: tuple[str, ...] = (
+    "content",
+    "title",
+    "source_url",
+    "embedding",
+    "document_type",
+    "repository_id",
+    "document_id",
+    "file_path",
+)
+
+_HALFVEC_HEADER = struct.Struct(">HH")
+_HALFVEC_VALUES = struct.Struct(f">{EMBEDDING_DIMENSIONS}e")
+
+
+def encode_halfvec_binary(embedding: Sequence[float]) -> bytes:
+    """Encode an embedding in pgvector's binary halfvec wire format.
+
+    Args:
+        embedding: Embedding values
+
+    Returns:
+        Binary halfvec payload (dimension header followed by FP16 values)
+
+    Raises:
+        ValueError: If the embedding does not have 1536 dimensions
+    """
+    if len(embedding) != EMBEDDING_DIMENSIONS:
+        raise ValueError(
+            f"Embedding must be exactly {EMBEDDING_DIMENSIONS} dimensions, "
+            f"got {len(embedding)}"
+        )
+    return _HALFVEC_HEADER.pack(EMBEDDING_DIMENSIONS, 0) + _HALFVEC_VALUES.pack(
+        *embedding
+    )
+
+
+def decode_halfvec_binary(data: bytes) -> list[float]:
+    """Decode pgvector's binary halfvec wire format.
+
+    Args:
+        data: Binary halfvec payload
+
+    Returns:
+        Embedding values
+    """
+    dimensions, _ = _HALFVEC_HEADER.unpack_from(data)
+    return list(struct.unpack_from(f">{dimensions}e", data, _HALFVEC_HEADER.size))
+
+
+async def bulk_copy_vector_documents(
+    conn: "Connection", rows: Iterable[Mapping[str, Any]]
+) -> int:
+    """Load vector documents with binary COPY.
+
+    The binary halfvec codec is only installed for the duration of the COPY.
+    The connection usually comes from the shared pool, where the ORM binds
+    halfvec values as text, so the default codec is restored afterwards.
+
+    Args:
+        conn: Raw asyncpg connection
+        rows: Vector document values keyed by column name
+
+    Returns:
+        Number of rows copied
+    """
+    records = [
+        tuple(row.get(column) for column in VECTOR_DOCUMENT_COPY_COLUMNS)
+        for row in rows
+    ]
+    if not records:
+        return 0
+
+    await conn.set_type_codec(
+        "halfvec",
+        schema="public",
+        encoder=encode_halfvec_binary,
+        decoder=decode_halfvec_binary,
+        format="binary",
+    )
+    try:
+        await conn.copy_records_to_table(
+            "vector_documents",
+            records=records,
+            columns=VECTOR_DOCUMENT_COPY_COLUMNS,
+        )
+    finally:
+        await conn.reset_type_codec("halfvec", schema="public")
+    return len(records)
+
+
+async def bulk_insert_vector_documents(
+    session: "AsyncSession",
+    rows: Iterable[Mapping[str, Any]],
+    *,
+    batch_size: int = DEFAULT_INSERT_BATCH_SIZE,
+    on_conflict_do_nothing: bool = False,
+) -> int:
+    """Insert vector documents in batches, committing per batch.
+
+    The asyncpg dialect sends each batch as an executemany of one prepared
+    single-row INSERT rather than a multi-row VALUES statement, so the batch
+    size is not bounded by PostgreSQL's bind parameter limit. asyncpg reports
+    no row count for executemany, so when conflicting rows are skipped the
+    INSERT returns the new ids and only those are counted.
+
+    Args:
+        session: Database session
+        rows: Vector document values keyed by column name
+        batch_size: Maximum rows per INSERT and transaction
+        on_conflict_do_nothing: Skip rows that conflict with existing ones
+
+    Returns:
+        Number of rows inserted, excluding skipped conflicting rows
+
+    Raises:
+        ValueError: If batch size is not positive
+    """
+    if batch_size < 1:
+        raise ValueError("Batch size must be >= 1")
+
+    statement: Executable
+    if on_conflict_do_nothing:
+        statement = (
+            pg_insert(VectorDocument)
+            .on_conflict_do_nothing()
+            .returning(VectorDocument.id)
+        )
+    else:
+        statement = insert(VectorDocument)
+
+    inserted = 0
+    for batch in batched(rows, batch_size):
+        result = await session.execute(statement, list(batch))
+        if on_conflict_do_nothing:
+            inserted += len(result.scalars().all())
+        else:
+            inserted += len(batch)
+        await session.commit()
+    return inserted
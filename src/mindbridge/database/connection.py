@@ -1,16 +1,40 @@
 """Database connection management with async SQLAlchemy and connection pooling."""
 
+import functools
 import os
+import threading
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import Any
 
+import orjson
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 
+from .vector_index import MAX_EF_SEARCH, MIN_EF_SEARCH
+
+# set_config() rather than SET LOCAL because SET cannot take bind parameters;
+# is_local=true keeps the setting scoped to the current transaction
+_SET_EF_SEARCH_SQL = text("SELECT set_config('hnsw.ef_search', :ef_search, true)")
+
+
+# asyncpg's own statement cache and SQLAlchemy's prepared-statement cache per
+# connection; recurring queries (health probes, vector search) skip Parse
+STATEMENT_CACHE_SIZE = 2048
+PREPARED_STATEMENT_CACHE_SIZE = 512
+
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON column values with orjson."""
+    return orjson.dumps(value).decode()
+
 
 class DatabaseEngine:
     """Database engine manager with connection pooling."""
@@ -19,12 +43,13 @@ class DatabaseEngine:
         self,
         database_url: str,
         *,
-        pool_size: int = 10,
-        max_overflow: int = 20,
+        pool_size: int = 25,
+        max_overflow: int = 50,
         pool_timeout: int = 30,
         pool_recycle: int = 3600,
         pool_pre_ping: bool = True,
         echo: bool = False,
+        ef_search: int = 100,
     ) -> None:
         """Initialize database engine with connection pooling configuration.
 
@@ -36,6 +61,7 @@ class DatabaseEngine:
             pool_recycle: Recycle connections after this many seconds
             pool_pre_ping: Test connections on checkout
             echo: Enable SQL query logging
+            ef_search: Default HNSW ef_search for vector search sessions
         """
         self._database_url = database_url
         self._pool_size = pool_size
@@ -44,6 +70,7 @@ class DatabaseEngine:
         self._pool_recycle = pool_recycle
         self._pool_pre_ping = pool_pre_ping
         self._echo = echo
+        self._ef_search = ef_search
         self._engine: AsyncEngine | None = None
         self._session_factory: async_sessionmaker[AsyncSession] | None = None
 
@@ -58,7 +85,17 @@ class DatabaseEngine:
                 pool_timeout=self._pool_timeout,
                 pool_recycle=self._pool_recycle,
                 pool_pre_ping=self._pool_pre_ping,
+                # Reuse the most recently returned connection so idle ones can
+                # be recycled and hot ones keep warm server-side caches
+                pool_use_lifo=True,
+                use_insertmanyvalues=True,
                 echo=self._echo,
+                json_serializer=_json_serializer,
+                json_deserializer=orjson.loads,
+                connect_args={
+                    "statement_cache_size": STATEMENT_CACHE_SIZE,
+                    "prepared_statement_cache_size": PREPARED_STATEMENT_CACHE_SIZE,
+                },
             )
         return self._engine
 
@@ -90,6 +127,73 @@ class DatabaseEngine:
                 await session.rollback()
                 raise
 
+    @asynccontextmanager
+    async def get_readonly_connection(self) -> AsyncGenerator[AsyncConnection, None]:
+        """Get a pooled connection in autocommit mode for read-only probes.
+
+        Statements run without BEGIN/COMMIT round-trips. The isolation level
+        is reset when the connection returns to the pool.
+
+        Yields:
+            AsyncConnection: Database connection in autocommit mode
+        """
+        async with self.engine.connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            yield conn
+
+    @asynccontextmanager
+    async def vector_search_session(
+        self, ef_search: int | None = None
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """Get a session with hnsw.ef_search set for the current transaction.
+
+        The setting is transaction-scoped so it never leaks into other users
+        of the pooled connection.
+
+        Args:
+            ef_search: HNSW ef_search override, defaults to the engine setting
+
+        Yields:
+            AsyncSession: Database session inside an open transaction
+
+        Raises:
+            ValueError: If ef_search is outside pgvector's supported range
+        """
+        ef_search = self._ef_search if ef_search is None else ef_search
+        if not MIN_EF_SEARCH <= ef_search <= MAX_EF_SEARCH:
+            raise ValueError(
+                f"ef_search must be between {MIN_EF_SEARCH} and {MAX_EF_SEARCH}"
+            )
+
+        async with self.get_session() as session, session.begin():
+            await session.execute(_SET_EF_SEARCH_SQL, {"ef_search": str(ef_search)})
+            yield session
+
+    async def ping(self, timeout: float = 0.5) -> None:
+        """Check that a pooled connection answers.
+
+        With pool_pre_ping the checkout already pings a reused connection (and
+        opening a new one proves connectivity), so nothing else is sent and the
+        caller's deadline bounds the check. Otherwise ``SELECT 1`` runs directly
+        on the driver connection, skipping SQLAlchemy statement compilation and
+        transaction handling.
+
+        Args:
+            timeout: Seconds to wait for ``SELECT 1`` before failing
+
+        Raises:
+            TimeoutError: If the database does not answer within the timeout
+            ConnectionError: If the pooled connection has no driver connection
+        """
+        async with self.engine.connect() as conn:
+            if self._pool_pre_ping:
+                return
+            raw_connection = await conn.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+            if driver_connection is None:
+                raise ConnectionError("Pooled connection has no driver connection")
+            await driver_connection.fetchval("SELECT 1", timeout=timeout)
+
     async def close(self) -> None:
         """Close the database engine and all connections."""
         if self._engine is not None:
@@ -98,8 +202,50 @@ class DatabaseEngine:
             self._session_factory = None
 
 
-# Global database engine instance
+@dataclass(frozen=True)
+class DatabaseConfig:
+    """Database engine settings parsed from the environment."""
+
+    database_url: str
+    pool_size: int
+    max_overflow: int
+    pool_timeout: int
+    pool_recycle: int
+    pool_pre_ping: bool
+    echo: bool
+    ef_search: int
+
+
+@functools.lru_cache(maxsize=1)
+def _db_config() -> DatabaseConfig:
+    """Parse database settings from the environment once.
+
+    Returns:
+        DatabaseConfig: Parsed database settings
+
+    Raises:
+        RuntimeError: If database URL is not configured
+    """
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise RuntimeError("DATABASE_URL environment variable is required")
+
+    return DatabaseConfig(
+        database_url=database_url,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "25")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "50")),
+        pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "3600")),
+        pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+        echo=os.getenv("DB_ECHO", "false").lower() == "true",
+        ef_search=int(os.getenv("HNSW_EF_SEARCH", "100")),
+    )
+
+
+# Global database engine instance; the lock keeps threads that race on first
+# use from building a second engine and pool
 _database_engine: DatabaseEngine | None = None
+_database_engine_lock = threading.Lock()
 
 
 def get_async_engine() -> DatabaseEngine:
@@ -114,22 +260,9 @@ def get_async_engine() -> DatabaseEngine:
     global _database_engine
 
     if _database_engine is None:
-        database_url = os.getenv("DATABASE_URL")
-        if not database_url:
-            raise RuntimeError("DATABASE_URL environment variable is required")
-
-        # Parse echo setting from environment
-        echo = os.getenv("DB_ECHO", "false").lower() == "true"
-
-        _database_engine = DatabaseEngine(
-            database_url=database_url,
-            pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
-            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
-            pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
-            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "3600")),
-            pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
-            echo=echo,
-        )
+        with _database_engine_lock:
+            if _database_engine is None:
+                _database_engine = DatabaseEngine(**asdict(_db_config()))
 
     return _database_engine
 
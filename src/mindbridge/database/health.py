@@ -1,13 +1,27 @@
 """Database health checking functionality."""
 
+import asyncio
+import time
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import select, text
+from sqlalchemy import Row, text
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.pool import QueuePool
 
 from .connection import DatabaseEngine
 
+# Installed extensions rarely change, so the pg_extension lookup is reused
+PGVECTOR_EXTENSION_CACHE_TTL_SECONDS = 300.0
+
+# Probe statements are built once so every call hits the same compiled-cache
+# entry and the same server-side prepared statement (safe static queries)
+_EXTENSION_QUERY = text(
+    "SELECT extname, extversion FROM pg_extension WHERE extname = :ext_name"
+)
+_VECTOR_TEST_QUERY = text("SELECT '[1,2,3]'::vector <-> '[4,5,6]'::vector as distance")
+
 
 class DatabaseHealthChecker:
     """Database health checker for monitoring connection and vector operations."""
@@ -19,27 +33,165 @@ class DatabaseHealthChecker:
             database_engine: Database engine instance
         """
         self._database_engine = database_engine
+        self._extension_row_cache: tuple[float, Row[Any]] | None = None
+        self._extension_row_lock = asyncio.Lock()
+
+    async def _get_pgvector_extension_row(
+        self, connection: AsyncConnection
+    ) -> Row[Any] | None:
+        """Look up the pgvector extension row, reusing a recent positive result.
+
+        Concurrent callers share a single lookup when the cache is cold.
+
+        Args:
+            connection: Database connection used on a cache miss
+
+        Returns:
+            Extension row with extname and extversion, or None if not installed
+        """
+        cached = self._extension_row_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        async with self._extension_row_lock:
+            cached = self._extension_row_cache
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+            # Check if pgvector extension exists
+            extension_result = await connection.execute(
+                _EXTENSION_QUERY, {"ext_name": "vector"}
+            )
+            extension_row = extension_result.fetchone()
+
+            # Only cache a present extension so a fresh install is seen at once
+            if extension_row:
+                self._extension_row_cache = (
+                    time.monotonic() + PGVECTOR_EXTENSION_CACHE_TTL_SECONDS,
+                    extension_row,
+                )
+            return extension_row
+
+    async def _connectivity_check(self, connection: AsyncConnection) -> dict[str, Any]:
+        """Run the connectivity query on an open connection.
+
+        Args:
+            connection: Database connection to probe
+
+        Returns:
+            Connectivity check entry
+        """
+        # Empty query: the server answers without parsing or planning
+        await connection.exec_driver_sql("")
+        return {
+            "status": "healthy",
+            "message": "Database connection successful",
+        }
+
+    async def _pgvector_checks(self, connection: AsyncConnection) -> dict[str, Any]:
+        """Run the pgvector extension and vector operation checks on a connection.
 
-    async def check_basic_connectivity(self) -> dict[str, Any]:
+        Args:
+            connection: Database connection to probe
+
+        Returns:
+            Check entries keyed by check name
+        """
+        extension_row = await self._get_pgvector_extension_row(connection)
+        if not extension_row:
+            return {
+                "pgvector_extension": {
+                    "status": "unhealthy",
+                    "message": "pgvector extension is not installed",
+                }
+            }
+
+        checks: dict[str, Any] = {
+            "pgvector_extension": {
+                "status": "healthy",
+                "message": f"pgvector extension version {extension_row.extversion} is installed",
+            }
+        }
+
+        # Test vector operations with static vectors
+        vector_result = await connection.execute(_VECTOR_TEST_QUERY)
+        distance = vector_result.scalar()
+
+        checks["vector_operations"] = {
+            "status": "healthy",
+            "message": f"Vector distance calculation successful: {distance}",
+        }
+        return checks
+
+    async def _run_all_db_checks(self, connection: AsyncConnection) -> dict[str, Any]:
+        """Run every database-backed check on one connection.
+
+        The queries run back to back; a single asyncpg connection cannot
+        execute statements concurrently.
+
+        Args:
+            connection: Database connection shared by all checks
+
+        Returns:
+            Check entries keyed by check name
+        """
+        checks: dict[str, Any] = {}
+
+        try:
+            checks["connectivity"] = await self._connectivity_check(connection)
+        except Exception as e:
+            prefix = (
+                "Database connection failed"
+                if isinstance(e, SQLAlchemyError)
+                else "Unexpected error"
+            )
+            checks["connectivity"] = {
+                "status": "unhealthy",
+                "message": f"{prefix}: {str(e)}",
+            }
+            checks["pgvector_extension"] = {
+                "status": "unhealthy",
+                "message": "Skipped: database connection failed",
+            }
+            return checks
+
+        try:
+            checks.update(await self._pgvector_checks(connection))
+        except SQLAlchemyError as e:
+            checks["pgvector_extension"] = {
+                "status": "unhealthy",
+                "message": f"pgvector check failed: {str(e)}",
+            }
+        except Exception as e:
+            checks["pgvector_extension"] = {
+                "status": "unhealthy",
+                "message": f"Unexpected error: {str(e)}",
+            }
+
+        return checks
+
+    async def check_basic_connectivity(
+        self, timestamp: str | None = None
+    ) -> dict[str, Any]:
         """Check basic database connectivity.
 
+        Args:
+            timestamp: Precomputed ISO timestamp; the current time if omitted
+
         Returns:
             Dict containing health check results
         """
         result: dict[str, Any] = {
             "status": "healthy",
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": timestamp or datetime.now(UTC).isoformat(),
             "checks": {},
         }
 
         try:
-            async with self._database_engine.get_session() as session:
-                # Simple connectivity test
-                await session.execute(select(1))
-                result["checks"]["connectivity"] = {
-                    "status": "healthy",
-                    "message": "Database connection successful",
-                }
+            async with self._database_engine.get_readonly_connection() as connection:
+                result["checks"]["connectivity"] = await self._connectivity_check(
+                    connection
+                )
         except SQLAlchemyError as e:
             result["status"] = "unhealthy"
             result["checks"]["connectivity"] = {
@@ -55,52 +207,28 @@ class DatabaseHealthChecker:
 
         return result
 
-    async def check_pgvector_extension(self) -> dict[str, Any]:
+    async def check_pgvector_extension(
+        self, timestamp: str | None = None
+    ) -> dict[str, Any]:
         """Check if pgvector extension is available and working.
 
+        Args:
+            timestamp: Precomputed ISO timestamp; the current time if omitted
+
         Returns:
             Dict containing pgvector extension check results
         """
         result: dict[str, Any] = {
             "status": "healthy",
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": timestamp or datetime.now(UTC).isoformat(),
             "checks": {},
         }
 
         try:
-            async with self._database_engine.get_session() as session:
-                # Check if pgvector extension exists (safe static query)
-                extension_query = text(
-                    "SELECT extname, extversion FROM pg_extension WHERE extname = :ext_name"
-                )
-                extension_result = await session.execute(
-                    extension_query, {"ext_name": "vector"}
-                )
-                extension_row = extension_result.fetchone()
-
-                if extension_row:
-                    result["checks"]["pgvector_extension"] = {
-                        "status": "healthy",
-                        "message": f"pgvector extension version {extension_row.extversion} is installed",
-                    }
-
-                    # Test vector operations with static vectors (safe text query)
-                    vector_test_query = text(
-                        "SELECT '[1,2,3]'::vector <-> '[4,5,6]'::vector as distance"
-                    )
-                    vector_result = await session.execute(vector_test_query)
-                    distance = vector_result.scalar()
-
-                    result["checks"]["vector_operations"] = {
-                        "status": "healthy",
-                        "message": f"Vector distance calculation successful: {distance}",
-                    }
-                else:
+            async with self._database_engine.get_readonly_connection() as connection:
+                result["checks"] = await self._pgvector_checks(connection)
+                if result["checks"]["pgvector_extension"]["status"] != "healthy":
                     result["status"] = "unhealthy"
-                    result["checks"]["pgvector_extension"] = {
-                        "status": "unhealthy",
-                        "message": "pgvector extension is not installed",
-                    }
 
         except SQLAlchemyError as e:
             result["status"] = "unhealthy"
@@ -117,35 +245,45 @@ class DatabaseHealthChecker:
 
         return result
 
-    async def check_pool_status(self) -> dict[str, Any]:
+    async def check_pool_status(self, timestamp: str | None = None) -> dict[str, Any]:
         """Check connection pool status.
 
+        Args:
+            timestamp: Precomputed ISO timestamp; the current time if omitted
+
         Returns:
             Dict containing pool status information
         """
         result: dict[str, Any] = {
             "status": "healthy",
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": timestamp or datetime.now(UTC).isoformat(),
             "checks": {},
         }
 
         try:
             pool = self._database_engine.engine.pool
 
-            # Get pool statistics using getattr for safer access
-            pool_size = getattr(pool, "size", lambda: 0)()
-            checked_in = getattr(pool, "checkedin", lambda: 0)()
-            checked_out = getattr(pool, "checkedout", lambda: 0)()
-            overflow = getattr(pool, "overflow", lambda: 0)()
-
-            result["checks"]["connection_pool"] = {
-                "status": "healthy",
-                "pool_size": pool_size,
-                "checked_in": checked_in,
-                "checked_out": checked_out,
-                "overflow": overflow,
-                "total_connections": pool_size + overflow,
-            }
+            # Only queue pools (including the asyncio adapter) keep counters
+            if isinstance(pool, QueuePool):
+                pool_size = pool.size()
+                overflow = pool.overflow()
+                result["checks"]["connection_pool"] = {
+                    "status": "healthy",
+                    "pool_size": pool_size,
+                    "checked_in": pool.checkedin(),
+                    "checked_out": pool.checkedout(),
+                    "overflow": overflow,
+                    "total_connections": pool_size + overflow,
+                }
+            else:
+                result["checks"]["connection_pool"] = {
+                    "status": "healthy",
+                    "pool_size": "n/a",
+                    "checked_in": "n/a",
+                    "checked_out": "n/a",
+                    "overflow": "n/a",
+                    "total_connections": "n/a",
+                }
 
         except Exception as e:
             result["status"] = "unhealthy"
@@ -162,26 +300,39 @@ class DatabaseHealthChecker:
         Returns:
             Dict containing comprehensive health check results
         """
-        # Run all health checks
-        connectivity_check = await self.check_basic_connectivity()
-        pgvector_check = await self.check_pgvector_extension()
-        pool_check = await self.check_pool_status()
+        # One timestamp for the combined result and its sub-checks
+        timestamp = datetime.now(UTC).isoformat()
+
+        # Database checks share one autocommit connection: one pool checkout,
+        # no BEGIN/COMMIT
+        try:
+            async with self._database_engine.get_readonly_connection() as connection:
+                db_checks = await self._run_all_db_checks(connection)
+        except SQLAlchemyError as e:
+            db_checks = {
+                "connectivity": {
+                    "status": "unhealthy",
+                    "message": f"Database connection failed: {str(e)}",
+                }
+            }
+        except Exception as e:
+            db_checks = {
+                "connectivity": {
+                    "status": "unhealthy",
+                    "message": f"Unexpected error: {str(e)}",
+                }
+            }
+
+        pool_check = await self.check_pool_status(timestamp)
+        checks = {**db_checks, **pool_check["checks"]}
 
         # Combine results
         overall_status = "healthy"
-        if (
-            connectivity_check["status"] != "healthy"
-            or pgvector_check["status"] != "healthy"
-            or pool_check["status"] != "healthy"
-        ):
+        if any(check["status"] != "healthy" for check in checks.values()):
             overall_status = "unhealthy"
 
         return {
             "status": overall_status,
-            "timestamp": datetime.now(UTC).isoformat(),
-            "checks": {
-                **connectivity_check["checks"],
-                **pgvector_check["checks"],
-                **pool_check["checks"],
-            },
+            "timestamp": timestamp,
+            "checks": checks,
         }
@@ -1,20 +1,52 @@
-"""Database models with pgvector support."""
+"""Database models with pgvector support.
+
+The ``@validates`` hooks run on ORM attribute assignment only; rows loaded
+from the database and Core ``insert()`` executemany paths (see
+``Repository.bulk_insert`` and ``mindbridge.database.bulk``) skip them, so
+bulk callers are responsible for passing valid data.
+"""
 
 import enum
 import re
-from datetime import datetime
-from typing import Any
-
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import JSON, DateTime, Enum, ForeignKey, Index, String, Text, func
-from sqlalchemy.ext.asyncio import AsyncAttrs
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import numpy.typing as npt
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+    PrimaryKeyConstraint,
+    String,
+    Text,
+    func,
+    insert,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncAttrs, AsyncSession
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
     mapped_column,
+    raiseload,
     relationship,
+    selectinload,
     validates,
 )
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from .types import HalfVec, SmallIntEnum
+
+if TYPE_CHECKING:
+    from asyncpg import Connection
+
+# Compiled once; the URL validator runs for every repository insert/update
+_URL_RE = re.compile(r"^https?://[^\s/$.?#].[^\s]*$", re.ASCII)
 
 
 class RepositoryStatus(enum.Enum):
@@ -47,6 +79,66 @@ class JobType(enum.Enum):
     CLEANUP = "cleanup"
 
 
+# Stable SMALLINT codes stored in the database; never renumber existing members
+REPOSITORY_STATUS_CODES: dict[RepositoryStatus, int] = {
+    RepositoryStatus.PENDING: 0,
+    RepositoryStatus.CLONING: 1,
+    RepositoryStatus.PROCESSING: 2,
+    RepositoryStatus.COMPLETED: 3,
+    RepositoryStatus.FAILED: 4,
+}
+
+JOB_STATUS_CODES: dict[JobStatus, int] = {
+    JobStatus.PENDING: 0,
+    JobStatus.RUNNING: 1,
+    JobStatus.COMPLETED: 2,
+    JobStatus.FAILED: 3,
+    JobStatus.CANCELLED: 4,
+}
+
+JOB_TYPE_CODES: dict[JobType, int] = {
+    JobType.CLONE: 0,
+    JobType.ANALYSIS: 1,
+    JobType.EMBEDDING: 2,
+    JobType.INDEXING: 3,
+    JobType.CLEANUP: 4,
+}
+
+# Value lookups for the validators: a plain dict get instead of Enum.__call__
+_REPOSITORY_STATUS_BY_VALUE = {status.value: status for status in RepositoryStatus}
+_JOB_STATUS_BY_VALUE = {status.value: status for status in JobStatus}
+_JOB_TYPE_BY_VALUE = {job_type.value: job_type for job_type in JobType}
+
+# Rows per transaction for INSERT-based ingest; gains plateau past 10k
+DEFAULT_INSERT_BATCH_SIZE = 10_000
+
+
+# Set by skip_embedding_validation() for callers that validated embeddings
+# upstream (e.g. a whole NumPy batch at once)
+_SKIP_EMBEDDING_VALIDATION: ContextVar[bool] = ContextVar(
+    "skip_embedding_validation", default=False
+)
+
+
+@contextmanager
+def skip_embedding_validation() -> Iterator[None]:
+    """Skip VectorDocument embedding validation within this context.
+
+    Yields:
+        None
+    """
+    token = _SKIP_EMBEDDING_VALIDATION.set(True)
+    try:
+        yield
+    finally:
+        _SKIP_EMBEDDING_VALIDATION.reset(token)
+
+
+def _utc_now() -> datetime:
+    """Return the current UTC time for client-side timestamp defaults."""
+    return datetime.now(UTC)
+
+
 class Base(AsyncAttrs, DeclarativeBase):
     """Base class for all database models."""
 
@@ -57,31 +149,65 @@ class VectorDocument(Base):
     """Vector document model for storing embeddings and metadata."""
 
     __tablename__ = "vector_documents"
+    # Hash-partitioned by repository so each partition gets a smaller HNSW
+    # graph; the partition key has to be part of the primary key
+    __table_args__ = (
+        PrimaryKeyConstraint("repository_id", "id"),
+        Index("ix_vector_documents_document_id", "document_id"),
+        # Repository + type pre-filter for vector search, newest first
+        Index(
+            "ix_vector_documents_repo_type_created",
+            "repository_id",
+            "document_type",
+            text("created_at DESC"),
+        ),
+        # ANN index for cosine-distance search; parameters mirror the migration
+        Index(
+            "ix_vector_documents_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 24, "ef_construction": 128},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        ),
+        Index(
+            "ix_vector_documents_created_at",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        {"postgresql_partition_by": "HASH (repository_id)"},
+    )
 
-    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(autoincrement=True)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     title: Mapped[str | None] = mapped_column(String(500), nullable=True)
     source_url: Mapped[str | None] = mapped_column(String(2000), nullable=True)
 
-    # Vector embedding with 1536 dimensions (OpenAI ada-002 default)
-    embedding: Mapped[list[float]] = mapped_column(Vector(1536), nullable=False)
+    # Vector embedding with 1536 dimensions (OpenAI ada-002 default), stored
+    # as FP16; bind values are formatted with orjson (see HalfVec)
+    embedding: Mapped[np.ndarray] = mapped_column(HalfVec(1536), nullable=False)
 
     # Metadata fields
     document_type: Mapped[str | None] = mapped_column(String(100), nullable=True)
-    repository_id: Mapped[int | None] = mapped_column(
-        ForeignKey("repositories.id"), nullable=True
+    repository_id: Mapped[int] = mapped_column(
+        ForeignKey("repositories.id"), nullable=False
     )
     document_id: Mapped[int | None] = mapped_column(
         ForeignKey("documents.id"), nullable=True
     )
     file_path: Mapped[str | None] = mapped_column(String(1000), nullable=True)
 
-    # Timestamps
+    # Timestamps: filled in client-side on ORM inserts so bulk inserts carry
+    # them as plain parameters; the server defaults still cover COPY and raw SQL
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True),
+        default=_utc_now,
+        server_default=func.now(),
+        nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=_utc_now,
         server_default=func.now(),
         onupdate=func.now(),
         nullable=False,
@@ -91,46 +217,120 @@ class VectorDocument(Base):
     repository: Mapped["Repository"] = relationship("Repository")
     document: Mapped["Document"] = relationship("Document")
 
+    @classmethod
+    async def bulk_insert(
+        cls,
+        session: AsyncSession,
+        rows: Iterable[Mapping[str, Any]],
+        *,
+        batch_size: int = DEFAULT_INSERT_BATCH_SIZE,
+        on_conflict_do_nothing: bool = False,
+    ) -> int:
+        """Insert vector documents in batches, committing per batch.
+
+        See ``mindbridge.database.bulk.bulk_insert_vector_documents``.
+
+        Args:
+            session: Database session
+            rows: Vector document values keyed by column name
+            batch_size: Maximum rows per INSERT and transaction
+            on_conflict_do_nothing: Skip rows that conflict with existing ones
+
+        Returns:
+            Number of rows inserted, excluding skipped conflicting rows
+        """
+        from .bulk import bulk_insert_vector_documents
+
+        return await bulk_insert_vector_documents(
+            session,
+            rows,
+            batch_size=batch_size,
+            on_conflict_do_nothing=on_conflict_do_nothing,
+        )
+
+    @classmethod
+    async def bulk_copy(
+        cls, conn: "Connection", rows: Iterable[Mapping[str, Any]]
+    ) -> int:
+        """Load vector documents with binary COPY for append-only ingest.
+
+        See ``mindbridge.database.bulk.bulk_copy_vector_documents``.
+
+        Args:
+            conn: Raw asyncpg connection
+            rows: Vector document values keyed by column name
+
+        Returns:
+            Number of rows copied
+        """
+        from .bulk import bulk_copy_vector_documents
+
+        return await bulk_copy_vector_documents(conn, rows)
+
     @validates("embedding")  # type: ignore[misc]
-    def _validate_embedding(self, key: str, value: Any) -> list[float]:
+    def _validate_embedding(
+        self, key: str, value: Any
+    ) -> npt.NDArray[np.float16] | Sequence[float]:
         """Validate embedding field.
 
         Args:
             key: Field name
-            value: Embedding vector value
+            value: Embedding vector as a list, array.array or NumPy array
 
         Returns:
-            Validated embedding vector
+            Validated embedding as a float16 NumPy array, or the value as given
+            when validation is skipped
 
         Raises:
             ValueError: If embedding is invalid
         """
-        if not isinstance(value, list):
+        if not __debug__ or _SKIP_EMBEDDING_VALIDATION.get():
+            # Optimized runs (python -O) and callers that validated upstream
+            # leave shape checks to the halfvec(1536) column type and the
+            # check_embedding_dimensions constraint, vector_dims(embedding) = 1536
+            unchecked: Sequence[float] = value
+            return unchecked
+
+        try:
+            arr = np.asarray(value)
+        except ValueError as e:
+            raise ValueError("Embedding must be a list of floats") from e
+        if arr.ndim != 1:
             raise ValueError("Embedding must be a list of floats")
-        if len(value) != 1536:
+        if arr.shape[0] != 1536:
             raise ValueError(
-                f"Embedding must be exactly 1536 dimensions, got {len(value)}"
+                f"Embedding must be exactly 1536 dimensions, got {arr.shape[0]}"
             )
-        if not all(isinstance(x, int | float) for x in value):
+        if arr.dtype.kind not in "biuf":
             raise ValueError("All embedding values must be numbers")
-        return value
+        # Narrow to the column's FP16 storage here so values outside the
+        # halfvec range (|x| > 65504) overflow to inf and are rejected early
+        with np.errstate(over="ignore"):
+            halfvec: npt.NDArray[np.float16] = arr.astype(np.float16, copy=False)
+        if not np.isfinite(halfvec).all():
+            raise ValueError("All embedding values must be finite halfvec values")
+        # pgvector binds NumPy arrays directly, so no list round-trip is needed
+        return halfvec
 
     def __repr__(self) -> str:
         """String representation of VectorDocument."""
         return f"<VectorDocument(id={self.id}, title='{self.title}')>"
 
 
-# Create indexes for VectorDocument
-Index("ix_vector_documents_repository_id", VectorDocument.repository_id)
-Index("ix_vector_documents_document_id", VectorDocument.document_id)
-Index("ix_vector_documents_document_type", VectorDocument.document_type)
-Index("ix_vector_documents_created_at", VectorDocument.created_at)
-
-
 class Repository(Base):
     """Repository model for storing GitHub repository information."""
 
     __tablename__ = "repositories"
+    __table_args__ = (
+        Index("ix_repositories_name", "name"),
+        Index("ix_repositories_url", "url"),
+        Index(
+            "ix_repositories_created_at",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -138,7 +338,9 @@ class Repository(Base):
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     branch: Mapped[str] = mapped_column(String(100), nullable=False, default="main")
     status: Mapped[RepositoryStatus] = mapped_column(
-        Enum(RepositoryStatus), nullable=False, default=RepositoryStatus.PENDING
+        SmallIntEnum(RepositoryStatus, REPOSITORY_STATUS_CODES),
+        nullable=False,
+        default=RepositoryStatus.PENDING,
     )
 
     # Timestamps
@@ -166,6 +368,53 @@ class Repository(Base):
         passive_deletes=True,
     )
 
+    @classmethod
+    def loader_options(cls) -> list[LoaderOption]:
+        """Loader options for reading repositories with documents and jobs.
+
+        Documents and jobs are fetched with one ``IN (...)`` query each
+        instead of one query per repository. Any other lazy load raises,
+        including the potentially large ``Document.vector_documents``.
+
+        Returns:
+            Options for ``select(Repository).options(...)``
+        """
+        return [
+            selectinload(cls.documents).raiseload(Document.vector_documents),
+            selectinload(cls.jobs),
+            raiseload("*"),
+        ]
+
+    @classmethod
+    def summary_options(cls) -> list[LoaderOption]:
+        """Loader options for reading repositories without their relationships.
+
+        Returns:
+            Options that make any relationship access raise instead of lazy loading
+        """
+        return [raiseload("*")]
+
+    @classmethod
+    async def bulk_insert(
+        cls, session: AsyncSession, rows: Sequence[Mapping[str, Any]]
+    ) -> int:
+        """Insert repositories with one Core executemany.
+
+        Skips ORM instrumentation and the ``@validates`` hooks, so rows must
+        already be valid. The caller owns the transaction.
+
+        Args:
+            session: Database session
+            rows: Repository values keyed by column name
+
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        await session.execute(insert(cls), list(rows))
+        return len(rows)
+
     @validates("url")  # type: ignore[misc]
     def _validate_url(self, key: str, value: str) -> str:
         """Validate GitHub URL format.
@@ -184,8 +433,7 @@ class Repository(Base):
             raise ValueError("URL cannot be empty")
 
         # Basic URL format check
-        url_pattern = r"^https?://[^\s/$.?#].[^\s]*$"
-        if not re.match(url_pattern, value):
+        if not _URL_RE.match(value):
             raise ValueError("Invalid GitHub URL format")
 
         # GitHub-specific validation
@@ -211,13 +459,12 @@ class Repository(Base):
             ValueError: If status is invalid
         """
         if isinstance(value, str):
-            try:
-                return RepositoryStatus(value)
-            except ValueError as e:
-                valid_values = [status.value for status in RepositoryStatus]
+            member = _REPOSITORY_STATUS_BY_VALUE.get(value)
+            if member is None:
                 raise ValueError(
-                    f"Status must be one of: {', '.join(valid_values)}"
-                ) from e
+                    f"Status must be one of: {', '.join(_REPOSITORY_STATUS_BY_VALUE)}"
+                )
+            return member
         return value
 
     def __repr__(self) -> str:
@@ -225,17 +472,20 @@ class Repository(Base):
         return f"<Repository(id={self.id}, name='{self.name}')>"
 
 
-# Create indexes for Repository
-Index("ix_repositories_name", Repository.name)
-Index("ix_repositories_url", Repository.url)
-Index("ix_repositories_status", Repository.status)
-Index("ix_repositories_created_at", Repository.created_at)
-
-
 class Document(Base):
     """Document model for storing parsed files from repositories."""
 
     __tablename__ = "documents"
+    __table_args__ = (
+        Index("ix_documents_repository_id", "repository_id"),
+        Index("ix_documents_file_type", "file_type"),
+        Index(
+            "ix_documents_created_at",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -292,25 +542,41 @@ class Document(Base):
         return f"<Document(id={self.id}, title='{self.title}')>"
 
 
-# Create indexes for Document
-Index("ix_documents_repository_id", Document.repository_id)
-Index("ix_documents_title", Document.title)
-Index("ix_documents_file_type", Document.file_type)
-Index("ix_documents_created_at", Document.created_at)
-
-
 class Job(Base):
     """Job model for tracking async processing tasks."""
 
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_repository_id", "repository_id"),
+        Index(
+            "ix_jobs_created_at",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index("ix_jobs_started_at", "started_at"),
+        Index("ix_jobs_completed_at", "completed_at"),
+        # Containment lookups on job parameters (params @> '{"...": ...}')
+        Index(
+            "ix_jobs_params_gin",
+            "params",
+            postgresql_using="gin",
+            postgresql_ops={"params": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    job_type: Mapped[JobType] = mapped_column(Enum(JobType), nullable=False)
+    job_type: Mapped[JobType] = mapped_column(
+        SmallIntEnum(JobType, JOB_TYPE_CODES), nullable=False
+    )
     status: Mapped[JobStatus] = mapped_column(
-        Enum(JobStatus), nullable=False, default=JobStatus.PENDING
+        SmallIntEnum(JobStatus, JOB_STATUS_CODES),
+        nullable=False,
+        default=JobStatus.PENDING,
     )
-    params: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
-    result: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    # Encoded with the engine's orjson serializer
+    params: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+    result: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Foreign key
@@ -353,13 +619,12 @@ class Job(Base):
             ValueError: If status is invalid
         """
         if isinstance(value, str):
-            try:
-                return JobStatus(value)
-            except ValueError as e:
-                valid_values = [status.value for status in JobStatus]
+            member = _JOB_STATUS_BY_VALUE.get(value)
+            if member is None:
                 raise ValueError(
-                    f"Status must be one of: {', '.join(valid_values)}"
-                ) from e
+                    f"Status must be one of: {', '.join(_JOB_STATUS_BY_VALUE)}"
+                )
+            return member
         return value
 
     @validates("job_type")  # type: ignore[misc]
@@ -377,26 +642,18 @@ class Job(Base):
             ValueError: If job type is invalid
         """
         if isinstance(value, str):
-            try:
-                return JobType(value)
-            except ValueError as e:
-                valid_values = [job_type.value for job_type in JobType]
+            member = _JOB_TYPE_BY_VALUE.get(value)
+            if member is None:
                 raise ValueError(
-                    f"Job type must be one of: {', '.join(valid_values)}"
-                ) from e
+                    f"Job type must be one of: {', '.join(_JOB_TYPE_BY_VALUE)}"
+                )
+            return member
         return value
 
     def __repr__(self) -> str:
         """String representation of Job."""
-        job_type_value = self.job_type.value if self.job_type else None
-        status_value = self.status.value if self.status else None
+        # Read each instrumented attribute once
+        job_type, status = self.job_type, self.status
+        job_type_value = job_type.value if job_type else None
+        status_value = status.value if status else None
         return f"<Job(id={self.id}, type='{job_type_value}', status='{status_value}')>"
-
-
-# Create indexes for Job
-Index("ix_jobs_repository_id", Job.repository_id)
-Index("ix_jobs_job_type", Job.job_type)
-Index("ix_jobs_status", Job.status)
-Index("ix_jobs_created_at", Job.created_at)
-Index("ix_jobs_started_at", Job.started_at)
-Index("ix_jobs_completed_at", Job.completed_at)
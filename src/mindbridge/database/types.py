@@ -0,0 +1,126 @@
+"""Custom SQLAlchemy column types."""
+
+import enum
+from collections.abc import Callable, Mapping
+from typing import Any
+
+import numpy as np
+import orjson
+from pgvector.sqlalchemy import HALFVEC
+from pgvector.utils import HalfVector
+from sqlalchemy import Dialect, SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class SmallIntEnum(TypeDecorator[enum.Enum]):
+    """Store Python enum members as stable SMALLINT codes."""
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[enum.Enum], codes: Mapping[Any, int]) -> None:
+        """Initialize the enum column type.
+
+        Args:
+            enum_class: Enum class stored in the column
+            codes: Stable database code for every enum member
+
+        Raises:
+            ValueError: If codes do not cover every member exactly once
+        """
+        super().__init__()
+        if set(codes) != set(enum_class) or len(set(codes.values())) != len(codes):
+            raise ValueError(
+                f"Codes must map every {enum_class.__name__} member to a unique int"
+            )
+        self.enum_class = enum_class
+        self._codes = dict(codes)
+        self._members = {code: member for member, code in codes.items()}
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> int | None:
+        """Convert an enum member (or its value) to its database code."""
+        if value is None:
+            return None
+        code: int = self._codes[self.enum_class(value)]
+        return code
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> enum.Enum | None:
+        """Convert a database code back to its enum member."""
+        if value is None:
+            return None
+        member: enum.Enum = self._members[value]
+        return member
+
+
+def halfvec_to_text(value: Any, dim: int | None = None) -> str:
+    """Format a vector in pgvector's text input form using orjson.
+
+    Args:
+        value: Vector as a sequence, NumPy array or HalfVector
+        dim: Expected number of dimensions, if fixed
+
+    Returns:
+        Text literal such as ``[0.5,1.0]``
+
+    Raises:
+        ValueError: If the vector is not one-dimensional or has the wrong size
+    """
+    if isinstance(value, HalfVector):
+        value = value.to_numpy()
+    # orjson needs a native-endian, C-contiguous array
+    arr = np.ascontiguousarray(value, dtype=np.float16)
+    if arr.ndim != 1:
+        raise ValueError("expected ndim to be 1")
+    if dim is not None and arr.shape[0] != dim:
+        raise ValueError(f"expected {dim} dimensions, not {arr.shape[0]}")
+    return orjson.dumps(arr, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+def halfvec_from_db(value: Any) -> np.ndarray | None:
+    """Convert a halfvec result value to a native-endian float16 array.
+
+    Args:
+        value: Text or binary halfvec from the driver, or a HalfVector
+
+    Returns:
+        One-dimensional float16 array, or None for NULL
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        # NumPy parses the element strings in C
+        return np.array(value[1:-1].split(","), dtype=np.float16)
+    if isinstance(value, bytes):
+        value = HalfVector.from_binary(value)
+    if isinstance(value, HalfVector):
+        value = value.to_numpy()
+    return np.asarray(value, dtype=np.float16)
+
+
+class HalfVec(HALFVEC):
+    """pgvector HALFVEC column that keeps embeddings as float16 arrays.
+
+    Bind values are formatted in C via orjson; pgvector's own bind processor
+    builds the text form with a Python-level ``str(float(v))`` loop over every
+    element. Results load as NumPy float16 arrays matching the stored FP16
+    values, instead of HalfVector objects.
+    """
+
+    cache_ok = True
+
+    def bind_processor(self, dialect: Dialect) -> Callable[[Any], str | None]:
+        """Return a processor converting vectors to pgvector text input."""
+        dim = self.dim
+
+        def process(value: Any) -> str | None:
+            if value is None:
+                return None
+            return halfvec_to_text(value, dim)
+
+        return process
+
+    def result_processor(
+        self, dialect: Dialect, coltype: Any
+    ) -> Callable[[Any], np.ndarray | None]:
+        """Return a processor converting halfvec results to float16 arrays."""
+        return halfvec_from_db
@@ -0,0 +1,140 @@
+"""HNSW index tuning helpers for pgvector embeddings."""
+
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+
+@dataclass(frozen=True)
+class HNSWParams:
+    """HNSW index build parameters."""
+
+    m: int
+    ef_construction: int
+
+
+# Tiers are (exclusive upper bound on vector count, parameters)
+_HNSW_TIERS: tuple[tuple[int, HNSWParams], ...] = (
+    (100_000, HNSWParams(m=16, ef_construction=64)),
+    (1_000_000, HNSWParams(m=24, ef_construction=128)),
+    (10_000_000, HNSWParams(m=32, ef_construction=200)),
+)
+_LARGEST_TIER_PARAMS = HNSWParams(m=48, ef_construction=256)
+
+
+def configure_hnsw_params(vector_count: int) -> HNSWParams:
+    """Pick HNSW build parameters for the expected corpus size.
+
+    Args:
+        vector_count: Expected number of vectors in the index
+
+    Returns:
+        HNSWParams suited to the corpus size
+
+    Raises:
+        ValueError: If vector count is negative
+    """
+    if vector_count < 0:
+        raise ValueError("Vector count must be >= 0")
+
+    for upper_bound, params in _HNSW_TIERS:
+        if vector_count < upper_bound:
+            return params
+
+    return _LARGEST_TIER_PARAMS
+
+
+# Tiers are (exclusive upper bound on vector count, ef_search)
+_EF_SEARCH_TIERS: tuple[tuple[int, int], ...] = (
+    (100_000, 40),
+    (1_000_000, 100),
+)
+_LARGEST_TIER_EF_SEARCH = 200
+
+# Valid range for the hnsw.ef_search setting in pgvector
+MIN_EF_SEARCH = 1
+MAX_EF_SEARCH = 1000
+
+
+def configure_ef_search(vector_count: int) -> int:
+    """Pick the HNSW ef_search query setting for the expected corpus size.
+
+    Args:
+        vector_count: Expected number of vectors in the index
+
+    Returns:
+        ef_search value suited to the corpus size
+
+    Raises:
+        ValueError: If vector count is negative
+    """
+    if vector_count < 0:
+        raise ValueError("Vector count must be >= 0")
+
+    for upper_bound, ef_search in _EF_SEARCH_TIERS:
+        if vector_count < upper_bound:
+            return ef_search
+
+    return _LARGEST_TIER_EF_SEARCH
+
+
+# Name of the HNSW index on vector_documents.embedding (see migrations)
+ANN_INDEX_NAME = "ix_vector_documents_embedding_hnsw"
+
+# Build parameters used by the migrations
+DEFAULT_HNSW_PARAMS = HNSWParams(m=24, ef_construction=128)
+
+_DROP_ANN_INDEX_SQL = text(f"DROP INDEX IF EXISTS {ANN_INDEX_NAME}")
+_SET_MAINTENANCE_WORK_MEM_SQL = text(
+    "SELECT set_config('maintenance_work_mem', :maintenance_work_mem, true)"
+)
+
+
+async def drop_ann_index(connection: AsyncConnection | AsyncSession) -> None:
+    """Drop the HNSW index ahead of a large bulk load.
+
+    Inserting into an indexed table updates the graph row by row; loading
+    first and building once afterwards is much faster and gives better recall.
+
+    Args:
+        connection: Database connection or session to run the DDL on
+    """
+    await connection.execute(_DROP_ANN_INDEX_SQL)
+
+
+async def rebuild_ann_index(
+    connection: AsyncConnection | AsyncSession,
+    params: HNSWParams = DEFAULT_HNSW_PARAMS,
+    *,
+    maintenance_work_mem: str = "2GB",
+) -> None:
+    """Build the HNSW index after a bulk load.
+
+    Must run inside a transaction; maintenance_work_mem is raised only for it.
+
+    Args:
+        connection: Database connection or session to run the DDL on
+        params: HNSW build parameters, e.g. from configure_hnsw_params()
+        maintenance_work_mem: Memory for the build; the graph should fit in it
+
+    Raises:
+        ValueError: If the parameters are outside pgvector's accepted range
+    """
+    if not 2 <= params.m <= 100:
+        raise ValueError("m must be between 2 and 100")
+    if params.ef_construction < 2 * params.m:
+        raise ValueError("ef_construction must be >= 2 * m")
+
+    await connection.execute(
+        _SET_MAINTENANCE_WORK_MEM_SQL, {"maintenance_work_mem": maintenance_work_mem}
+    )
+    # Parameters are validated ints; DDL cannot take bind parameters
+    await connection.execute(
+        text(
+            f"CREATE INDEX IF NOT EXISTS {ANN_INDEX_NAME} ON vector_documents "
+            "USING hnsw (embedding halfvec_cosine_ops) "
+            f"WITH (m = {int(params.m)}, "
+            f"ef_construction = {int(params.ef_construction)})"
+        )
+    )
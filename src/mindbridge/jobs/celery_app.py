@@ -2,15 +2,32 @@
 
 import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import redis.asyncio as aioredis
 from celery import Celery
 
 from mindbridge.jobs.celery_config import CeleryConfig, get_celery_config
 from mindbridge.jobs.exceptions import BrokerConfigurationError, BrokerConnectionError
+from mindbridge.jobs.serialization import (
+    register_msgpack_serializer,
+    register_orjson_serializer,
+)
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on how long a broadcast inspect RPC waits for worker replies
+INSPECT_TIMEOUT_SECONDS = 1.0
+
+# Queue that receives tasks without an explicit route
+DEFAULT_QUEUE_NAME = "celery"
+
+# Blocking broker control calls run here rather than in the loop's default
+# executor, so monitoring bursts cannot take threads from other blocking work
+_BROKER_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="celery-ctrl")
+
 
 def create_celery_app(
     config: CeleryConfig,
@@ -33,13 +50,15 @@ def create_celery_app(
     if not isinstance(config, CeleryConfig):
         raise TypeError("config must be CeleryConfig instance")
 
+    # Packs NumPy arrays as raw buffers; replaces kombu's stock msgpack codec
+    register_msgpack_serializer()
+    register_orjson_serializer()
+
     # Create Celery app
     app = Celery(app_name)
 
     # Configure from settings dictionary
-    settings = config.get_celery_settings()
-    settings_obj = type("CelerySettings", (), settings)()
-    app.config_from_object(settings_obj)
+    app.conf.update(config.get_celery_settings())
 
     # Auto-discover tasks if enabled
     if autodiscover_tasks:
@@ -77,20 +96,51 @@ def get_celery_app() -> Celery:
     return _celery_app
 
 
-async def check_broker_connection(config: CeleryConfig) -> bool:
+# Apps built for explicit configs by the monitoring helpers, keyed by config
+# identity. The config is stored alongside so its id cannot be reused while
+# the entry exists.
+_MAX_CONFIG_APPS = 4
+_config_apps: dict[int, tuple[CeleryConfig, Celery]] = {}
+
+
+def _get_app(config: CeleryConfig | None) -> Celery:
+    """Get a Celery app for monitoring, creating it at most once per config.
+
+    Args:
+        config: Celery configuration, or None for the global app
+
+    Returns:
+        Celery application instance
+    """
+    if config is None:
+        return get_celery_app()
+
+    cached = _config_apps.get(id(config))
+    if cached is not None and cached[0] is config:
+        return cached[1]
+
+    app = create_celery_app(config)
+    if len(_config_apps) >= _MAX_CONFIG_APPS:
+        # Evict the oldest entry
+        del _config_apps[next(iter(_config_apps))]
+    _config_apps[id(config)] = (config, app)
+    return app
+
+
+async def check_broker_connection(config: CeleryConfig | None = None) -> bool:
     """Check if broker connection is working.
 
     Args:
-        config: Celery configuration
+        config: Celery configuration; the global app is used if omitted
 
     Returns:
         True if connection is working, False otherwise
     """
     try:
-        app = create_celery_app(config)
+        app = _get_app(config)
 
-        # Run in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
+        # Run in the broker thread pool to avoid blocking
+        loop = asyncio.get_running_loop()
 
         def _ping_broker() -> bool:
             try:
@@ -101,7 +151,7 @@ async def check_broker_connection(config: CeleryConfig) -> bool:
                 logger.warning("Broker ping failed: %s", str(e))
                 return False
 
-        result = await loop.run_in_executor(None, _ping_broker)
+        result = await loop.run_in_executor(_BROKER_EXECUTOR, _ping_broker)
         return result
 
     except Exception as e:
@@ -109,17 +159,17 @@ async def check_broker_connection(config: CeleryConfig) -> bool:
         return False
 
 
-def get_broker_health(config: CeleryConfig) -> dict[str, Any]:
+def get_broker_health(config: CeleryConfig | None = None) -> dict[str, Any]:
     """Get broker health information.
 
     Args:
-        config: Celery configuration
+        config: Celery configuration; the global app is used if omitted
 
     Returns:
         Dictionary containing health information
     """
     try:
-        app = create_celery_app(config)
+        app = _get_app(config)
         inspect = app.control.inspect()
 
         # Get worker stats
@@ -146,24 +196,30 @@ def get_broker_health(config: CeleryConfig) -> dict[str, Any]:
         }
 
 
-def get_broker_stats(config: CeleryConfig) -> dict[str, Any]:
+async def get_broker_stats(config: CeleryConfig | None = None) -> dict[str, Any]:
     """Get detailed broker statistics.
 
+    The inspect RPCs are independent, so they run concurrently in the broker
+    thread pool and the call takes as long as the slowest one.
+
     Args:
-        config: Celery configuration
+        config: Celery configuration; the global app is used if omitted
 
     Returns:
         Dictionary containing broker statistics
     """
     try:
-        app = create_celery_app(config)
-        inspect = app.control.inspect()
+        app = _get_app(config)
+        inspect = app.control.inspect(timeout=INSPECT_TIMEOUT_SECONDS)
 
         # Get various statistics
-        stats = inspect.stats()
-        active_tasks = inspect.active()
-        scheduled_tasks = inspect.scheduled()
-        reserved_tasks = inspect.reserved()
+        loop = asyncio.get_running_loop()
+        stats, active_tasks, scheduled_tasks, reserved_tasks = await asyncio.gather(
+            loop.run_in_executor(_BROKER_EXECUTOR, inspect.stats),
+            loop.run_in_executor(_BROKER_EXECUTOR, inspect.active),
+            loop.run_in_executor(_BROKER_EXECUTOR, inspect.scheduled),
+            loop.run_in_executor(_BROKER_EXECUTOR, inspect.reserved),
+        )
 
         return {
             "stats": stats or {},
@@ -184,33 +240,110 @@ def get_broker_stats(config: CeleryConfig) -> dict[str, Any]:
         }
 
 
-def get_queue_lengths(_config: CeleryConfig) -> dict[str, int]:
-    """Get queue lengths for monitoring.
+def get_broker_stats_sync(config: CeleryConfig | None = None) -> dict[str, Any]:
+    """Get detailed broker statistics from synchronous code.
+
+    Args:
+        config: Celery configuration; the global app is used if omitted
+
+    Returns:
+        Dictionary containing broker statistics
+    """
+    return asyncio.run(get_broker_stats(config))
+
+
+# Redis client for reading queue depths, with the broker URL and event loop it
+# was created for; its pooled connections cannot be used from another loop.
+# The lock keeps threads that race on first use from building a second client
+_broker_client: tuple[str, asyncio.AbstractEventLoop, aioredis.Redis] | None = None
+_broker_client_lock = threading.Lock()
+
+
+def _get_broker_client(broker_url: str) -> aioredis.Redis:
+    """Get the shared Redis client for the broker.
+
+    A new client replaces the shared one when the broker URL or the running
+    event loop changes.
+
+    Args:
+        broker_url: Redis broker URL
+
+    Returns:
+        Redis client with its own connection pool
+    """
+    global _broker_client
+
+    loop = asyncio.get_running_loop()
+    with _broker_client_lock:
+        if (
+            _broker_client is None
+            or _broker_client[0] != broker_url
+            or _broker_client[1] is not loop
+        ):
+            _broker_client = (broker_url, loop, aioredis.Redis.from_url(broker_url))
+        return _broker_client[2]
+
+
+async def close_broker_client() -> None:
+    """Close the shared broker Redis client and its connection pool."""
+    global _broker_client
+    with _broker_client_lock:
+        cached, _broker_client = _broker_client, None
+    if cached is not None:
+        await cached[2].aclose()
+
+
+def _queue_names(config: CeleryConfig) -> list[str]:
+    """Collect the queue names used by the configured task routes.
 
     Args:
         config: Celery configuration
 
+    Returns:
+        Unique queue names, starting with the default queue
+    """
+    queues = [DEFAULT_QUEUE_NAME]
+    queues.extend(
+        route["queue"] for route in config.task_routes.values() if "queue" in route
+    )
+    return list(dict.fromkeys(queues))
+
+
+async def get_queue_lengths(config: CeleryConfig | None = None) -> dict[str, int]:
+    """Get queue lengths for monitoring.
+
+    The Redis broker keeps each queue as a list, so one pipelined round trip
+    of LLEN commands reads every queue depth.
+
+    Args:
+        config: Celery configuration; loaded from the environment if omitted
+
     Returns:
         Dictionary mapping queue names to their lengths
     """
     try:
-        # This would require additional Redis connection to check queue lengths
-        # For now, return empty dict as this would need direct Redis access
-        logger.debug(
-            "Queue length monitoring not yet implemented - requires Redis connection"
-        )
-        return {}
+        if config is None:
+            config = get_celery_config()
+
+        queues = _queue_names(config)
+        client = _get_broker_client(config.broker_config.broker_url)
+        async with client.pipeline(transaction=False) as pipe:
+            for queue in queues:
+                pipe.llen(queue)
+            lengths = await pipe.execute()
+
+        return dict(zip(queues, lengths, strict=True))
 
     except Exception as e:
         logger.error("Failed to get queue lengths: %s", str(e))
         return {}
 
 
-async def purge_queue(config: CeleryConfig, queue_name: str) -> int:
+async def purge_queue(config: CeleryConfig | None, queue_name: str) -> int:
     """Purge messages from a specific queue.
 
     Args:
-        config: Celery configuration
+        config: Celery configuration, or None for the global app
         queue_name: Name of queue to purge
 
     Returns:
@@ -220,10 +353,10 @@ async def purge_queue(config: CeleryConfig, queue_name: str) -> int:
         BrokerConnectionError: If operation fails
     """
     try:
-        app = create_celery_app(config)
+        app = _get_app(config)
 
-        # Run in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
+        # Run in the broker thread pool to avoid blocking
+        loop = asyncio.get_running_loop()
 
         def _purge_queue() -> int:
             try:
@@ -237,7 +370,7 @@ async def purge_queue(config: CeleryConfig, queue_name: str) -> int:
             except Exception as e:
                 raise BrokerConnectionError(f"Failed to purge queue: {e}", e) from e
 
-        result = await loop.run_in_executor(None, _purge_queue)
+        result = await loop.run_in_executor(_BROKER_EXECUTOR, _purge_queue)
         return result or 0
 
     except Exception as e:
@@ -246,11 +379,13 @@ async def purge_queue(config: CeleryConfig, queue_name: str) -> int:
         ) from e
 
 
-async def shutdown_workers(config: CeleryConfig, _signal: str = "TERM") -> bool:
+async def shutdown_workers(
+    config: CeleryConfig | None = None, _signal: str = "TERM"
+) -> bool:
     """Shutdown Celery workers.
 
     Args:
-        config: Celery configuration
+        config: Celery configuration; the global app is used if omitted
         signal: Signal to send to workers (TERM, KILL, etc.)
 
     Returns:
@@ -260,10 +395,10 @@ async def shutdown_workers(config: CeleryConfig, _signal: str = "TERM") -> bool:
         BrokerConnectionError: If operation fails
     """
     try:
-        app = create_celery_app(config)
+        app = _get_app(config)
 
-        # Run in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
+        # Run in the broker thread pool to avoid blocking
+        loop = asyncio.get_running_loop()
 
         def _shutdown_workers() -> bool:
             try:
@@ -274,7 +409,7 @@ async def shutdown_workers(config: CeleryConfig, _signal: str = "TERM") -> bool:
                     f"Failed to shutdown workers: {e}", e
                 ) from e
 
-        result = await loop.run_in_executor(None, _shutdown_workers)
+        result = await loop.run_in_executor(_BROKER_EXECUTOR, _shutdown_workers)
         return result
 
     except Exception as e:
@@ -282,6 +417,15 @@ async def shutdown_workers(config: CeleryConfig, _signal: str = "TERM") -> bool:
 
 
 def reset_celery_app() -> None:
-    """Reset the global Celery app instance."""
-    global _celery_app
+    """Reset the global Celery app, the per-config app cache and parsed config.
+
+    The configuration is parsed from the environment again on the next
+    get_celery_app call. The shared broker client is dropped as well; call
+    close_broker_client first to close its connections.
+    """
+    global _broker_client, _celery_app
     _celery_app = None
+    with _broker_client_lock:
+        _broker_client = None
+    _config_apps.clear()
+    get_celery_config.cache_clear()
@@ -1,77 +1,61 @@
 """Job queue related exceptions."""
 
+from typing import ClassVar
+
 
 class JobError(Exception):
-    """Base exception for job operations."""
+    """Base exception for job operations.
+
+    Subclasses only override ``default_message``, which is used when no
+    message is given.
+    """
+
+    # BaseException creates its __dict__ lazily, so keeping cause in a slot
+    # spares one dict per instance
+    __slots__ = ("cause",)
+
+    default_message: ClassVar[str] = "Job error"
 
-    def __init__(self, message: str, cause: Exception | None = None) -> None:
+    def __init__(
+        self, message: str | None = None, cause: Exception | None = None
+    ) -> None:
         """Initialize job error.
 
         Args:
-            message: Error message
+            message: Error message; defaults to the class's ``default_message``
             cause: Original exception that caused this error
         """
-        super().__init__(message)
+        super().__init__(self.default_message if message is None else message)
         self.cause = cause
 
 
 class BrokerConnectionError(JobError):
     """Exception raised when broker connection fails."""
 
-    def __init__(
-        self, message: str = "Broker connection error", cause: Exception | None = None
-    ) -> None:
-        """Initialize broker connection error.
+    __slots__ = ()
 
-        Args:
-            message: Error message
-            cause: Original exception that caused this error
-        """
-        super().__init__(message, cause)
+    default_message = "Broker connection error"
 
 
 class BrokerConfigurationError(JobError):
     """Exception raised when broker configuration is invalid."""
 
-    def __init__(
-        self,
-        message: str = "Broker configuration error",
-        cause: Exception | None = None,
-    ) -> None:
-        """Initialize broker configuration error.
+    __slots__ = ()
 
-        Args:
-            message: Error message
-            cause: Original exception that caused this error
-        """
-        super().__init__(message, cause)
+    default_message = "Broker configuration error"
 
 
 class TaskExecutionError(JobError):
     """Exception raised when task execution fails."""
 
-    def __init__(
-        self, message: str = "Task execution error", cause: Exception | None = None
-    ) -> None:
-        """Initialize task execution error.
+    __slots__ = ()
 
-        Args:
-            message: Error message
-            cause: Original exception that caused this error
-        """
-        super().__init__(message, cause)
+    default_message = "Task execution error"
 
 
 class TaskTimeoutError(JobError):
     """Exception raised when task execution times out."""
 
-    def __init__(
-        self, message: str = "Task execution timeout", cause: Exception | None = None
-    ) -> None:
-        """Initialize task timeout error.
+    __slots__ = ()
 
-        Args:
-            message: Error message
-            cause: Original exception that caused this error
-        """
-        super().__init__(message, cause)
+    default_message = "Task execution timeout"
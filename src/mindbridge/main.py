@@ -3,25 +3,61 @@
 import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from typing import Any
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 
 from mindbridge.__about__ import __description__, __title__, __version__
 from mindbridge.api.health import router as health_router
 from mindbridge.api.metrics import router as metrics_router
+from mindbridge.cache.redis_cache import close_redis_cache
 from mindbridge.observability.logging_config import configure_logging, get_logger
 from mindbridge.observability.tracing import configure_tracing
 
+# Lazy proxy: binds to the structlog configuration on first use and is then
+# cached, so handlers do not look the logger up per request
+logger = get_logger(__name__)
+
+# Probe and scrape endpoints are polled constantly and carry no useful traces;
+# patterns are matched against the request URL
+TRACING_EXCLUDED_URLS = "/health$,/ready$,/metrics$"
+
+# The root response never changes, so it is serialized once
+_ROOT_BODY = orjson.dumps(
+    {
+        "name": __title__,
+        "version": __version__,
+        "description": __description__,
+        "status": "running",
+    }
+)
+
+
+def _parse_csv(value: str) -> list[str]:
+    """Split a comma-separated environment value into trimmed entries.
+
+    Args:
+        value: Raw environment value
+
+    Returns:
+        Non-empty entries with surrounding whitespace removed
+    """
+    if "," not in value:
+        stripped = value.strip()
+        return [stripped] if stripped else []
+    return [part for part in (item.strip() for item in value.split(",")) if part]
+
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager for startup and shutdown events.
 
     Args:
-        _app: FastAPI application instance (unused).
+        app: FastAPI application instance.
 
     Yields:
         None during application runtime.
@@ -31,10 +67,21 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
         log_level=os.getenv("LOG_LEVEL", "INFO"),
         log_format=os.getenv("LOG_FORMAT", "console"),
     )
-    configure_tracing(service_name="mindbridge")
-
-    # Get logger after configuration
-    logger = get_logger(__name__)
+    tracer_provider = configure_tracing(service_name="mindbridge")
+
+    # Instrument once the provider exists so request spans are exported. The
+    # middleware stack was already built for the lifespan call, so drop it to
+    # have the next request rebuild it with the tracing middleware. This relies
+    # on Starlette building middleware_stack lazily when it is None (true for
+    # the versions FastAPI 0.115 allows, and the same attribute
+    # uninstrument_app reassigns); TestTracingInstrumentation pins it.
+    if tracer_provider is not None:
+        FastAPIInstrumentor.instrument_app(
+            app,
+            tracer_provider=tracer_provider,
+            excluded_urls=TRACING_EXCLUDED_URLS,
+        )
+        app.middleware_stack = None
 
     # Startup
     logger.info("Starting Mindbridge application")
@@ -44,6 +91,8 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     logger.info("Shutting down Mindbridge application")
+    FastAPIInstrumentor.uninstrument_app(app)
+    await close_redis_cache()
 
 
 # Create FastAPI application
@@ -52,23 +101,25 @@ app = FastAPI(
     description=__description__,
     version=__version__,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# Configure CORS
-origins = os.getenv("ALLOWED_ORIGINS")
+# Configure CORS; origins are parsed once, and a value with only separators
+# or whitespace counts as unset
+origins = tuple(_parse_csv(os.getenv("ALLOWED_ORIGINS", "")))
 if not origins:
     raise RuntimeError("ALLOWED_ORIGINS environment variable must be set for security")
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=origins.split(","),
+    allow_origins=origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Instrument with OpenTelemetry
-FastAPIInstrumentor.instrument_app(app)
+# Compress larger payloads such as the Prometheus exposition
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # Include routers
 app.include_router(health_router)
@@ -76,18 +127,10 @@ app.include_router(metrics_router)
 
 
 @app.get("/", tags=["root"])
-async def root() -> dict[str, Any]:
+async def root() -> Response:
     """Root endpoint providing API information.
 
     Returns:
         API information including name, version, and description.
     """
-    logger = get_logger(__name__)
-    logger.info("Root endpoint accessed")
-
-    return {
-        "name": __title__,
-        "version": __version__,
-        "description": __description__,
-        "status": "running",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
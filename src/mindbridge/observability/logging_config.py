@@ -1,52 +1,47 @@
 """Structured logging configuration using structlog."""
 
 import logging
+import os
 from typing import Any
 
+import orjson
 import structlog
 from opentelemetry import trace
 
+# (log level, format, contextvars merged) of the active configuration
+_configured: tuple[str, str, bool] | None = None
+
 
 def configure_logging(log_level: str = "INFO", log_format: str = "console") -> None:
     """Configure structured logging with OpenTelemetry correlation.
 
+    Context bound with ``structlog.contextvars`` is only merged into records
+    when MINDBRIDGE_USE_CONTEXTVARS is "1"; merging copies the whole context
+    on every log call, and nothing binds to it by default.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
         log_format: Output format ("json" or "console").
     """
+    global _configured
+
+    # Default to console format for invalid inputs
+    if log_format not in _PROCESSOR_CHAINS:
+        log_format = "console"
+
+    # Reconfiguring with the same choice would only drop cached loggers
+    use_contextvars = os.getenv("MINDBRIDGE_USE_CONTEXTVARS", "0") == "1"
+    key = (log_level.upper(), log_format, use_contextvars)
+    if key == _configured and structlog.is_configured():
+        return
+
     # Set logging level
-    numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+    numeric_level = getattr(logging, key[0], logging.INFO)
     logging.basicConfig(level=numeric_level)
 
-    # Configure processors based on format
-    if log_format == "json":
-        processors = [
-            structlog.contextvars.merge_contextvars,
-            add_trace_context,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.add_logger_name,
-            structlog.processors.JSONRenderer(),
-        ]
-    elif log_format == "console":
-        processors = [
-            structlog.contextvars.merge_contextvars,
-            add_trace_context,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.add_logger_name,
-            structlog.dev.ConsoleRenderer(colors=True),
-        ]
-    else:
-        # Default to console format for invalid inputs
-        processors = [
-            structlog.contextvars.merge_contextvars,
-            add_trace_context,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.add_logger_name,
-            structlog.dev.ConsoleRenderer(colors=True),
-        ]
+    processors = list(_PROCESSOR_CHAINS[log_format])
+    if use_contextvars:
+        processors.insert(0, structlog.contextvars.merge_contextvars)
 
     # Configure structlog
     structlog.configure(
@@ -55,6 +50,7 @@ def configure_logging(log_level: str = "INFO", log_format: str = "console") -> N
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
+    _configured = key
 
 
 def add_trace_context(
@@ -81,6 +77,37 @@ def add_trace_context(
     return event_dict
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log record with orjson for JSONRenderer.
+
+    Args:
+        obj: Event dictionary to serialize
+        **kwargs: JSONRenderer options; only ``default`` is honored
+
+    Returns:
+        JSON text; stdlib handlers expect str, not bytes
+    """
+    return orjson.dumps(
+        obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+# Processor chains are built once; the renderer is the only difference
+_SHARED_PROCESSORS: tuple[Any, ...] = (
+    add_trace_context,
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.add_logger_name,
+)
+_PROCESSOR_CHAINS: dict[str, tuple[Any, ...]] = {
+    "json": (
+        *_SHARED_PROCESSORS,
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+    ),
+    "console": (*_SHARED_PROCESSORS, structlog.dev.ConsoleRenderer(colors=True)),
+}
+
+
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """Get a structured logger instance.
 
@@ -1,21 +1,155 @@
 """OpenTelemetry tracing configuration."""
 
+import functools
+import logging
 import os
+from typing import TYPE_CHECKING
 
 from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
 
+# The SDK and the gRPC exporter are imported in configure_tracing; grpcio alone
+# adds well over 100 ms to import time, which tests and tools never need
+if TYPE_CHECKING:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter
+    from opentelemetry.sdk.trace.sampling import Sampler
 
-def configure_tracing(service_name: str | None = None) -> None:
+logger = logging.getLogger(__name__)
+
+# BatchSpanProcessor defaults; the larger queue absorbs request bursts without
+# dropping spans. Each can still be overridden by its OTEL_BSP_* variable.
+BSP_MAX_QUEUE_SIZE = 8192
+BSP_MAX_EXPORT_BATCH_SIZE = 512
+BSP_SCHEDULE_DELAY_MILLIS = 5000
+BSP_EXPORT_TIMEOUT_MILLIS = 30000
+
+# Provider installed by configure_tracing; later calls reuse it instead of
+# stacking another set of span processors
+_PROVIDER: "TracerProvider | None" = None
+
+
+def _env_int(variable: str, default: int) -> int:
+    """Read a positive integer setting from the environment.
+
+    Invalid values are logged and replaced by the default rather than failing
+    application startup.
+
+    Args:
+        variable: Environment variable name
+        default: Value used when the variable is unset or invalid
+
+    Returns:
+        The configured value or the default
+    """
+    raw = os.getenv(variable)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        logger.warning("Invalid %s=%r, using %d", variable, raw, default)
+        return default
+    return value
+
+
+def _env_ratio(variable: str, default: float) -> float:
+    """Read a ratio between 0.0 and 1.0 from the environment.
+
+    Invalid values are logged and replaced by the default rather than failing
+    application startup.
+
+    Args:
+        variable: Environment variable name
+        default: Value used when the variable is unset or invalid
+
+    Returns:
+        The configured value or the default
+    """
+    raw = os.getenv(variable)
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        value = -1.0
+    if not 0.0 <= value <= 1.0:
+        logger.warning("Invalid %s=%r, using %s", variable, raw, default)
+        return default
+    return value
+
+
+def _batch_span_processor(exporter: "SpanExporter") -> "BatchSpanProcessor":
+    """Build a BatchSpanProcessor with the configured batching settings.
+
+    Args:
+        exporter: Exporter the processor hands finished spans to
+
+    Returns:
+        Batch span processor for the exporter
+    """
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    return BatchSpanProcessor(
+        exporter,
+        max_queue_size=_env_int("OTEL_BSP_MAX_QUEUE_SIZE", BSP_MAX_QUEUE_SIZE),
+        schedule_delay_millis=_env_int(
+            "OTEL_BSP_SCHEDULE_DELAY", BSP_SCHEDULE_DELAY_MILLIS
+        ),
+        max_export_batch_size=_env_int(
+            "OTEL_BSP_MAX_EXPORT_BATCH_SIZE", BSP_MAX_EXPORT_BATCH_SIZE
+        ),
+        export_timeout_millis=_env_int(
+            "OTEL_BSP_EXPORT_TIMEOUT", BSP_EXPORT_TIMEOUT_MILLIS
+        ),
+    )
+
+
+def _sampler() -> "Sampler":
+    """Build the head sampler from the environment.
+
+    Root spans are kept with the OTEL_TRACES_SAMPLER_ARG probability; child
+    spans, including those continuing an upstream trace, follow their parent's
+    decision so traces are never cut in half. The default of 1.0 records every
+    trace as before sampling was configurable; production lowers it.
+
+    Returns:
+        Parent-based trace id ratio sampler
+    """
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    ratio = _env_ratio("OTEL_TRACES_SAMPLER_ARG", 1.0)
+    return ParentBased(root=TraceIdRatioBased(ratio))
+
+
+def configure_tracing(service_name: str | None = None) -> "TracerProvider | None":
     """Configure OpenTelemetry tracing with OTLP exporter.
 
+    Only the first call sets tracing up; later calls return the same provider.
+    Nothing is set up when OTEL_SDK_DISABLED is "true".
+
     Args:
         service_name: Name of the service for resource identification.
                      Defaults to "mindbridge" if not provided.
+
+    Returns:
+        The configured tracer provider, or None if the SDK is disabled.
     """
+    global _PROVIDER
+
+    if os.getenv("OTEL_SDK_DISABLED", "false").lower() == "true":
+        return None
+    if _PROVIDER is not None:
+        return _PROVIDER
+
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+        OTLPSpanExporter,
+    )
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
     if not service_name or service_name.strip() == "":
         service_name = "mindbridge"
 
@@ -29,7 +163,7 @@ def configure_tracing(service_name: str | None = None) -> None:
     )
 
     # Create tracer provider
-    tracer_provider = TracerProvider(resource=resource)
+    tracer_provider = TracerProvider(resource=resource, sampler=_sampler())
     trace.set_tracer_provider(tracer_provider)
 
     # Configure OTLP exporter
@@ -37,19 +171,35 @@ def configure_tracing(service_name: str | None = None) -> None:
     otlp_exporter = OTLPSpanExporter(endpoint=otlp_endpoint)
 
     # Add batch span processor
-    span_processor = BatchSpanProcessor(otlp_exporter)
-    tracer_provider.add_span_processor(span_processor)
+    tracer_provider.add_span_processor(_batch_span_processor(otlp_exporter))
 
     # Add console exporter for development
     if os.getenv("OTEL_CONSOLE_EXPORTER", "false").lower() == "true":
         console_exporter = ConsoleSpanExporter()
-        console_processor = BatchSpanProcessor(console_exporter)
-        tracer_provider.add_span_processor(console_processor)
+        tracer_provider.add_span_processor(_batch_span_processor(console_exporter))
 
+    _PROVIDER = tracer_provider
+    return tracer_provider
 
+
+def reset_tracing() -> None:
+    """Forget the configured provider so the next configure_tracing builds anew.
+
+    The global OpenTelemetry provider cannot be replaced once set, so this is
+    only meant for tests that inspect how a provider is built.
+    """
+    global _PROVIDER
+    _PROVIDER = None
+
+
+@functools.cache
 def get_tracer(name: str) -> trace.Tracer:
     """Get a tracer instance for the given name.
 
+    Tracers are cached per name. One fetched before configure_tracing is a
+    proxy that switches to the SDK provider once that is installed, and the
+    global provider cannot be replaced afterwards, so cached tracers stay valid.
+
     Args:
         name: Name of the tracer, typically __name__ of the calling module.
 
@@ -0,0 +1,17 @@
+"""Shared fixtures for API tests."""
+
+from collections.abc import Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from mindbridge.api.health import router
+
+
+@pytest.fixture(scope="session")
+def client() -> Generator[TestClient, None, None]:
+    """Create one test client for the health router, shared by all API tests."""
+    app = FastAPI()
+    app.include_router(router)
+    with TestClient(app) as test_client:
+        yield test_client
@@ -2,13 +2,11 @@
 
 from unittest.mock import MagicMock, patch
 
-import pytest
 from fastapi.testclient import TestClient
 from mindbridge.api.health import (
     HealthResponse,
     HealthStatus,
     ReadinessResponse,
-    router,
 )
 
 
@@ -45,15 +43,6 @@ class TestHealthModels:
 class TestHealthEndpoints:
     """Test cases for health check endpoints."""
 
-    @pytest.fixture
-    def client(self) -> TestClient:
-        """Create test client for health router."""
-        from fastapi import FastAPI
-
-        app = FastAPI()
-        app.include_router(router)
-        return TestClient(app)
-
     def test_health_endpoint_returns_healthy_status(self, client: TestClient) -> None:
         """Expected use case: Health endpoint should return healthy status."""
         response = client.get("/health")
@@ -75,6 +64,26 @@ class TestHealthEndpoints:
         assert "T" in timestamp
         assert timestamp.endswith("Z")
 
+    def test_health_endpoint_reuses_body_within_second(self) -> None:
+        """Expected use case: Health body is serialized at most once per second."""
+        from datetime import UTC, datetime
+
+        from mindbridge.api.health import _get_health_body
+
+        fixed_now = datetime(2024, 1, 1, tzinfo=UTC)
+        with (
+            patch("mindbridge.api.health.datetime") as mock_datetime,
+            patch("mindbridge.api.health._health_body_cache", None),
+        ):
+            mock_datetime.now.return_value = fixed_now
+            first = _get_health_body()
+            second = _get_health_body()
+
+        assert first is second
+        body = HealthResponse.model_validate_json(first)
+        assert body.status == HealthStatus.HEALTHY
+        assert body.timestamp == "2024-01-01T00:00:00Z"
+
     def test_health_endpoint_includes_version(self, client: TestClient) -> None:
         """Expected use case: Health response should include version."""
         response = client.get("/health")
@@ -122,32 +131,23 @@ class TestHealthEndpoints:
 class TestHealthCheckFunctions:
     """Test cases for health check utility functions."""
 
-    @pytest.mark.asyncio
     @patch("mindbridge.api.health.get_async_engine")
     async def test_check_database_health_success(
         self, mock_get_engine: MagicMock
     ) -> None:
         """Expected use case: Database health check should return True when healthy."""
+        from unittest.mock import AsyncMock
+
         from mindbridge.api.health import check_database_health
 
         mock_engine = MagicMock()
+        mock_engine.ping = AsyncMock(return_value=None)
         mock_get_engine.return_value = mock_engine
 
-        # Create async context manager mock for get_session
-        from unittest.mock import AsyncMock
-
-        mock_session = MagicMock()
-        mock_context = MagicMock()
-        mock_context.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_context.__aexit__ = AsyncMock(return_value=None)
-        mock_engine.get_session.return_value = mock_context
-
-        mock_session.execute = AsyncMock(return_value=None)
-
         result = await check_database_health()
         assert result is True
+        mock_engine.ping.assert_awaited_once_with(timeout=0.5)
 
-    @pytest.mark.asyncio
     @patch("mindbridge.api.health.get_async_engine")
     async def test_check_database_health_failure(
         self, mock_get_engine: MagicMock
@@ -160,7 +160,20 @@ class TestHealthCheckFunctions:
         result = await check_database_health()
         assert result is False
 
-    @pytest.mark.asyncio
+    @patch("mindbridge.api.health.get_async_engine")
+    async def test_check_database_health_timeout(
+        self, mock_get_engine: MagicMock
+    ) -> None:
+        """Failure case: A database ping timeout reports unhealthy."""
+        from unittest.mock import AsyncMock
+
+        from mindbridge.api.health import check_database_health
+
+        mock_get_engine.return_value.ping = AsyncMock(side_effect=TimeoutError())
+
+        result = await check_database_health()
+        assert result is False
+
     @patch("mindbridge.cache.redis_cache.get_redis_cache")
     async def test_check_redis_health_success(self, mock_get_cache: MagicMock) -> None:
         """Expected use case: Redis health check should return True when healthy."""
@@ -176,8 +189,10 @@ class TestHealthCheckFunctions:
 
         result = await check_redis_health()
         assert result is True
+        mock_cache.ping.assert_awaited_once()
+        mock_cache.connect.assert_not_called()
+        mock_cache.disconnect.assert_not_called()
 
-    @pytest.mark.asyncio
     @patch("mindbridge.cache.redis_cache.get_redis_cache")
     async def test_check_redis_health_failure(self, mock_get_cache: MagicMock) -> None:
         """Failure case: Redis health check should return False when unhealthy."""
@@ -188,18 +203,106 @@ class TestHealthCheckFunctions:
         result = await check_redis_health()
         assert result is False
 
+    @patch("mindbridge.api.health.HEALTH_PROBE_TIMEOUT_SECONDS", 0.05)
+    @patch("mindbridge.cache.redis_cache.get_redis_cache")
+    async def test_check_redis_health_deadline(self, mock_get_cache: MagicMock) -> None:
+        """Failure case: A hung Redis ping is cut off at the probe deadline."""
+        import asyncio
 
-class TestHealthCheckEdgeCases:
-    """Test edge cases for health check functionality."""
+        from mindbridge.api.health import check_redis_health
+
+        async def hung_ping() -> bool:
+            await asyncio.sleep(10)
+            return True
+
+        mock_get_cache.return_value.ping = hung_ping
+
+        result = await asyncio.wait_for(check_redis_health(), timeout=1.0)
+        assert result is False
 
-    @pytest.fixture
-    def client(self) -> TestClient:
-        """Create test client for health router."""
-        from fastapi import FastAPI
+    @patch("mindbridge.api.health.HEALTH_PROBE_TIMEOUT_SECONDS", 0.05)
+    @patch("mindbridge.api.health.get_async_engine")
+    async def test_check_database_health_deadline(
+        self, mock_get_engine: MagicMock
+    ) -> None:
+        """Failure case: A hung pool checkout is cut off at the probe deadline."""
+        import asyncio
+
+        from mindbridge.api.health import check_database_health
+
+        async def hung_ping(timeout: float) -> None:
+            await asyncio.sleep(10)
+
+        mock_get_engine.return_value.ping = hung_ping
+
+        result = await asyncio.wait_for(check_database_health(), timeout=1.0)
+        assert result is False
+
+    async def test_readiness_check_runs_probes_concurrently(self) -> None:
+        """Expected use case: Readiness probes overlap instead of running serially."""
+        import asyncio
+
+        from mindbridge.api.health import readiness_check
+
+        # Each probe only returns once both are running, so serial probes would
+        # never get past the barrier; the timeout just keeps that from hanging
+        barrier = asyncio.Barrier(2)
+
+        async def overlapping_probe() -> bool:
+            await barrier.wait()
+            return True
+
+        with (
+            patch("mindbridge.api.health.check_database_health", overlapping_probe),
+            patch("mindbridge.api.health.check_redis_health", overlapping_probe),
+        ):
+            response = await asyncio.wait_for(readiness_check(), timeout=5.0)
+
+        assert response.status_code == 200
 
-        app = FastAPI()
-        app.include_router(router)
-        return TestClient(app)
+    async def test_readiness_check_reuses_cached_result(self) -> None:
+        """Expected use case: Probes within the TTL reuse the last result."""
+        from unittest.mock import AsyncMock
+
+        from mindbridge.api.health import readiness_check
+
+        db_check = AsyncMock(return_value=True)
+        redis_check = AsyncMock(return_value=True)
+
+        with (
+            patch("mindbridge.api.health.check_database_health", db_check),
+            patch("mindbridge.api.health.check_redis_health", redis_check),
+        ):
+            first = await readiness_check()
+            second = await readiness_check()
+
+        assert first.body == second.body
+        db_check.assert_awaited_once()
+        redis_check.assert_awaited_once()
+
+    async def test_readiness_check_refreshes_after_ttl(self) -> None:
+        """Edge case: Expired cache entries trigger fresh probes."""
+        from unittest.mock import AsyncMock
+
+        from mindbridge.api.health import readiness_check
+
+        db_check = AsyncMock(return_value=True)
+        redis_check = AsyncMock(return_value=True)
+
+        with (
+            patch("mindbridge.api.health.check_database_health", db_check),
+            patch("mindbridge.api.health.check_redis_health", redis_check),
+            patch("mindbridge.api.health.READINESS_CACHE_TTL_SECONDS", 0.0),
+        ):
+            await readiness_check()
+            await readiness_check()
+
+        assert db_check.await_count == 2
+        assert redis_check.await_count == 2
+
+
+class TestHealthCheckEdgeCases:
+    """Test edge cases for health check functionality."""
 
     def test_health_endpoint_with_query_parameters(self, client: TestClient) -> None:
         """Edge case: Health endpoint should ignore query parameters."""
@@ -0,0 +1,142 @@
+"""Tests for Redis cache implementation."""
+
+import os
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from mindbridge.cache.exceptions import CacheConfigurationError, CacheConnectionError
+from mindbridge.cache.redis_cache import (
+    RedisCache,
+    RedisConfig,
+    _get_connection_pool,
+    _redis_config,
+    close_redis_cache,
+    get_redis_cache,
+)
+from redis.asyncio.connection import BlockingConnectionPool
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+
+class TestRedisCache:
+    """Test cases for RedisCache class."""
+
+    def test_client_uses_shared_pool(self) -> None:
+        """Expected use case: Client is built on the provided pool."""
+        pool = BlockingConnectionPool.from_url("redis://localhost:6379/0")
+
+        cache = RedisCache(pool)
+
+        assert cache.client.connection_pool is pool
+
+    async def test_ping_reuses_pooled_client(self) -> None:
+        """Expected use case: Repeated pings reuse the same pooled client."""
+        cache = RedisCache(Mock())
+        mock_client = Mock()
+        mock_client.ping = AsyncMock(return_value=True)
+        cache._client = mock_client
+
+        assert await cache.ping() is True
+        assert await cache.ping() is True
+        assert mock_client.ping.await_count == 2
+
+    async def test_ping_failure_raises_connection_error(self) -> None:
+        """Failure case: Redis errors surface as CacheConnectionError."""
+        cache = RedisCache(Mock())
+        mock_client = Mock()
+        mock_client.ping = AsyncMock(side_effect=RedisConnectionError("refused"))
+        cache._client = mock_client
+
+        with pytest.raises(CacheConnectionError, match="Redis ping failed"):
+            await cache.ping()
+
+    async def test_disconnect_closes_client_and_pool(self) -> None:
+        """Expected use case: Disconnect releases the client and pool."""
+        mock_pool = Mock()
+        mock_pool.disconnect = AsyncMock()
+        cache = RedisCache(mock_pool)
+        mock_client = Mock()
+        mock_client.aclose = AsyncMock()
+        cache._client = mock_client
+
+        await cache.disconnect()
+
+        mock_client.aclose.assert_awaited_once()
+        mock_pool.disconnect.assert_awaited_once()
+
+
+class TestGlobalCacheManagement:
+    """Test cases for global cache management functions."""
+
+    @pytest.fixture(autouse=True)
+    def clear_config_cache(self) -> None:
+        """Re-read the environment in every test."""
+        _redis_config.cache_clear()
+
+    @patch.dict(
+        os.environ,
+        {
+            "REDIS_URL": "redis://localhost:6379/0",
+            "REDIS_POOL_SIZE": "7",
+            "REDIS_POOL_TIMEOUT": "3",
+        },
+    )
+    @patch("mindbridge.cache.redis_cache._connection_pool", None)
+    @patch("mindbridge.cache.redis_cache._redis_cache", None)
+    def test_get_redis_cache_singleton_behavior(self) -> None:
+        """Expected use case: get_redis_cache returns one instance on one pool."""
+        cache = get_redis_cache()
+
+        assert get_redis_cache() is cache
+        pool = cache.client.connection_pool
+        assert isinstance(pool, BlockingConnectionPool)
+        assert pool.max_connections == 7
+        assert pool.timeout == 3
+
+    @patch("mindbridge.cache.redis_cache._connection_pool", None)
+    def test_connection_pool_cached_per_config(self) -> None:
+        """Edge case: The pool is parsed once per config and rebuilt on change."""
+        config = RedisConfig("redis://localhost:6379/0", 20, 5, 30)
+        other = RedisConfig("redis://localhost:6379/1", 20, 5, 30)
+
+        first = _get_connection_pool(config)
+
+        assert _get_connection_pool(config) is first
+        assert _get_connection_pool(other) is not first
+
+    @patch.dict(os.environ, {"REDIS_URL": "redis://localhost:6379/0"})
+    def test_redis_config_parsed_once(self) -> None:
+        """Expected use case: Environment is parsed once and cached."""
+        first = _redis_config()
+
+        with patch.dict(os.environ, {"REDIS_POOL_SIZE": "99"}):
+            assert _redis_config() is first
+
+        assert first.pool_size == 20
+
+    @patch("mindbridge.cache.redis_cache._redis_cache", None)
+    def test_get_redis_cache_missing_url_fails(self) -> None:
+        """Failure case: Missing REDIS_URL raises a configuration error."""
+        with (
+            patch.dict(os.environ, {}, clear=True),
+            pytest.raises(
+                CacheConfigurationError,
+                match="REDIS_URL environment variable is required",
+            ),
+        ):
+            get_redis_cache()
+
+    @patch("mindbridge.cache.redis_cache._connection_pool", None)
+    @patch("mindbridge.cache.redis_cache._redis_cache")
+    async def test_close_redis_cache_success(self, mock_cache: Mock) -> None:
+        """Expected use case: Close global Redis cache."""
+        mock_cache.disconnect = AsyncMock()
+
+        await close_redis_cache()
+
+        mock_cache.disconnect.assert_awaited_once()
+
+    @patch("mindbridge.cache.redis_cache._connection_pool", None)
+    @patch("mindbridge.cache.redis_cache._redis_cache", None)
+    async def test_close_redis_cache_when_none(self) -> None:
+        """Edge case: Close Redis cache when not initialized."""
+        await close_redis_cache()
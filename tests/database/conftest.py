@@ -0,0 +1,22 @@
+"""Shared fixtures for database tests."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def mock_engine_connection() -> tuple[MagicMock, AsyncMock]:
+    """Mock engine whose read-only connection context yields a mock connection.
+
+    The mocks are unspecced; the tests assert on calls, not on attribute
+    validation, and spec introspection triples the cost of each mock.
+
+    Returns:
+        The mock engine and the connection it hands out
+    """
+    connection = AsyncMock()
+    engine = MagicMock()
+    engine.get_readonly_connection.return_value.__aenter__.return_value = connection
+    engine.get_readonly_connection.return_value.__aexit__.return_value = None
+    return engine, connection
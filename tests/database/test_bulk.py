@@ -0,0 +1,149 @@
+"""Tests for vector document bulk ingest helpers."""
+
+import struct
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from mindbridge.database.bulk import (
+    DEFAULT_INSERT_BATCH_SIZE,
+    VECTOR_DOCUMENT_COPY_COLUMNS,
+    bulk_copy_vector_documents,
+    bulk_insert_vector_documents,
+    decode_halfvec_binary,
+    encode_halfvec_binary,
+)
+from mindbridge.database.models import VectorDocument
+from sqlalchemy.dialects import postgresql
+
+
+class TestHalfvecBinaryCodec:
+    """Test cases for the binary halfvec codec."""
+
+    def test_encode_halfvec_binary_format(self) -> None:
+        """Expected use case: Payload is a dimension header plus FP16 values."""
+        embedding = [0.5] * 1536
+
+        data = encode_halfvec_binary(embedding)
+
+        assert len(data) == 4 + 2 * 1536
+        assert struct.unpack_from(">HH", data) == (1536, 0)
+        assert struct.unpack_from(">e", data, 4) == (0.5,)
+
+    def test_halfvec_binary_round_trip(self) -> None:
+        """Expected use case: Decoding returns the encoded FP16 values."""
+        embedding = [float(i % 7) - 3.0 for i in range(1536)]
+
+        assert decode_halfvec_binary(encode_halfvec_binary(embedding)) == embedding
+
+    def test_encode_halfvec_binary_wrong_dimensions_fails(self) -> None:
+        """Failure case: Embeddings with the wrong size are rejected."""
+        with pytest.raises(ValueError, match="exactly 1536 dimensions"):
+            encode_halfvec_binary([0.1] * 3)
+
+
+class TestBulkCopyVectorDocuments:
+    """Test cases for bulk_copy_vector_documents."""
+
+    async def test_bulk_copy_vector_documents_success(self) -> None:
+        """Expected use case: Rows are copied in column order via binary COPY."""
+        conn = AsyncMock()
+        rows = [
+            {"content": "doc 1", "embedding": [0.1] * 1536, "repository_id": 1},
+            {"content": "doc 2", "embedding": [0.2] * 1536, "file_path": "a.md"},
+        ]
+
+        count = await bulk_copy_vector_documents(conn, rows)
+
+        assert count == 2
+        assert conn.set_type_codec.call_args.kwargs["format"] == "binary"
+        call = conn.copy_records_to_table.call_args
+        assert call.args == ("vector_documents",)
+        assert call.kwargs["columns"] == VECTOR_DOCUMENT_COPY_COLUMNS
+        first = dict(
+            zip(VECTOR_DOCUMENT_COPY_COLUMNS, call.kwargs["records"][0], strict=True)
+        )
+        assert first["content"] == "doc 1"
+        assert first["repository_id"] == 1
+        assert first["title"] is None
+        conn.reset_type_codec.assert_awaited_once_with("halfvec", schema="public")
+
+    async def test_bulk_copy_vector_documents_empty(self) -> None:
+        """Edge case: No rows means no codec change and no COPY round-trip."""
+        conn = AsyncMock()
+
+        count = await bulk_copy_vector_documents(conn, [])
+
+        assert count == 0
+        conn.set_type_codec.assert_not_called()
+        conn.copy_records_to_table.assert_not_called()
+
+    async def test_bulk_copy_vector_documents_failure_resets_codec(self) -> None:
+        """Failure case: The default halfvec codec is restored when COPY fails."""
+        conn = AsyncMock()
+        conn.copy_records_to_table.side_effect = RuntimeError("copy failed")
+
+        with pytest.raises(RuntimeError, match="copy failed"):
+            await bulk_copy_vector_documents(conn, [{"content": "doc"}])
+
+        conn.reset_type_codec.assert_awaited_once_with("halfvec", schema="public")
+
+
+class TestBulkInsertVectorDocuments:
+    """Test cases for bulk_insert_vector_documents."""
+
+    async def test_bulk_insert_vector_documents_batches(self) -> None:
+        """Expected use case: Rows are inserted and committed per batch."""
+        session = AsyncMock()
+        rows = [{"content": f"doc {i}", "embedding": [0.1] * 1536} for i in range(5)]
+
+        count = await bulk_insert_vector_documents(session, rows, batch_size=2)
+
+        assert count == 5
+        batch_sizes = [len(call.args[1]) for call in session.execute.call_args_list]
+        assert batch_sizes == [2, 2, 1]
+        assert session.commit.await_count == 3
+
+    async def test_bulk_insert_vector_documents_default_batch_size(self) -> None:
+        """Edge case: The default batch size is used as given, without a cap."""
+        session = AsyncMock()
+        rows = [{"content": "doc"}] * (DEFAULT_INSERT_BATCH_SIZE + 1)
+
+        await bulk_insert_vector_documents(session, rows)
+
+        batch_sizes = [len(call.args[1]) for call in session.execute.call_args_list]
+        assert batch_sizes == [DEFAULT_INSERT_BATCH_SIZE, 1]
+
+    async def test_bulk_insert_vector_documents_invalid_batch_size_fails(
+        self,
+    ) -> None:
+        """Failure case: Non-positive batch size is rejected."""
+        with pytest.raises(ValueError, match="Batch size must be >= 1"):
+            await bulk_insert_vector_documents(AsyncMock(), [], batch_size=0)
+
+    async def test_bulk_insert_vector_documents_on_conflict_do_nothing(self) -> None:
+        """Edge case: Skipped conflicting rows are not counted as inserted."""
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value.all.side_effect = [[1, 2], [5]]
+        session.execute.return_value = result
+        rows = [{"id": i, "content": f"doc {i}"} for i in range(1, 6)]
+
+        count = await bulk_insert_vector_documents(
+            session, rows, batch_size=3, on_conflict_do_nothing=True
+        )
+
+        assert count == 3
+        statement = session.execute.call_args.args[0]
+        compiled = str(statement.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT DO NOTHING RETURNING" in compiled
+        assert session.commit.await_count == 2
+
+    async def test_vector_document_bulk_insert_delegates(self) -> None:
+        """Expected use case: The model classmethod batches like the helper."""
+        session = AsyncMock()
+        rows = [{"content": f"doc {i}"} for i in range(3)]
+
+        count = await VectorDocument.bulk_insert(session, rows, batch_size=2)
+
+        assert count == 3
+        assert session.commit.await_count == 2
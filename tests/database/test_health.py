@@ -1,12 +1,11 @@
 """Tests for database health checking functionality."""
 
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
-import pytest
 from mindbridge.database.connection import DatabaseEngine
 from mindbridge.database.health import DatabaseHealthChecker
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.pool import NullPool, QueuePool
 
 
 class TestDatabaseHealthChecker:
@@ -15,7 +14,7 @@ class TestDatabaseHealthChecker:
     def test_health_checker_initialization(self) -> None:
         """Expected use case: Initialize health checker with database engine."""
         # Arrange
-        mock_engine = Mock(spec=DatabaseEngine)
+        mock_engine = Mock()
 
         # Act
         health_checker = DatabaseHealthChecker(mock_engine)
@@ -23,14 +22,12 @@ class TestDatabaseHealthChecker:
         # Assert
         assert health_checker._database_engine is mock_engine
 
-    @pytest.mark.asyncio
-    async def test_check_basic_connectivity_success(self) -> None:
+    async def test_check_basic_connectivity_success(
+        self, mock_engine_connection: tuple[MagicMock, AsyncMock]
+    ) -> None:
         """Expected use case: Basic connectivity check should succeed."""
         # Arrange
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_engine = AsyncMock(spec=DatabaseEngine)
-        mock_engine.get_session.return_value.__aenter__.return_value = mock_session
-        mock_engine.get_session.return_value.__aexit__.return_value = None
+        mock_engine, mock_connection = mock_engine_connection
 
         health_checker = DatabaseHealthChecker(mock_engine)
 
@@ -45,18 +42,17 @@ class TestDatabaseHealthChecker:
             "Database connection successful"
             in result["checks"]["connectivity"]["message"]
         )
-        mock_session.execute.assert_called_once()
+        mock_connection.exec_driver_sql.assert_awaited_once_with("")
 
-    @pytest.mark.asyncio
-    async def test_check_basic_connectivity_sqlalchemy_error(self) -> None:
+    async def test_check_basic_connectivity_sqlalchemy_error(
+        self, mock_engine_connection: tuple[MagicMock, AsyncMock]
+    ) -> None:
         """Failure case: Basic connectivity check with SQLAlchemy error."""
         # Arrange
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_session.execute.side_effect = SQLAlchemyError("Connection failed")
-
-        mock_engine = AsyncMock(spec=DatabaseEngine)
-        mock_engine.get_session.return_value.__aenter__.return_value = mock_session
-        mock_engine.get_session.return_value.__aexit__.return_value = None
+        mock_engine, mock_connection = mock_engine_connection
+        mock_connection.exec_driver_sql.side_effect = SQLAlchemyError(
+            "Connection failed"
+        )
 
         health_checker = DatabaseHealthChecker(mock_engine)
 
@@ -71,16 +67,13 @@ class TestDatabaseHealthChecker:
         )
         assert "Connection failed" in result["checks"]["connectivity"]["message"]
 
-    @pytest.mark.asyncio
-    async def test_check_basic_connectivity_unexpected_error(self) -> None:
+    async def test_check_basic_connectivity_unexpected_error(
+        self, mock_engine_connection: tuple[MagicMock, AsyncMock]
+    ) -> None:
         """Failure case: Basic connectivity check with unexpected error."""
         # Arrange
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_session.execute.side_effect = RuntimeError("Unexpected error")
-
-        mock_engine = AsyncMock(spec=DatabaseEngine)
-        mock_engine.get_session.return_value.__aenter__.return_value = mock_session
-        mock_engine.get_session.return_value.__aexit__.return_value = None
+        mock_engine, mock_connection = mock_engine_connection
+        mock_connection.exec_driver_sql.side_effect = RuntimeError("Unexpected error")
 
         health_checker = DatabaseHealthChecker(mock_engine)
 
@@ -92,11 +85,12 @@ class TestDatabaseHealthChecker:
         assert result["checks"]["connectivity"]["status"] == "unhealthy"
         assert "Unexpected error" in result["checks"]["connectivity"]["message"]
 
-    @pytest.mark.asyncio
-    async def test_check_pgvector_extension_success(self) -> None:
+    async def test_check_pgvector_extension_success(
+        self, mock_engine_connection: tuple[MagicMock, AsyncMock]
+    ) -> None:
         """Expected use case: pgvector extension check should succeed."""
         # Arrange
-        mock_session = AsyncMock(spec=AsyncSession)
+        mock_engine, mock_connection = mock_engine_connection
 
         # Mock extension query result
         extension_result = Mock()
@@ -108,11 +102,7 @@ class TestDatabaseHealthChecker:
         vector_result = Mock()
         vector_result.scalar.return_value = 5.196152  # Example distance
 
-        mock_session.execute.side_effect = [extension_result, vector_result]
-
-        mock_engine = AsyncMock(spec=DatabaseEngine)
-        mock_engine.get_session.return_value.__aenter__.return_value = mock_session
-        mock_engine.get_session.return_value.__aexit__.return_value = None
+        mock_connection.execute.side_effect = [extension_result, vector_result]
 
         health_checker = DatabaseHealthChecker(mock_engine)
 
@@ -126,20 +116,17 @@ class TestDatabaseHealthChecker:
         assert result["checks"]["vector_operations"]["status"] == "healthy"
         assert "5.196152" in result["checks"]["vector_operations"]["message"]
 
-    @pytest.mark.asyncio
-    async def test_check_pgvector_extension_not_installed(self) -> None:
+    async def test_check_pgvector_extension_not_installed(
+        self, mock_engine_connection: tuple[MagicMock, AsyncMock]
+    ) -> None:
         """Failure case: pgvector extension not installed."""
         # Arrange
-        mock_session = AsyncMock(spec=AsyncSession)
+        mock_engine, mock_connection = mock_engine_connection
 
         # Mock extension query result (no extension found)
         extension_result = Mock()
         extension_result.fetchone.return_value = None
-        mock_session.execute.return_value = extension_result
-
-        mock_engine = AsyncMock(spec=DatabaseEngine)
-        mock_engine.get_session.return_value.__aenter__.return_value = mock_session
-        mock_engine.get_session.return_value.__aexit__.return_value = None
+        mock_connection.execute.return_value = extension_result
 
         health_checker = DatabaseHealthChecker(mock_engine)
 
@@ -151,16 +138,66 @@ class TestDatabaseHealthChecker:
         assert result["checks"]["pgvector_extension"]["status"] == "unhealthy"
         assert "not installed" in result["checks"]["pgvector_extension"]["message"]
 
-    @pytest.mark.asyncio
-    async def test_check_pgvector_extension_query_error(self) -> None:
-        """Failure case: pgvector extension check with query error."""
+    async def test_check_pgvector_extension_row_cached(
+        self, mock_engine_connection: tuple[MagicMock, AsyncMock]
+    ) -> None:
+        """Expected use case: Repeated checks skip the pg_extension lookup."""
         # Arrange
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_session.execute.side_effect = SQLAlchemyError("Permission denied")
+        mock_engine, mock_connection = mock_engine_connection
 
-        mock_engine = AsyncMock(spec=DatabaseEngine)
-        mock_engine.get_session.return_value.__aenter__.return_value = mock_session
-        mock_engine.get_session.return_value.__aexit__.return_value = None
+        extension_result = Mock()
+        extension_row = Mock()
+        extension_row.extversion = "0.8.0"
+        extension_result.fetchone.return_value = extension_row
+
+        vector_result = Mock()
+        vector_result.scalar.return_value = 5.196152
+
+        mock_connection.execute.side_effect = [
+            extension_result,
+            vector_result,
+            vector_result,
+        ]
+
+        health_checker = DatabaseHealthChecker(mock_engine)
+
+        # Act
+        first = await health_checker.check_pgvector_extension()
+        second = await health_checker.check_pgvector_extension()
+
+        # Assert
+        assert first["status"] == "healthy"
+        assert second["status"] == "healthy"
+        assert "version 0.8.0" in second["checks"]["pgvector_extension"]["message"]
+        assert mock_connection.execute.await_count == 3
+
+    async def test_check_pgvector_extension_missing_not_cached(
+        self, mock_engine_connection: tuple[MagicMock, AsyncMock]
+    ) -> None:
+        """Edge case: A missing extension is looked up again on the next check."""
+        # Arrange
+        mock_engine, mock_connection = mock_engine_connection
+
+        extension_result = Mock()
+        extension_result.fetchone.return_value = None
+        mock_connection.execute.return_value = extension_result
+
+        health_checker = DatabaseHealthChecker(mock_engine)
+
+        # Act
+        await health_checker.check_pgvector_extension()
+        await health_checker.check_pgvector_extension()
+
+        # Assert
+        assert mock_connection.execute.await_count == 2
+
+    async def test_check_pgvector_extension_query_error(
+        self, mock_engine_connection: tuple[MagicMock, AsyncMock]
+    ) -> None:
+        """Failure case: pgvector extension check with query error."""
+        # Arrange
+        mock_engine, mock_connection = mock_engine_connection
+        mock_connection.execute.side_effect = SQLAlchemyError("Permission denied")
 
         health_checker = DatabaseHealthChecker(mock_engine)
 
@@ -174,11 +211,10 @@ class TestDatabaseHealthChecker:
             "pgvector check failed" in result["checks"]["pgvector_extension"]["message"]
         )
 
-    @pytest.mark.asyncio
     async def test_check_pool_status_success(self) -> None:
         """Expected use case: Connection pool status check should succeed."""
         # Arrange
-        mock_pool = Mock()
+        mock_pool = Mock(spec=QueuePool)
         mock_pool.size.return_value = 10
         mock_pool.checkedin.return_value = 8
         mock_pool.checkedout.return_value = 2
@@ -204,11 +240,11 @@ class TestDatabaseHealthChecker:
         assert result["checks"]["connection_pool"]["overflow"] == 3
         assert result["checks"]["connection_pool"]["total_connections"] == 13  # 10 + 3
 
-    @pytest.mark.asyncio
     async def test_check_pool_status_error(self) -> None:
         """Failure case: Pool status check with error."""
         # Arrange
         mock_engine = Mock(spec=DatabaseEngine)
+        mock_engine.engine.pool = Mock(spec=QueuePool)
         mock_engine.engine.pool.size.side_effect = RuntimeError("Pool error")
 
         health_checker = DatabaseHealthChecker(mock_engine)
@@ -223,31 +259,42 @@ class TestDatabaseHealthChecker:
             "Pool status check failed" in result["checks"]["connection_pool"]["message"]
         )
 
-    @pytest.mark.asyncio
-    async def test_comprehensive_health_check_all_healthy(self) -> None:
-        """Expected use case: Comprehensive health check with all systems healthy."""
+    async def test_check_pool_status_pool_without_counters(self) -> None:
+        """Edge case: Pools without queue counters report n/a."""
         # Arrange
-        mock_engine = AsyncMock(spec=DatabaseEngine)
+        mock_engine = Mock(spec=DatabaseEngine)
+        mock_engine.engine.pool = Mock(spec=NullPool)
+
         health_checker = DatabaseHealthChecker(mock_engine)
 
-        # Mock all individual checks to return healthy
-        with (
-            patch.object(
-                health_checker, "check_basic_connectivity"
-            ) as mock_connectivity,
-            patch.object(health_checker, "check_pgvector_extension") as mock_pgvector,
-            patch.object(health_checker, "check_pool_status") as mock_pool,
-        ):
-            mock_connectivity.return_value = {
-                "status": "healthy",
-                "checks": {"connectivity": {"status": "healthy", "message": "OK"}},
-            }
-            mock_pgvector.return_value = {
-                "status": "healthy",
-                "checks": {
-                    "pgvector_extension": {"status": "healthy", "message": "OK"}
-                },
-            }
+        # Act
+        result = await health_checker.check_pool_status()
+
+        # Assert
+        assert result["status"] == "healthy"
+        assert result["checks"]["connection_pool"]["pool_size"] == "n/a"
+        assert result["checks"]["connection_pool"]["total_connections"] == "n/a"
+
+    async def test_comprehensive_health_check_all_healthy(
+        self, mock_engine_connection: tuple[MagicMock, AsyncMock]
+    ) -> None:
+        """Expected use case: All checks run on one session and pass."""
+        # Arrange
+        mock_engine, mock_connection = mock_engine_connection
+
+        extension_result = Mock()
+        extension_row = Mock()
+        extension_row.extversion = "0.8.0"
+        extension_result.fetchone.return_value = extension_row
+
+        vector_result = Mock()
+        vector_result.scalar.return_value = 5.196152
+
+        mock_connection.execute.side_effect = [extension_result, vector_result]
+
+        health_checker = DatabaseHealthChecker(mock_engine)
+
+        with patch.object(health_checker, "check_pool_status") as mock_pool:
             mock_pool.return_value = {
                 "status": "healthy",
                 "checks": {"connection_pool": {"status": "healthy", "pool_size": 10}},
@@ -260,35 +307,27 @@ class TestDatabaseHealthChecker:
         assert result["status"] == "healthy"
         assert "connectivity" in result["checks"]
         assert "pgvector_extension" in result["checks"]
+        assert "vector_operations" in result["checks"]
         assert "connection_pool" in result["checks"]
         assert "timestamp" in result
+        mock_engine.get_readonly_connection.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_comprehensive_health_check_one_unhealthy(self) -> None:
         """Failure case: Comprehensive health check with one system unhealthy."""
         # Arrange
-        mock_engine = AsyncMock(spec=DatabaseEngine)
+        mock_engine = MagicMock()
         health_checker = DatabaseHealthChecker(mock_engine)
 
         # Mock checks with one unhealthy
         with (
-            patch.object(
-                health_checker, "check_basic_connectivity"
-            ) as mock_connectivity,
-            patch.object(health_checker, "check_pgvector_extension") as mock_pgvector,
+            patch.object(health_checker, "_run_all_db_checks") as mock_db_checks,
             patch.object(health_checker, "check_pool_status") as mock_pool,
         ):
-            mock_connectivity.return_value = {
-                "status": "healthy",
-                "checks": {"connectivity": {"status": "healthy", "message": "OK"}},
-            }
-            mock_pgvector.return_value = {
-                "status": "unhealthy",  # This one is unhealthy
-                "checks": {
-                    "pgvector_extension": {
-                        "status": "unhealthy",
-                        "message": "Extension missing",
-                    }
+            mock_db_checks.return_value = {
+                "connectivity": {"status": "healthy", "message": "OK"},
+                "pgvector_extension": {
+                    "status": "unhealthy",
+                    "message": "Extension missing",
                 },
             }
             mock_pool.return_value = {
@@ -305,39 +344,19 @@ class TestDatabaseHealthChecker:
         assert "pgvector_extension" in result["checks"]
         assert "connection_pool" in result["checks"]
 
-    @pytest.mark.asyncio
-    async def test_comprehensive_health_check_multiple_unhealthy(self) -> None:
-        """Edge case: Comprehensive health check with multiple systems unhealthy."""
+    async def test_comprehensive_health_check_multiple_unhealthy(
+        self, mock_engine_connection: tuple[MagicMock, AsyncMock]
+    ) -> None:
+        """Edge case: Connection failure marks the dependent checks unhealthy."""
         # Arrange
-        mock_engine = AsyncMock(spec=DatabaseEngine)
+        mock_engine, mock_connection = mock_engine_connection
+        mock_connection.exec_driver_sql.side_effect = SQLAlchemyError(
+            "Connection failed"
+        )
+
         health_checker = DatabaseHealthChecker(mock_engine)
 
-        # Mock checks with multiple unhealthy
-        with (
-            patch.object(
-                health_checker, "check_basic_connectivity"
-            ) as mock_connectivity,
-            patch.object(health_checker, "check_pgvector_extension") as mock_pgvector,
-            patch.object(health_checker, "check_pool_status") as mock_pool,
-        ):
-            mock_connectivity.return_value = {
-                "status": "unhealthy",
-                "checks": {
-                    "connectivity": {
-                        "status": "unhealthy",
-                        "message": "Connection failed",
-                    }
-                },
-            }
-            mock_pgvector.return_value = {
-                "status": "unhealthy",
-                "checks": {
-                    "pgvector_extension": {
-                        "status": "unhealthy",
-                        "message": "Extension missing",
-                    }
-                },
-            }
+        with patch.object(health_checker, "check_pool_status") as mock_pool:
             mock_pool.return_value = {
                 "status": "unhealthy",
                 "checks": {
@@ -353,3 +372,36 @@ class TestDatabaseHealthChecker:
         assert result["checks"]["connectivity"]["status"] == "unhealthy"
         assert result["checks"]["pgvector_extension"]["status"] == "unhealthy"
         assert result["checks"]["connection_pool"]["status"] == "unhealthy"
+        mock_connection.execute.assert_not_called()
+
+    async def test_comprehensive_health_check_shares_timestamp(self) -> None:
+        """Expected use case: One timestamp is computed and threaded through."""
+        # Arrange
+        mock_engine = MagicMock()
+        health_checker = DatabaseHealthChecker(mock_engine)
+
+        with (
+            patch.object(health_checker, "_run_all_db_checks") as mock_db_checks,
+            patch.object(health_checker, "check_pool_status") as mock_pool,
+        ):
+            mock_db_checks.return_value = {}
+            mock_pool.return_value = {"status": "healthy", "checks": {}}
+
+            # Act
+            result = await health_checker.comprehensive_health_check()
+
+        # Assert
+        mock_pool.assert_awaited_once_with(result["timestamp"])
+
+    async def test_check_pool_status_uses_given_timestamp(self) -> None:
+        """Edge case: A provided timestamp is used instead of the clock."""
+        # Arrange
+        mock_engine = Mock(spec=DatabaseEngine)
+        mock_engine.engine = Mock()
+        health_checker = DatabaseHealthChecker(mock_engine)
+
+        # Act
+        result = await health_checker.check_pool_status("2024-01-01T00:00:00+00:00")
+
+        # Assert
+        assert result["timestamp"] == "2024-01-01T00:00:00+00:00"
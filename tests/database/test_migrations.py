@@ -0,0 +1,165 @@
+"""Tests that run the Alembic migrations against a real PostgreSQL server."""
+
+import os
+import uuid
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.exc import OperationalError
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
+INITIAL_REVISION = "2ec9b2e8a63e"
+# Last revision that still stores statuses as native PostgreSQL enums
+ENUM_REVISION_PARENT = "3f9a6c1e8b47"
+
+# halfvec arrived in pgvector 0.7.0
+MIN_PGVECTOR_VERSION = (0, 7)
+
+
+def _server_url() -> URL:
+    """Return the test server URL with the synchronous driver Alembic uses."""
+    return make_url(os.environ["DATABASE_URL"]).set(drivername="postgresql")
+
+
+def _pgvector_version(url: URL) -> tuple[int, ...] | None:
+    """Return the installable pgvector version, or None if it is missing."""
+    engine = create_engine(url)
+    try:
+        with engine.connect() as conn:
+            version = conn.scalar(
+                text(
+                    "SELECT default_version FROM pg_available_extensions "
+                    "WHERE name = 'vector'"
+                )
+            )
+    finally:
+        engine.dispose()
+    return tuple(int(part) for part in version.split(".")) if version else None
+
+
+@pytest.fixture
+def migration_database() -> Generator[URL, None, None]:
+    """Create an empty database for one migration run and drop it afterwards.
+
+    Skips when no PostgreSQL server with pgvector 0.7+ is reachable.
+    """
+    server_url = _server_url()
+    admin = create_engine(server_url, isolation_level="AUTOCOMMIT")
+    name = f"mindbridge_migrations_{uuid.uuid4().hex[:12]}"
+    try:
+        with admin.connect() as conn:
+            conn.execute(text(f'CREATE DATABASE "{name}"'))
+    except OperationalError:
+        admin.dispose()
+        pytest.skip("PostgreSQL test server is not reachable")
+
+    url = server_url.set(database=name)
+    try:
+        version = _pgvector_version(url)
+        if version is None or version < MIN_PGVECTOR_VERSION:
+            pytest.skip("pgvector 0.7+ is not installed on the test server")
+        yield url
+    finally:
+        with admin.connect() as conn:
+            conn.execute(text(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)'))
+        admin.dispose()
+
+
+@pytest.fixture
+def alembic_config(migration_database: URL, monkeypatch: pytest.MonkeyPatch) -> Config:
+    """Alembic configuration pointing at the throwaway database.
+
+    No ini file is loaded, so running migrations leaves logging untouched.
+    """
+    monkeypatch.setenv(
+        "DATABASE_URL", migration_database.render_as_string(hide_password=False)
+    )
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    return config
+
+
+def _execute(url: URL, sql: str) -> None:
+    """Run a statement against the database and commit it."""
+    engine = create_engine(url)
+    try:
+        with engine.begin() as conn:
+            conn.execute(text(sql))
+    finally:
+        engine.dispose()
+
+
+def _scalar(url: URL, sql: str) -> object:
+    """Run a single-value query against the database."""
+    engine = create_engine(url)
+    try:
+        with engine.connect() as conn:
+            return conn.scalar(text(sql))
+    finally:
+        engine.dispose()
+
+
+def _embedding_type(url: URL) -> object:
+    """Return the formatted type of vector_documents.embedding."""
+    return _scalar(
+        url,
+        "SELECT format_type(atttypid, atttypmod) FROM pg_attribute "
+        "WHERE attrelid = 'vector_documents'::regclass AND attname = 'embedding'",
+    )
+
+
+@pytest.mark.integration
+class TestMigrations:
+    """Test cases for upgrading and downgrading the schema."""
+
+    def test_upgrade_to_head(
+        self, alembic_config: Config, migration_database: URL
+    ) -> None:
+        """Expected use case: Every revision applies to an empty database."""
+        command.upgrade(alembic_config, "head")
+
+        head = ScriptDirectory.from_config(alembic_config).get_current_head()
+        current = _scalar(migration_database, "SELECT version_num FROM alembic_version")
+        assert current == head
+        assert _embedding_type(migration_database) == "halfvec(1536)"
+
+    def test_downgrade_to_initial_and_upgrade_again(
+        self, alembic_config: Config, migration_database: URL
+    ) -> None:
+        """Expected use case: Downgrades restore the initial schema and re-apply."""
+        command.upgrade(alembic_config, "head")
+
+        command.downgrade(alembic_config, INITIAL_REVISION)
+        assert _embedding_type(migration_database) == "vector(1536)"
+
+        command.upgrade(alembic_config, "head")
+        assert _embedding_type(migration_database) == "halfvec(1536)"
+
+    def test_enum_columns_converted_to_codes(
+        self, alembic_config: Config, migration_database: URL
+    ) -> None:
+        """Expected use case: Existing enum values become SMALLINT codes and back."""
+        command.upgrade(alembic_config, ENUM_REVISION_PARENT)
+        _execute(
+            migration_database,
+            "INSERT INTO repositories (name, url, status) "
+            "VALUES ('repo', 'https://example.com/repo', 'completed')",
+        )
+
+        command.upgrade(alembic_config, "head")
+        assert _scalar(migration_database, "SELECT status FROM repositories") == 3
+        enum_types = _scalar(
+            migration_database,
+            "SELECT count(*) FROM pg_type WHERE typname = 'repositorystatus'",
+        )
+        assert enum_types == 0
+
+        command.downgrade(alembic_config, ENUM_REVISION_PARENT)
+        status = _scalar(migration_database, "SELECT status::text FROM repositories")
+        assert status == "completed"
@@ -1,14 +1,24 @@
 """Tests for database models."""
 
+import array
+from typing import Any
+from unittest.mock import AsyncMock
+
+import numpy as np
 import pytest
 from mindbridge.database.models import (
+    DEFAULT_INSERT_BATCH_SIZE,
     Base,
     Document,
     Job,
     JobType,
     Repository,
     VectorDocument,
+    skip_embedding_validation,
 )
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class TestVectorDocument:
@@ -31,7 +41,9 @@ class TestVectorDocument:
         assert doc.content == content
         assert doc.title == title
         assert doc.source_url == source_url
-        assert doc.embedding == embedding
+        np.testing.assert_array_equal(
+            doc.embedding, np.asarray(embedding, dtype=np.float16)
+        )
         assert doc.id is None  # Not yet persisted
         assert doc.created_at is None  # Will be set by database
         assert doc.updated_at is None  # Will be set by database
@@ -47,7 +59,9 @@ class TestVectorDocument:
 
         # Assert
         assert doc.content == content
-        assert doc.embedding == embedding
+        np.testing.assert_array_equal(
+            doc.embedding, np.asarray(embedding, dtype=np.float16)
+        )
         assert doc.title is None
         assert doc.source_url is None
         assert doc.document_type is None
@@ -76,6 +90,44 @@ class TestVectorDocument:
                 embedding=[0.1] * 1535 + ["not a number"],  # Invalid value
             )
 
+        # Act & Assert - Non-finite values in embedding
+        with pytest.raises(ValueError, match="All embedding values must be finite"):
+            VectorDocument(content=content, embedding=[0.1] * 1535 + [float("nan")])
+
+        # Act & Assert - Values outside the FP16 range
+        with pytest.raises(ValueError, match="All embedding values must be finite"):
+            VectorDocument(content=content, embedding=[0.1] * 1535 + [1e6])
+
+    def test_vector_document_accepts_arrays(self) -> None:
+        """Edge case: NumPy and array.array embeddings are accepted as float16."""
+        # Arrange
+        values = np.full(1536, 0.25, dtype=np.float64)
+
+        # Act
+        from_ndarray = VectorDocument(content="ndarray", embedding=values)
+        from_array = VectorDocument(
+            content="array", embedding=array.array("f", values.tolist())
+        )
+
+        # Assert
+        assert from_ndarray.embedding.dtype == np.float16
+        assert from_ndarray.embedding.shape == (1536,)
+        np.testing.assert_array_equal(from_array.embedding, from_ndarray.embedding)
+
+    def test_skip_embedding_validation_context(self) -> None:
+        """Edge case: Validation is skipped only inside the context."""
+        # Arrange
+        embedding = [0.1] * 3
+
+        # Act
+        with skip_embedding_validation():
+            doc = VectorDocument(content="pre-validated", embedding=embedding)
+
+        # Assert
+        assert doc.embedding is embedding
+        with pytest.raises(ValueError, match="Embedding must be exactly 1536"):
+            VectorDocument(content="validated", embedding=embedding)
+
     def test_vector_document_repr(self) -> None:
         """Expected use case: String representation of VectorDocument."""
         # Arrange
@@ -112,7 +164,9 @@ class TestVectorDocument:
         assert doc.content == doc_data["content"]
         assert doc.title == doc_data["title"]
         assert doc.source_url == doc_data["source_url"]
-        assert doc.embedding == doc_data["embedding"]
+        np.testing.assert_array_equal(
+            doc.embedding, np.asarray(doc_data["embedding"], dtype=np.float16)
+        )
         assert doc.document_type == doc_data["document_type"]
         assert doc.repository_id == doc_data["repository_id"]
         assert doc.file_path == doc_data["file_path"]
@@ -128,7 +182,9 @@ class TestVectorDocument:
 
         # Assert
         assert len(doc.content) == 10000
-        assert doc.embedding == embedding
+        np.testing.assert_array_equal(
+            doc.embedding, np.asarray(embedding, dtype=np.float16)
+        )
 
     def test_vector_document_special_characters(self) -> None:
         """Edge case: VectorDocument with special characters and unicode."""
@@ -143,7 +199,73 @@ class TestVectorDocument:
         # Assert
         assert doc.content == content
         assert doc.title == title
-        assert doc.embedding == embedding
+        np.testing.assert_array_equal(
+            doc.embedding, np.asarray(embedding, dtype=np.float16)
+        )
+
+    def test_vector_document_embedding_is_halfvec(self) -> None:
+        """Expected use case: Embeddings are stored as 1536-dim halfvec."""
+        column_type = VectorDocument.__table__.c.embedding.type
+
+        assert isinstance(column_type, HALFVEC)
+        assert column_type.dim == 1536
+
+    def test_vector_document_partitioned_by_repository(self) -> None:
+        """Expected use case: Table is hash-partitioned on repository_id."""
+        table = VectorDocument.__table__
+
+        assert (
+            table.dialect_options["postgresql"]["partition_by"]
+            == "HASH (repository_id)"
+        )
+        assert [c.name for c in table.primary_key.columns] == ["repository_id", "id"]
+        assert table.c.repository_id.nullable is False
+
+    def test_vector_document_timestamps_default_client_side(self) -> None:
+        """Expected use case: Timestamps default in Python, with a server fallback."""
+        table = VectorDocument.__table__
+
+        for column in (table.c.created_at, table.c.updated_at):
+            assert column.default is not None
+            assert column.default.is_callable
+            assert column.server_default is not None
+
+    def test_vector_search_indexes_declared(self) -> None:
+        """Expected use case: Composite filter and HNSW indexes are in metadata."""
+        indexes = {idx.name: idx for idx in VectorDocument.__table__.indexes}
+
+        repo_type = indexes["ix_vector_documents_repo_type_created"]
+        assert [str(expr) for expr in repo_type.expressions] == [
+            "vector_documents.repository_id",
+            "vector_documents.document_type",
+            "created_at DESC",
+        ]
+        assert "ix_vector_documents_document_type" not in indexes
+
+        hnsw = indexes["ix_vector_documents_embedding_hnsw"]
+        options = hnsw.dialect_options["postgresql"]
+        assert options["using"] == "hnsw"
+        assert options["ops"] == {"embedding": "halfvec_cosine_ops"}
+
+    def test_created_at_indexes_use_brin(self) -> None:
+        """Expected use case: created_at indexes are BRIN, not B-tree."""
+        for model in (VectorDocument, Repository, Document, Job):
+            index = next(
+                idx
+                for idx in model.__table__.indexes
+                if idx.name == f"ix_{model.__tablename__}_created_at"
+            )
+            assert index.dialect_options["postgresql"]["using"] == "brin"
+
+    async def test_bulk_insert_uses_module_batch_size(self) -> None:
+        """Expected use case: The model default matches the bulk ingest default."""
+        session = AsyncMock(spec=AsyncSession)
+        rows = [{"content": "doc"}] * (DEFAULT_INSERT_BATCH_SIZE + 1)
+
+        await VectorDocument.bulk_insert(session, rows)
+
+        batch_sizes = [len(call.args[1]) for call in session.execute.call_args_list]
+        assert batch_sizes == [DEFAULT_INSERT_BATCH_SIZE, 1]
 
 
 class TestBase:
@@ -170,9 +292,64 @@ class TestBase:
         assert VectorDocument.__tablename__ == "vector_documents"
 
 
+def _lazy_strategies(options: list[Any]) -> dict[str, str]:
+    """Map each relationship path in loader options to its lazy strategy."""
+    strategies = {}
+    for option in options:
+        loads = getattr(option, "context", None)
+        if loads is None:
+            # Wildcard option such as raiseload("*")
+            strategies["*"] = dict(option.strategy)["lazy"]
+            continue
+        for load in loads:
+            strategies[str(load.path.natural_path[-2])] = dict(load.strategy)["lazy"]
+    return strategies
+
+
 class TestRepository:
     """Test cases for Repository model."""
 
+    def test_loader_options_eager_load_relationships(self) -> None:
+        """Expected use case: documents and jobs load with selectin, rest raises."""
+        strategies = _lazy_strategies(Repository.loader_options())
+
+        assert strategies == {
+            "Repository.documents": "selectin",
+            "Document.vector_documents": "raise",
+            "Repository.jobs": "selectin",
+            "*": "raise",
+        }
+
+    def test_summary_options_raise_on_relationships(self) -> None:
+        """Expected use case: summary reads never lazy load relationships."""
+        assert _lazy_strategies(Repository.summary_options()) == {"*": "raise"}
+
+    async def test_repository_bulk_insert_uses_core_executemany(self) -> None:
+        """Expected use case: Bulk insert issues one Core INSERT for all rows."""
+        # Arrange
+        session = AsyncMock(spec=AsyncSession)
+        rows = [
+            {"name": f"repo-{i}", "url": f"https://github.com/user/repo-{i}"}
+            for i in range(3)
+        ]
+
+        # Act
+        inserted = await Repository.bulk_insert(session, rows)
+
+        # Assert
+        assert inserted == 3
+        session.execute.assert_awaited_once()
+        statement, params = session.execute.await_args.args
+        assert statement.table.name == "repositories"
+        assert params == rows
+
+    async def test_repository_bulk_insert_empty(self) -> None:
+        """Edge case: Bulk insert of no rows does not touch the database."""
+        session = AsyncMock(spec=AsyncSession)
+
+        assert await Repository.bulk_insert(session, []) == 0
+        session.execute.assert_not_awaited()
+
     def test_repository_creation_success(self) -> None:
         """Expected use case: Create Repository with valid data."""
         # Arrange
@@ -227,6 +404,17 @@ class TestRepository:
         with pytest.raises(ValueError, match="URL must be a GitHub repository"):
             Repository(name=name, url="https://gitlab.com/user/repo")
 
+    def test_repository_url_host_case_insensitive(self) -> None:
+        """Edge case: GitHub host is matched regardless of case."""
+        # Arrange
+        url = "https://GitHub.COM/user/test-repo"
+
+        # Act
+        repo = Repository(name="test-repo", url=url)
+
+        # Assert
+        assert repo.url == url
+
     def test_repository_invalid_status_fails(self) -> None:
         """Failure case: Repository with invalid status should fail validation."""
         # Arrange
@@ -349,6 +537,24 @@ class TestDocument:
 class TestJob:
     """Test cases for Job model."""
 
+    def test_job_payload_columns_are_jsonb(self) -> None:
+        """Expected use case: Job params and result are stored as jsonb."""
+        table = Job.__table__
+
+        assert isinstance(table.c.params.type, JSONB)
+        assert isinstance(table.c.result.type, JSONB)
+
+    def test_job_params_have_gin_index(self) -> None:
+        """Expected use case: Job params get a jsonb_path_ops GIN index."""
+        indexes = {index.name: index for index in Job.__table__.indexes}
+        index = indexes["ix_jobs_params_gin"]
+
+        assert [column.name for column in index.columns] == ["params"]
+        assert index.dialect_options["postgresql"]["using"] == "gin"
+        assert index.dialect_options["postgresql"]["ops"] == {
+            "params": "jsonb_path_ops"
+        }
+
     def test_job_creation_success(self) -> None:
         """Expected use case: Create Job with valid data."""
         # Arrange
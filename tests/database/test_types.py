@@ -0,0 +1,115 @@
+"""Tests for custom SQLAlchemy column types."""
+
+import enum
+
+import numpy as np
+import pytest
+from mindbridge.database.models import (
+    JOB_STATUS_CODES,
+    JOB_TYPE_CODES,
+    REPOSITORY_STATUS_CODES,
+    Job,
+    JobStatus,
+    JobType,
+    Repository,
+    RepositoryStatus,
+)
+from mindbridge.database.types import (
+    HalfVec,
+    SmallIntEnum,
+    halfvec_from_db,
+    halfvec_to_text,
+)
+from pgvector.utils import HalfVector
+from sqlalchemy.dialects import postgresql
+
+
+class TestSmallIntEnum:
+    """Test cases for SmallIntEnum column type."""
+
+    def test_round_trip_codes(self) -> None:
+        """Expected use case: Enum members round-trip through SMALLINT codes."""
+        column_type = SmallIntEnum(JobStatus, JOB_STATUS_CODES)
+        dialect = postgresql.dialect()
+
+        for member, code in JOB_STATUS_CODES.items():
+            assert column_type.process_bind_param(member, dialect) == code
+            assert column_type.process_result_value(code, dialect) is member
+
+    def test_bind_accepts_enum_value(self) -> None:
+        """Edge case: Raw enum values are converted before binding."""
+        column_type = SmallIntEnum(JobType, JOB_TYPE_CODES)
+        dialect = postgresql.dialect()
+
+        assert column_type.process_bind_param("embedding", dialect) == 2
+        assert column_type.process_bind_param(None, dialect) is None
+        assert column_type.process_result_value(None, dialect) is None
+
+    def test_incomplete_codes_fails(self) -> None:
+        """Failure case: Every enum member needs a unique code."""
+
+        class Color(enum.Enum):
+            RED = "red"
+            BLUE = "blue"
+
+        with pytest.raises(ValueError, match="unique int"):
+            SmallIntEnum(Color, {Color.RED: 0})
+        with pytest.raises(ValueError, match="unique int"):
+            SmallIntEnum(Color, {Color.RED: 0, Color.BLUE: 0})
+
+    def test_model_columns_are_smallint(self) -> None:
+        """Expected use case: Enum-backed columns compile to SMALLINT."""
+        dialect = postgresql.dialect()
+        columns = [
+            (Repository.__table__.c.status, REPOSITORY_STATUS_CODES),
+            (Job.__table__.c.status, JOB_STATUS_CODES),
+            (Job.__table__.c.job_type, JOB_TYPE_CODES),
+        ]
+
+        for column, codes in columns:
+            assert column.type.compile(dialect=dialect) == "SMALLINT"
+            assert set(codes) == set(column.type.enum_class)
+
+        assert REPOSITORY_STATUS_CODES[RepositoryStatus.PENDING] == 0
+
+
+class TestHalfVec:
+    """Test cases for HalfVec column type."""
+
+    def test_bind_matches_pgvector_values(self) -> None:
+        """Expected use case: Bound text parses back to the same FP16 values."""
+        process = HalfVec(3).bind_processor(postgresql.dialect())
+
+        text = process([0.1, 0.2, -3.5])
+
+        np.testing.assert_array_equal(
+            HalfVector.from_text(text).to_numpy(),
+            HalfVector([0.1, 0.2, -3.5]).to_numpy(),
+        )
+
+    def test_bind_accepts_arrays_and_halfvectors(self) -> None:
+        """Edge case: NumPy arrays and HalfVector values bind identically."""
+        values = np.array([0.5, 1.0], dtype=np.float64)
+
+        assert halfvec_to_text(values) == "[0.5,1.0]"
+        assert halfvec_to_text(HalfVector(values)) == "[0.5,1.0]"
+        assert HalfVec(2).bind_processor(postgresql.dialect())(None) is None
+
+    def test_bind_wrong_dimensions_fails(self) -> None:
+        """Failure case: Vectors with the wrong size are rejected."""
+        with pytest.raises(ValueError, match="expected 3 dimensions, not 2"):
+            halfvec_to_text([0.5, 1.0], 3)
+
+    def test_result_loads_float16_array(self) -> None:
+        """Expected use case: Text and binary results load as float16 arrays."""
+        process = HalfVec(2).result_processor(postgresql.dialect(), None)
+        expected = np.array([0.5, -1.25], dtype=np.float16)
+
+        from_text = process("[0.5,-1.25]")
+        from_binary = process(HalfVector(expected).to_binary())
+
+        assert from_text.dtype == np.float16
+        np.testing.assert_array_equal(from_text, expected)
+        np.testing.assert_array_equal(from_binary, expected)
+        assert from_binary.dtype.isnative
+        assert halfvec_from_db(None) is None
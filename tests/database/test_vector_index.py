@@ -0,0 +1,95 @@
+"""Tests for HNSW index tuning helpers."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from mindbridge.database.vector_index import (
+    HNSWParams,
+    configure_ef_search,
+    configure_hnsw_params,
+    drop_ann_index,
+    rebuild_ann_index,
+)
+
+
+class TestConfigureHNSWParams:
+    """Test cases for configure_hnsw_params."""
+
+    @pytest.mark.parametrize(
+        "vector_count,expected",
+        [
+            (10_000, HNSWParams(m=16, ef_construction=64)),
+            (500_000, HNSWParams(m=24, ef_construction=128)),
+            (5_000_000, HNSWParams(m=32, ef_construction=200)),
+            (50_000_000, HNSWParams(m=48, ef_construction=256)),
+        ],
+    )
+    def test_configure_hnsw_params_tiers(
+        self, vector_count: int, expected: HNSWParams
+    ) -> None:
+        """Expected use case: Parameters grow with corpus size."""
+        assert configure_hnsw_params(vector_count) == expected
+
+    def test_configure_hnsw_params_tier_boundaries(self) -> None:
+        """Edge case: Tier upper bounds are exclusive."""
+        assert configure_hnsw_params(0) == HNSWParams(m=16, ef_construction=64)
+        assert configure_hnsw_params(99_999).m == 16
+        assert configure_hnsw_params(100_000).m == 24
+
+    def test_configure_hnsw_params_negative_count_fails(self) -> None:
+        """Failure case: Negative vector count is rejected."""
+        with pytest.raises(ValueError, match="Vector count must be >= 0"):
+            configure_hnsw_params(-1)
+
+
+class TestConfigureEfSearch:
+    """Test cases for configure_ef_search."""
+
+    @pytest.mark.parametrize(
+        "vector_count,expected",
+        [(0, 40), (99_999, 40), (100_000, 100), (999_999, 100), (1_000_000, 200)],
+    )
+    def test_configure_ef_search_tiers(self, vector_count: int, expected: int) -> None:
+        """Expected use case: ef_search grows with corpus size."""
+        assert configure_ef_search(vector_count) == expected
+
+    def test_configure_ef_search_negative_count_fails(self) -> None:
+        """Failure case: Negative vector count is rejected."""
+        with pytest.raises(ValueError, match="Vector count must be >= 0"):
+            configure_ef_search(-1)
+
+
+class TestAnnIndexRebuild:
+    """Test cases for drop_ann_index and rebuild_ann_index."""
+
+    async def test_drop_ann_index(self) -> None:
+        """Expected use case: The HNSW index is dropped if present."""
+        connection = AsyncMock()
+
+        await drop_ann_index(connection)
+
+        statement = connection.execute.await_args.args[0]
+        assert str(statement) == (
+            "DROP INDEX IF EXISTS ix_vector_documents_embedding_hnsw"
+        )
+
+    async def test_rebuild_ann_index_uses_params(self) -> None:
+        """Expected use case: The index is rebuilt with the given parameters."""
+        connection = AsyncMock()
+
+        await rebuild_ann_index(connection, HNSWParams(m=16, ef_construction=64))
+
+        settings, create = connection.execute.await_args_list
+        assert settings.args[1] == {"maintenance_work_mem": "2GB"}
+        ddl = str(create.args[0])
+        assert "USING hnsw (embedding halfvec_cosine_ops)" in ddl
+        assert "WITH (m = 16, ef_construction = 64)" in ddl
+
+    async def test_rebuild_ann_index_invalid_params_fails(self) -> None:
+        """Failure case: ef_construction below 2 * m is rejected."""
+        connection = AsyncMock()
+
+        with pytest.raises(ValueError, match="ef_construction must be >= 2"):
+            await rebuild_ann_index(connection, HNSWParams(m=32, ef_construction=40))
+
+        connection.execute.assert_not_awaited()
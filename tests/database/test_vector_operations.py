@@ -2,6 +2,7 @@
 
 from unittest.mock import AsyncMock, Mock
 
+import numpy as np
 import pytest
 from mindbridge.database.models import VectorDocument
 from sqlalchemy import text
@@ -11,7 +12,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 class TestVectorSimilarityOperations:
     """Test cases for vector similarity operations."""
 
-    @pytest.mark.asyncio
     async def test_l2_distance_calculation_success(self) -> None:
         """Expected use case: Calculate L2 distance between vectors."""
         # Arrange
@@ -30,7 +30,6 @@ class TestVectorSimilarityOperations:
         assert distance == 5.196152
         mock_session.execute.assert_called_once_with(query)
 
-    @pytest.mark.asyncio
     async def test_cosine_distance_calculation_success(self) -> None:
         """Expected use case: Calculate cosine distance between vectors."""
         # Arrange
@@ -49,7 +48,6 @@ class TestVectorSimilarityOperations:
         assert distance == 0.025368
         mock_session.execute.assert_called_once_with(query)
 
-    @pytest.mark.asyncio
     async def test_inner_product_calculation_success(self) -> None:
         """Expected use case: Calculate inner product between vectors."""
         # Arrange
@@ -68,7 +66,6 @@ class TestVectorSimilarityOperations:
         assert inner_product == -32.0
         mock_session.execute.assert_called_once_with(query)
 
-    @pytest.mark.asyncio
     async def test_vector_similarity_search_success(self) -> None:
         """Expected use case: Search for similar vectors using L2 distance."""
         # Arrange
@@ -114,7 +111,6 @@ class TestVectorSimilarityOperations:
         assert documents[1] is doc2
         mock_session.execute.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_vector_similarity_with_filtering_success(self) -> None:
         """Expected use case: Search similar vectors with content filtering."""
         # Arrange
@@ -153,7 +149,6 @@ class TestVectorSimilarityOperations:
         assert documents[0].document_type == "code"
         assert documents[0].content == "Python code document"
 
-    @pytest.mark.asyncio
     async def test_vector_similarity_empty_result(self) -> None:
         """Edge case: Vector similarity search with no results."""
         # Arrange
@@ -181,7 +176,6 @@ class TestVectorSimilarityOperations:
         assert len(documents) == 0
         mock_session.execute.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_vector_distance_threshold_filtering(self) -> None:
         """Expected use case: Filter vectors by distance threshold."""
         # Arrange
@@ -241,7 +235,6 @@ class TestVectorSimilarityOperations:
         ):
             VectorDocument(content="Test document", embedding=incorrect_embedding)
 
-    @pytest.mark.asyncio
     async def test_batch_vector_insert_success(self) -> None:
         """Expected use case: Insert multiple vector documents in batch."""
         # Arrange
@@ -264,7 +257,6 @@ class TestVectorSimilarityOperations:
         mock_session.add_all.assert_called_once_with(documents)
         mock_session.commit.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_vector_document_retrieval_by_id(self) -> None:
         """Expected use case: Retrieve vector document by ID."""
         # Arrange
@@ -294,7 +286,6 @@ class TestVectorSimilarityOperations:
         assert retrieved_doc.content == "Retrieved document"
         assert len(retrieved_doc.embedding) == 1536
 
-    @pytest.mark.asyncio
     async def test_vector_document_update_embedding(self) -> None:
         """Expected use case: Update vector document embedding."""
         # Arrange
@@ -312,5 +303,7 @@ class TestVectorSimilarityOperations:
         await mock_session.commit()
 
         # Assert
-        assert doc.embedding == new_embedding
+        np.testing.assert_array_equal(
+            doc.embedding, np.asarray(new_embedding, dtype=np.float16)
+        )
         mock_session.commit.assert_called_once()
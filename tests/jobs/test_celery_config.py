@@ -1,6 +1,9 @@
 """Tests for Celery broker configuration."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import threading
+from dataclasses import FrozenInstanceError
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from mindbridge.jobs.celery_app import create_celery_app, get_celery_app
@@ -39,9 +42,9 @@ class TestCeleryBrokerConfig:
 
         assert config.broker_url == "redis://localhost:6379/0"
         assert config.result_backend == "redis://localhost:6379/0"
-        assert config.task_serializer == "json"
-        assert config.result_serializer == "json"
-        assert config.accept_content == ["json"]
+        assert config.task_serializer == "msgpack"
+        assert config.result_serializer == "msgpack"
+        assert config.accept_content == ["msgpack", "json", "orjson"]
         assert config.timezone == "UTC"
         assert config.enable_utc is True
         assert config.visibility_timeout == 3600
@@ -76,6 +79,19 @@ class TestCeleryBrokerConfig:
                 broker_url="redis://localhost:6379/0", accept_content=["invalid"]
             )
 
+    def test_celery_broker_config_rejects_unsafe_serializers(self) -> None:
+        """Failure case: pickle and yaml are not allowed."""
+        with pytest.raises(ValueError, match="Invalid task serializer: pickle"):
+            CeleryBrokerConfig(
+                broker_url="redis://localhost:6379/0", task_serializer="pickle"
+            )
+
+        with pytest.raises(ValueError, match="Invalid content type: pickle, yaml"):
+            CeleryBrokerConfig(
+                broker_url="redis://localhost:6379/0",
+                accept_content=["json", "yaml", "pickle"],
+            )
+
     def test_celery_broker_config_invalid_visibility_timeout(self) -> None:
         """Failure case: Invalid visibility timeout."""
         with pytest.raises(ValueError, match="Visibility timeout must be > 0"):
@@ -121,6 +137,33 @@ class TestCeleryBrokerConfig:
         assert config_dict["enable_utc"] is True
         assert config_dict["broker_transport_options"]["visibility_timeout"] == 3600
 
+    def test_celery_broker_config_bounded_retries(self) -> None:
+        """Expected use case: Broker reconnects are capped with backoff."""
+        config = CeleryBrokerConfig(broker_url="redis://localhost:6379/0")
+
+        transport_options = config.to_dict()["broker_transport_options"]
+
+        assert transport_options["max_retries"] == 5
+        assert transport_options["interval_start"] == 0.1
+        assert transport_options["interval_step"] == 0.5
+        assert transport_options["interval_max"] == 3.0
+
+    def test_celery_broker_config_to_dict_keys(self) -> None:
+        """Edge case: Only Celery setting names appear in the dictionary."""
+        config = CeleryBrokerConfig(broker_url="redis://localhost:6379/0")
+
+        assert set(config.to_dict()) == {
+            "broker_url",
+            "result_backend",
+            "task_serializer",
+            "result_serializer",
+            "accept_content",
+            "timezone",
+            "enable_utc",
+            "broker_transport_options",
+            "result_backend_transport_options",
+        }
+
 
 class TestCeleryConfig:
     """Test cases for Celery configuration."""
@@ -250,9 +293,12 @@ class TestCeleryConfig:
 
         assert settings["broker_url"] == "redis://localhost:6379/0"
         assert settings["result_backend"] == "redis://localhost:6379/1"
-        assert settings["task_serializer"] == "json"
-        assert settings["result_serializer"] == "json"
-        assert settings["accept_content"] == ["json"]
+        assert settings["task_serializer"] == "msgpack"
+        assert settings["result_serializer"] == "msgpack"
+        assert settings["accept_content"] == ["msgpack", "json", "orjson"]
+        assert settings["task_compression"] == "zstd"
+        assert settings["broker_connection_max_retries"] == 5
+        assert settings["result_compression"] == "zstd"
         assert settings["timezone"] == "UTC"
         assert settings["enable_utc"] is True
         assert settings["broker_transport_options"]["visibility_timeout"] == 3600
@@ -262,6 +308,25 @@ class TestCeleryConfig:
         assert settings["task_soft_time_limit"] == 300
         assert settings["task_time_limit"] == 600
 
+    def test_celery_config_settings_built_once(
+        self, celery_config: CeleryConfig
+    ) -> None:
+        """Expected use case: Settings are built once and exposed read-only."""
+        settings = celery_config.get_celery_settings()
+
+        assert celery_config.get_celery_settings() is settings
+        with pytest.raises(TypeError):
+            settings["task_time_limit"] = 1  # type: ignore[index]
+
+    def test_celery_config_is_immutable(self, celery_config: CeleryConfig) -> None:
+        """Failure case: Config fields cannot be reassigned after creation."""
+        with pytest.raises(FrozenInstanceError):
+            celery_config.task_time_limit = 1  # type: ignore[misc]
+
+        broker_config = celery_config.broker_config
+        with pytest.raises(FrozenInstanceError):
+            broker_config.broker_url = "redis://other:6379/0"  # type: ignore[misc]
+
 
 class TestCeleryApp:
     """Test cases for Celery application creation and management."""
@@ -285,7 +350,9 @@ class TestCeleryApp:
 
             assert app == mock_app
             mock_celery_class.assert_called_once_with("mindbridge")
-            mock_app.config_from_object.assert_called_once()
+            mock_app.conf.update.assert_called_once_with(
+                celery_config.get_celery_settings()
+            )
 
     def test_create_celery_app_with_custom_name(
         self, celery_config: CeleryConfig
@@ -340,7 +407,6 @@ class TestCeleryApp:
             ):
                 get_celery_app()
 
-    @pytest.mark.asyncio
     async def test_celery_broker_connection_check_success(
         self, celery_config: CeleryConfig
     ) -> None:
@@ -358,7 +424,6 @@ class TestCeleryApp:
 
             assert result is True
 
-    @pytest.mark.asyncio
     async def test_celery_broker_connection_check_failure(
         self, celery_config: CeleryConfig
     ) -> None:
@@ -376,7 +441,6 @@ class TestCeleryApp:
 
             assert result is False
 
-    @pytest.mark.asyncio
     async def test_celery_broker_connection_check_no_workers(
         self, celery_config: CeleryConfig
     ) -> None:
@@ -392,6 +456,27 @@ class TestCeleryApp:
 
             assert result is False
 
+    async def test_celery_broker_connection_check_uses_broker_executor(
+        self, celery_config: CeleryConfig
+    ) -> None:
+        """Expected use case: Broker control calls run in the dedicated pool."""
+        thread_names = []
+
+        def _ping() -> dict[str, str]:
+            thread_names.append(threading.current_thread().name)
+            return {"worker1": "pong"}
+
+        with patch("mindbridge.jobs.celery_app.create_celery_app") as mock_create:
+            mock_app = MagicMock()
+            mock_app.control.inspect.return_value.ping.side_effect = _ping
+            mock_create.return_value = mock_app
+
+            from mindbridge.jobs.celery_app import check_broker_connection
+
+            assert await check_broker_connection(celery_config) is True
+
+        assert thread_names[0].startswith("celery-ctrl")
+
     def test_celery_app_task_registration(self, celery_config: CeleryConfig) -> None:
         """Expected use case: Register tasks with Celery app."""
         with patch("mindbridge.jobs.celery_app.Celery") as mock_celery_class:
@@ -439,6 +524,8 @@ class TestCeleryApp:
             assert config.broker_config.broker_url == "redis://localhost:6379/0"
             assert config.broker_config.result_backend == "redis://localhost:6379/1"
             assert config.broker_config.visibility_timeout == 7200
+            assert config.broker_config.task_serializer == "msgpack"
+            assert config.broker_config.accept_content == ["msgpack", "json", "orjson"]
 
     def test_celery_config_environment_variables_missing(self) -> None:
         """Failure case: Missing required environment variables."""
@@ -467,6 +554,54 @@ class TestCeleryApp:
             ):
                 get_celery_config_from_env()
 
+    def test_celery_config_environment_worker_setting_invalid(self) -> None:
+        """Failure case: Invalid worker settings name the offending variable."""
+        with patch.dict(
+            "os.environ",
+            {
+                "REDIS_URL": "redis://localhost:6379/0",
+                "CELERY_TASK_TIME_LIMIT": "ten",
+            },
+        ):
+            from mindbridge.jobs.celery_config import get_celery_config_from_env
+
+            with pytest.raises(
+                BrokerConfigurationError, match="Invalid CELERY_TASK_TIME_LIMIT: ten"
+            ):
+                get_celery_config_from_env()
+
+    def test_celery_config_parsed_once(self) -> None:
+        """Expected use case: The environment is parsed once per process."""
+        from mindbridge.jobs.celery_config import get_celery_config
+
+        get_celery_config.cache_clear()
+        try:
+            with patch.dict("os.environ", {"REDIS_URL": "redis://localhost:6379/0"}):
+                config = get_celery_config()
+
+            with patch.dict("os.environ", {"REDIS_URL": "redis://other:6379/0"}):
+                assert get_celery_config() is config
+        finally:
+            get_celery_config.cache_clear()
+
+    def test_reset_celery_app_clears_parsed_config(self) -> None:
+        """Edge case: Resetting the app re-reads the environment afterwards."""
+        from mindbridge.jobs.celery_app import reset_celery_app
+        from mindbridge.jobs.celery_config import get_celery_config
+
+        try:
+            with patch.dict("os.environ", {"REDIS_URL": "redis://localhost:6379/0"}):
+                config = get_celery_config()
+
+            reset_celery_app()
+
+            with patch.dict("os.environ", {"REDIS_URL": "redis://other:6379/0"}):
+                reloaded = get_celery_config()
+            assert reloaded is not config
+            assert reloaded.broker_config.broker_url == "redis://other:6379/0"
+        finally:
+            reset_celery_app()
+
     def test_celery_broker_health_check_success(
         self, celery_config: CeleryConfig
     ) -> None:
@@ -503,6 +638,190 @@ class TestCeleryApp:
             assert health["status"] == "unhealthy"
             assert "error" in health
 
+    def test_monitoring_reuses_app_per_config(
+        self, celery_config: CeleryConfig
+    ) -> None:
+        """Expected use case: Repeated monitoring calls build one app per config."""
+        with patch("mindbridge.jobs.celery_app.create_celery_app") as mock_create:
+            mock_create.return_value = MagicMock()
+
+            from mindbridge.jobs.celery_app import (
+                get_broker_health,
+                get_broker_stats_sync,
+            )
+
+            get_broker_health(celery_config)
+            get_broker_stats_sync(celery_config)
+            get_broker_health(celery_config)
+
+            mock_create.assert_called_once_with(celery_config)
+
+    async def test_broker_stats_success(self, celery_config: CeleryConfig) -> None:
+        """Expected use case: Broker stats combine all inspect replies."""
+        with patch("mindbridge.jobs.celery_app.create_celery_app") as mock_create:
+            mock_app = MagicMock()
+            inspect = mock_app.control.inspect.return_value
+            inspect.stats.return_value = {"worker1": {}}
+            inspect.active.return_value = {"worker1": [{"id": "task1"}]}
+            inspect.scheduled.return_value = None
+            inspect.reserved.return_value = {"worker1": []}
+            mock_create.return_value = mock_app
+
+            from mindbridge.jobs.celery_app import (
+                INSPECT_TIMEOUT_SECONDS,
+                get_broker_stats,
+            )
+
+            stats = await get_broker_stats(celery_config)
+
+            mock_app.control.inspect.assert_called_once_with(
+                timeout=INSPECT_TIMEOUT_SECONDS
+            )
+            assert stats == {
+                "stats": {"worker1": {}},
+                "active_tasks": {"worker1": [{"id": "task1"}]},
+                "scheduled_tasks": {},
+                "reserved_tasks": {"worker1": []},
+                "workers_online": 1,
+            }
+
+    async def test_broker_stats_failure(self, celery_config: CeleryConfig) -> None:
+        """Failure case: An inspect error yields empty stats with the error."""
+        with patch("mindbridge.jobs.celery_app.create_celery_app") as mock_create:
+            mock_app = MagicMock()
+            mock_app.control.inspect.return_value.active.side_effect = Exception(
+                "Connection error"
+            )
+            mock_create.return_value = mock_app
+
+            from mindbridge.jobs.celery_app import get_broker_stats
+
+            stats = await get_broker_stats(celery_config)
+
+            assert stats["error"] == "Connection error"
+            assert stats["workers_online"] == 0
+
+    async def test_queue_lengths_pipelines_llen(self) -> None:
+        """Expected use case: Queue depths are read with one LLEN pipeline."""
+        celery_config = CeleryConfig(
+            broker_config=CeleryBrokerConfig(broker_url="redis://localhost:6379/0"),
+            task_routes={
+                "mindbridge.jobs.tasks.index_repository": {"queue": "indexing"},
+                "mindbridge.jobs.tasks.update_search_index": {"queue": "search"},
+                "mindbridge.jobs.tasks.rebuild_search_index": {"queue": "search"},
+            },
+        )
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[0, 3, 7])
+        client = MagicMock()
+        client.pipeline.return_value.__aenter__.return_value = pipe
+
+        with patch(
+            "mindbridge.jobs.celery_app._get_broker_client", return_value=client
+        ) as mock_get_client:
+            from mindbridge.jobs.celery_app import get_queue_lengths
+
+            lengths = await get_queue_lengths(celery_config)
+
+        assert lengths == {"celery": 0, "indexing": 3, "search": 7}
+        mock_get_client.assert_called_once_with("redis://localhost:6379/0")
+        client.pipeline.assert_called_once_with(transaction=False)
+        assert [call.args for call in pipe.llen.call_args_list] == [
+            ("celery",),
+            ("indexing",),
+            ("search",),
+        ]
+        pipe.execute.assert_awaited_once()
+
+    async def test_queue_lengths_failure(self, celery_config: CeleryConfig) -> None:
+        """Failure case: Redis errors yield no queue lengths."""
+        client = MagicMock()
+        client.pipeline.side_effect = Exception("Connection error")
+
+        with patch(
+            "mindbridge.jobs.celery_app._get_broker_client", return_value=client
+        ):
+            from mindbridge.jobs.celery_app import get_queue_lengths
+
+            assert await get_queue_lengths(celery_config) == {}
+
+    async def test_broker_client_shared_per_url(self) -> None:
+        """Expected use case: One broker client is reused until the URL changes."""
+        from mindbridge.jobs.celery_app import _get_broker_client, reset_celery_app
+
+        try:
+            with patch(
+                "mindbridge.jobs.celery_app.aioredis.Redis.from_url",
+                side_effect=lambda url: MagicMock(name=url),
+            ) as mock_from_url:
+                first = _get_broker_client("redis://localhost:6379/0")
+                assert _get_broker_client("redis://localhost:6379/0") is first
+
+                other = _get_broker_client("redis://other:6379/0")
+
+            assert other is not first
+            assert mock_from_url.call_count == 2
+        finally:
+            reset_celery_app()
+
+    def test_broker_client_not_shared_across_event_loops(self) -> None:
+        """Edge case: A new event loop gets its own broker client."""
+        from mindbridge.jobs.celery_app import _get_broker_client, reset_celery_app
+
+        async def get_client() -> MagicMock:
+            return _get_broker_client("redis://localhost:6379/0")
+
+        try:
+            with patch(
+                "mindbridge.jobs.celery_app.aioredis.Redis.from_url",
+                side_effect=lambda url: MagicMock(name=url),
+            ):
+                first = asyncio.run(get_client())
+                second = asyncio.run(get_client())
+
+            assert second is not first
+        finally:
+            reset_celery_app()
+
+    async def test_close_broker_client(self) -> None:
+        """Expected use case: Closing releases the client until the next call."""
+        from mindbridge.jobs.celery_app import (
+            _get_broker_client,
+            close_broker_client,
+        )
+
+        clients = [AsyncMock(), AsyncMock()]
+        with patch(
+            "mindbridge.jobs.celery_app.aioredis.Redis.from_url", side_effect=clients
+        ):
+            client = _get_broker_client("redis://localhost:6379/0")
+            await close_broker_client()
+
+            client.aclose.assert_awaited_once()
+            assert _get_broker_client("redis://localhost:6379/0") is clients[1]
+            await close_broker_client()
+
+    async def test_close_broker_client_when_none(self) -> None:
+        """Edge case: Closing without a broker client is a no-op."""
+        from mindbridge.jobs.celery_app import close_broker_client
+
+        await close_broker_client()
+        await close_broker_client()
+
+    def test_monitoring_without_config_uses_global_app(self) -> None:
+        """Expected use case: Monitoring without a config uses the global app."""
+        with patch("mindbridge.jobs.celery_app.get_celery_app") as mock_get_app:
+            mock_app = MagicMock()
+            mock_app.control.inspect.return_value.stats.return_value = {"worker1": {}}
+            mock_get_app.return_value = mock_app
+
+            from mindbridge.jobs.celery_app import get_broker_health
+
+            health = get_broker_health()
+
+            assert health["status"] == "healthy"
+            mock_get_app.assert_called_once_with()
+
     def test_celery_task_routing_configuration(self) -> None:
         """Expected use case: Task routing configured correctly."""
         broker_config = CeleryBrokerConfig(
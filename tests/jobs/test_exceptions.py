@@ -0,0 +1,37 @@
+"""Tests for job queue exceptions."""
+
+from mindbridge.jobs.exceptions import (
+    BrokerConnectionError,
+    JobError,
+    TaskTimeoutError,
+)
+
+
+class TestJobErrors:
+    """Test cases for the job exception hierarchy."""
+
+    def test_default_message_per_subclass(self) -> None:
+        """Expected use case: Each subclass falls back to its own message."""
+        assert str(BrokerConnectionError()) == "Broker connection error"
+        assert str(TaskTimeoutError()) == "Task execution timeout"
+
+    def test_message_and_cause_kept(self) -> None:
+        """Expected use case: An explicit message and cause are preserved."""
+        cause = OSError("refused")
+
+        error = BrokerConnectionError("Failed to ping broker", cause)
+
+        assert isinstance(error, JobError)
+        assert str(error) == "Failed to ping broker"
+        assert error.cause is cause
+
+    def test_empty_message_not_replaced(self) -> None:
+        """Edge case: An explicitly empty message is not swapped for the default."""
+        assert str(TaskTimeoutError("")) == ""
+
+    def test_cause_stored_in_slot(self) -> None:
+        """Expected use case: Instances do not allocate a __dict__ for cause."""
+        error = BrokerConnectionError(cause=OSError("refused"))
+
+        assert vars(error) == {}
+        assert isinstance(error.cause, OSError)
@@ -0,0 +1,95 @@
+"""Tests for Celery message serialization."""
+
+import msgpack
+import numpy as np
+import pytest
+from kombu.serialization import dumps, loads
+from mindbridge.jobs.serialization import (
+    msgpack_dumps,
+    msgpack_loads,
+    orjson_dumps,
+    register_msgpack_serializer,
+    register_orjson_serializer,
+)
+
+
+class TestMsgpackSerializer:
+    """Test cases for the NumPy-aware msgpack codec."""
+
+    def test_roundtrip_plain_payload(self) -> None:
+        """Expected use case: Plain task payloads survive a roundtrip."""
+        payload = {"repository_id": 1, "paths": ["a.py", "b.py"], "blob": b"\x00"}
+
+        assert msgpack_loads(msgpack_dumps(payload)) == payload
+
+    def test_plain_payload_matches_stock_codec(self) -> None:
+        """Expected use case: Without arrays the bytes match kombu's codec."""
+        payload = {"repository_id": 1, "paths": ["a.py"], "blob": b"\x00"}
+
+        assert msgpack_dumps(payload) == msgpack.packb(payload, use_bin_type=True)
+
+    def test_roundtrip_ndarray(self) -> None:
+        """Expected use case: Arrays keep dtype, shape and values."""
+        embeddings = np.arange(12, dtype=np.float16).reshape(3, 4)
+
+        decoded = msgpack_loads(msgpack_dumps({"embeddings": embeddings}))
+
+        assert decoded["embeddings"].dtype == np.float16
+        np.testing.assert_array_equal(decoded["embeddings"], embeddings)
+
+    def test_roundtrip_non_contiguous_ndarray(self) -> None:
+        """Edge case: Strided array views are packed in logical order."""
+        embeddings = np.arange(12, dtype=np.float32).reshape(3, 4)[:, ::2]
+
+        decoded = msgpack_loads(msgpack_dumps(embeddings))
+
+        np.testing.assert_array_equal(decoded, embeddings)
+
+    def test_numpy_scalars_become_python_values(self) -> None:
+        """Edge case: NumPy scalars are packed as plain numbers."""
+        decoded = msgpack_loads(msgpack_dumps({"score": np.float32(0.5)}))
+
+        assert decoded == {"score": 0.5}
+
+    def test_object_array_fails(self) -> None:
+        """Failure case: Arrays of Python objects cannot be packed."""
+        with pytest.raises(TypeError, match="Python objects"):
+            msgpack_dumps(np.array([{"a": 1}], dtype=object))
+
+    def test_registered_with_kombu(self) -> None:
+        """Expected use case: Kombu's msgpack serializer handles arrays."""
+        register_msgpack_serializer()
+        vector = np.ones(4, dtype=np.float16)
+
+        content_type, content_encoding, body = dumps(
+            {"vector": vector}, serializer="msgpack"
+        )
+        decoded = loads(
+            body, content_type, content_encoding, accept={"application/x-msgpack"}
+        )
+
+        assert content_type == "application/x-msgpack"
+        np.testing.assert_array_equal(decoded["vector"], vector)
+
+
+class TestOrjsonSerializer:
+    """Test cases for the orjson codec."""
+
+    def test_ndarray_serialized_as_json_array(self) -> None:
+        """Expected use case: Arrays are written as plain JSON arrays."""
+        body = orjson_dumps({"vector": np.array([0.5, 1.0], dtype=np.float32)})
+
+        assert body == b'{"vector":[0.5,1.0]}'
+
+    def test_registered_with_kombu(self) -> None:
+        """Expected use case: Tasks can opt in to the orjson serializer."""
+        register_orjson_serializer()
+        payload = {"repository_id": 1, "scores": [0.25, 0.5]}
+
+        content_type, content_encoding, body = dumps(payload, serializer="orjson")
+        decoded = loads(
+            body, content_type, content_encoding, accept={"application/x-orjson"}
+        )
+
+        assert content_type == "application/x-orjson"
+        assert decoded == payload
@@ -3,9 +3,15 @@
 import json
 import logging
 from io import StringIO
+from unittest.mock import patch
 
 import structlog
-from mindbridge.observability.logging_config import configure_logging, get_logger
+from mindbridge.observability.logging_config import (
+    add_trace_context,
+    configure_logging,
+    get_logger,
+)
+from opentelemetry.sdk.trace import TracerProvider
 
 
 class TestLoggingConfiguration:
@@ -98,6 +104,16 @@ class TestStructuredLogging:
         finally:
             root_logger.removeHandler(handler)
 
+    def test_json_renderer_serializes_with_orjson(self) -> None:
+        """Expected use case: JSON records are rendered as str by orjson."""
+        configure_logging(log_format="json")
+        renderer = structlog.get_config()["processors"][-1]
+
+        output = renderer(None, "info", {"event": "hello", "count": 2, 1: "x"})
+
+        assert isinstance(output, str)
+        assert json.loads(output) == {"event": "hello", "count": 2, "1": "x"}
+
     def test_logger_includes_trace_correlation(self) -> None:
         """Expected use case: Logger should include OpenTelemetry trace correlation."""
         configure_logging()
@@ -107,6 +123,45 @@ class TestStructuredLogging:
         assert logger is not None
 
 
+class TestTraceContext:
+    """Test cases for trace correlation in log records."""
+
+    def test_add_trace_context_inside_span(self) -> None:
+        """Expected use case: Records inside a span carry its ids."""
+        tracer = TracerProvider().get_tracer(__name__)
+
+        with tracer.start_as_current_span("request") as span:
+            span_context = span.get_span_context()
+            first = add_trace_context(None, "info", {})
+            second = add_trace_context(None, "info", {})
+
+        assert (
+            first
+            == second
+            == {
+                "trace_id": format(span_context.trace_id, "032x"),
+                "span_id": format(span_context.span_id, "016x"),
+            }
+        )
+
+    def test_add_trace_context_follows_child_span(self) -> None:
+        """Edge case: Ids follow a child span once it becomes current."""
+        tracer = TracerProvider().get_tracer(__name__)
+
+        with tracer.start_as_current_span("request"):
+            parent = add_trace_context(None, "info", {})
+            with tracer.start_as_current_span("query") as child:
+                inner = add_trace_context(None, "info", {})
+
+        assert inner["trace_id"] == parent["trace_id"]
+        assert inner["span_id"] == format(child.get_span_context().span_id, "016x")
+        assert inner["span_id"] != parent["span_id"]
+
+    def test_add_trace_context_without_span(self) -> None:
+        """Edge case: Records outside a span get no trace ids."""
+        assert add_trace_context(None, "info", {"event": "x"}) == {"event": "x"}
+
+
 class TestLoggingEdgeCases:
     """Test edge cases for logging configuration."""
 
@@ -116,6 +171,38 @@ class TestLoggingEdgeCases:
         logger = get_logger(__name__)
         assert logger is not None
 
+    def test_configure_logging_same_options_is_noop(self) -> None:
+        """Edge case: Repeating the active configuration keeps cached loggers."""
+        configure_logging(log_level="info", log_format="json")
+
+        with patch("structlog.configure") as mock_configure:
+            configure_logging(log_level="INFO", log_format="json")
+
+        mock_configure.assert_not_called()
+
+    def test_configure_logging_invalid_format_uses_console_chain(self) -> None:
+        """Edge case: Invalid formats get the console processor chain."""
+        configure_logging(log_format="invalid")
+
+        renderer = structlog.get_config()["processors"][-1]
+        assert isinstance(renderer, structlog.dev.ConsoleRenderer)
+
+    def test_configure_logging_skips_contextvars_by_default(self) -> None:
+        """Edge case: Context variables are not merged unless enabled."""
+        with patch.dict("os.environ", {"MINDBRIDGE_USE_CONTEXTVARS": "0"}):
+            configure_logging(log_format="json")
+
+        processors = structlog.get_config()["processors"]
+        assert structlog.contextvars.merge_contextvars not in processors
+
+    def test_configure_logging_merges_contextvars_when_enabled(self) -> None:
+        """Expected use case: The env flag adds bound context to records."""
+        with patch.dict("os.environ", {"MINDBRIDGE_USE_CONTEXTVARS": "1"}):
+            configure_logging(log_format="json")
+
+        processors = structlog.get_config()["processors"]
+        assert processors[0] is structlog.contextvars.merge_contextvars
+
     def test_configure_logging_multiple_calls(self) -> None:
         """Edge case: Multiple configuration calls should not fail."""
         configure_logging(log_format="json")
@@ -1,10 +1,14 @@
 """Tests for OpenTelemetry tracing setup."""
 
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
+import pytest
 from mindbridge.observability.tracing import configure_tracing, get_tracer
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.sampling import ParentBased
 
 
 class TestTracingConfiguration:
@@ -18,7 +22,7 @@ class TestTracingConfiguration:
         assert isinstance(tracer_provider, TracerProvider)
 
     @patch("mindbridge.observability.tracing.trace.set_tracer_provider")
-    @patch("mindbridge.observability.tracing.TracerProvider")
+    @patch("opentelemetry.sdk.trace.TracerProvider")
     def test_configure_tracing_with_custom_service_name(
         self, mock_tracer_provider_class: MagicMock, mock_set_tracer_provider: MagicMock
     ) -> None:
@@ -34,7 +38,7 @@ class TestTracingConfiguration:
         assert resource_arg.attributes.get("service.name") == "custom-service"
 
     @patch("mindbridge.observability.tracing.trace.set_tracer_provider")
-    @patch("mindbridge.observability.tracing.TracerProvider")
+    @patch("opentelemetry.sdk.trace.TracerProvider")
     def test_configure_tracing_with_default_service_name(
         self, mock_tracer_provider_class: MagicMock, mock_set_tracer_provider: MagicMock
     ) -> None:
@@ -67,12 +71,99 @@ class TestTracingConfiguration:
             assert span.is_recording()
             span.set_attribute("test.attribute", "test-value")
 
+    @patch("mindbridge.observability.tracing.trace.set_tracer_provider")
+    @patch("opentelemetry.sdk.trace.export.BatchSpanProcessor")
+    def test_configure_tracing_batch_processor_defaults(
+        self, mock_processor_class: MagicMock, mock_set_tracer_provider: MagicMock
+    ) -> None:
+        """Expected use case: Span batching uses high-throughput defaults."""
+        with patch.dict("os.environ", {"OTEL_BSP_SCHEDULE_DELAY": "1000"}):
+            configure_tracing()
+
+        assert mock_processor_class.call_args.kwargs == {
+            "max_queue_size": 8192,
+            "max_export_batch_size": 512,
+            "schedule_delay_millis": 1000,
+            "export_timeout_millis": 30000,
+        }
+
+    @patch("mindbridge.observability.tracing.trace.set_tracer_provider")
+    @patch("opentelemetry.sdk.trace.export.BatchSpanProcessor")
+    def test_configure_tracing_invalid_batch_setting(
+        self, mock_processor_class: MagicMock, mock_set_tracer_provider: MagicMock
+    ) -> None:
+        """Failure case: A malformed OTEL_BSP_* value falls back to the default."""
+        env = {"OTEL_BSP_MAX_QUEUE_SIZE": "lots", "OTEL_BSP_EXPORT_TIMEOUT": "-1"}
+        with patch.dict("os.environ", env):
+            configure_tracing()
+
+        kwargs = mock_processor_class.call_args.kwargs
+        assert kwargs["max_queue_size"] == 8192
+        assert kwargs["export_timeout_millis"] == 30000
+
+    def test_configure_tracing_samples_by_ratio(self) -> None:
+        """Expected use case: The root sampling ratio is read from the env."""
+        with patch.dict("os.environ", {"OTEL_TRACES_SAMPLER_ARG": "0.0"}):
+            provider = configure_tracing()
+
+        assert isinstance(provider.sampler, ParentBased)
+        with provider.get_tracer(__name__).start_as_current_span("dropped") as span:
+            assert not span.is_recording()
+
+    @pytest.mark.parametrize("ratio", ["half", "1.5", "-0.1", "nan"])
+    def test_configure_tracing_invalid_sampler_ratio(
+        self, ratio: str, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Failure case: A malformed or out-of-range ratio samples everything."""
+        with patch.dict("os.environ", {"OTEL_TRACES_SAMPLER_ARG": ratio}):
+            provider = configure_tracing()
+
+        assert "Invalid OTEL_TRACES_SAMPLER_ARG" in caplog.text
+        with provider.get_tracer(__name__).start_as_current_span("kept") as span:
+            assert span.is_recording()
+
+    @patch("mindbridge.observability.tracing.trace.set_tracer_provider")
+    @patch("opentelemetry.sdk.trace.export.BatchSpanProcessor")
+    def test_configure_tracing_only_once(
+        self, mock_processor_class: MagicMock, mock_set_tracer_provider: MagicMock
+    ) -> None:
+        """Edge case: Repeated calls reuse the provider without more processors."""
+        first = configure_tracing()
+        second = configure_tracing(service_name="other-service")
+
+        assert second is first
+        mock_processor_class.assert_called_once()
+        mock_set_tracer_provider.assert_called_once_with(first)
+
+    @patch("mindbridge.observability.tracing.trace.set_tracer_provider")
+    def test_configure_tracing_sdk_disabled(
+        self, mock_set_tracer_provider: MagicMock
+    ) -> None:
+        """Edge case: OTEL_SDK_DISABLED skips provider setup entirely."""
+        with patch.dict("os.environ", {"OTEL_SDK_DISABLED": "true"}):
+            assert configure_tracing() is None
+
+        mock_set_tracer_provider.assert_not_called()
+
+    def test_import_does_not_load_grpc_exporter(self) -> None:
+        """Expected use case: Importing the module leaves the exporter unloaded."""
+        code = (
+            "import sys, mindbridge.observability.tracing; "
+            "print('opentelemetry.exporter.otlp.proto.grpc' in sys.modules)"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
 
 class TestTracingEdgeCases:
     """Test edge cases for tracing configuration."""
 
     @patch("mindbridge.observability.tracing.trace.set_tracer_provider")
-    @patch("mindbridge.observability.tracing.TracerProvider")
+    @patch("opentelemetry.sdk.trace.TracerProvider")
     def test_configure_tracing_with_empty_service_name(
         self, mock_tracer_provider_class: MagicMock, mock_set_tracer_provider: MagicMock
     ) -> None:
@@ -108,3 +199,8 @@ class TestTracingFailureCases:
         tracer = get_tracer(__name__)
         assert tracer is not None
         # Should be NoOp tracer when not configured
+
+    def test_get_tracer_cached_per_name(self) -> None:
+        """Expected use case: Repeated lookups return the same tracer."""
+        assert get_tracer("mindbridge.cached") is get_tracer("mindbridge.cached")
+        assert get_tracer("mindbridge.cached") is not get_tracer("mindbridge.other")
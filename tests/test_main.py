@@ -1,8 +1,18 @@
 """Tests for the main FastAPI application."""
 
+from collections.abc import Generator
+from unittest.mock import patch
+
 import pytest
+import structlog
 from fastapi.testclient import TestClient
-from mindbridge.main import app
+from httpx import AsyncClient
+from mindbridge.main import _parse_csv, app
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
 
 
 class TestMainApplication:
@@ -14,18 +24,131 @@ class TestMainApplication:
         assert app.title == "Mindbridge"
         assert app.description == "Agentic RAG Documentation System"
 
+    def test_app_uses_orjson_responses(self) -> None:
+        """Expected use case: JSON endpoints default to ORJSONResponse."""
+        from fastapi.responses import ORJSONResponse
+
+        response = TestClient(app).get("/")
+
+        root_route = next(route for route in app.routes if route.path == "/")
+        assert root_route.response_class is ORJSONResponse
+        assert response.json()["status"] == "running"
+
     def test_app_has_cors_middleware(self) -> None:
         """Expected use case: App should have CORS middleware configured."""
         middleware_types = [type(middleware) for middleware in app.user_middleware]
         # We'll check for CORS middleware after implementation
         assert len(middleware_types) >= 0  # Placeholder assertion
 
+    def test_app_cors_origins_parsed_once(self) -> None:
+        """Expected use case: CORS origins are a trimmed tuple built at import."""
+        from fastapi.middleware.cors import CORSMiddleware
+
+        cors = next(m for m in app.user_middleware if m.cls is CORSMiddleware)
+
+        assert cors.kwargs["allow_origins"] == (
+            "http://localhost:3000",
+            "http://localhost:8080",
+        )
+
     def test_app_has_opentelemetry_middleware(self) -> None:
         """Expected use case: App should have OpenTelemetry middleware configured."""
         # This will be implemented after OpenTelemetry setup
         assert app is not None  # Placeholder assertion
 
 
+class TestLifespan:
+    """Test cases for application startup."""
+
+    def test_logging_configured_before_first_log(self) -> None:
+        """Expected use case: Startup logs only after structlog is configured."""
+        configured_at_log: list[bool] = []
+        structlog.reset_defaults()
+
+        with (
+            patch("mindbridge.main.configure_tracing", return_value=TracerProvider()),
+            patch("mindbridge.main.logger") as mock_logger,
+        ):
+            mock_logger.info.side_effect = lambda *_args, **_kwargs: (
+                configured_at_log.append(structlog.is_configured())
+            )
+            with TestClient(app):
+                pass
+
+        assert configured_at_log
+        assert all(configured_at_log)
+
+
+class TestTracingInstrumentation:
+    """Test cases for request tracing set up in the lifespan."""
+
+    @pytest.fixture
+    def exporter(self) -> Generator[InMemorySpanExporter, None, None]:
+        """Collect spans from the provider handed to the instrumentation."""
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        with patch("mindbridge.main.configure_tracing", return_value=provider):
+            yield exporter
+
+    def test_requests_traced_with_configured_provider(
+        self, exporter: InMemorySpanExporter
+    ) -> None:
+        """Expected use case: Requests are traced once the lifespan has run."""
+        with TestClient(app) as client:
+            client.get("/")
+
+        assert any(span.name == "GET /" for span in exporter.get_finished_spans())
+
+    def test_probe_endpoints_not_traced(self, exporter: InMemorySpanExporter) -> None:
+        """Edge case: Health, readiness and metrics requests create no spans."""
+        with TestClient(app) as client:
+            for path in ("/health", "/ready", "/metrics"):
+                client.get(path)
+
+        assert exporter.get_finished_spans() == ()
+
+    def test_uninstrumented_after_shutdown(self) -> None:
+        """Edge case: Shutdown removes the tracing middleware again."""
+        with TestClient(app):
+            pass
+
+        assert not getattr(app, "_is_instrumented_by_opentelemetry", False)
+
+    def test_starlette_rebuilds_cleared_middleware_stack(self) -> None:
+        """Edge case: A cleared middleware stack is rebuilt on the next request.
+
+        The lifespan depends on this Starlette behaviour to add tracing after
+        the stack was built for the lifespan call itself.
+        """
+        from starlette.applications import Starlette
+
+        probe = Starlette()
+        with TestClient(probe) as client:
+            first = probe.middleware_stack
+            probe.middleware_stack = None
+            client.get("/")
+
+        assert first is not None
+        assert probe.middleware_stack is not None
+        assert probe.middleware_stack is not first
+
+
+class TestParseCsv:
+    """Test cases for comma-separated environment values."""
+
+    def test_parse_csv_single_value(self) -> None:
+        """Expected use case: A single value becomes a one-item list."""
+        assert _parse_csv(" http://localhost:3000 ") == ["http://localhost:3000"]
+
+    def test_parse_csv_strips_entries(self) -> None:
+        """Edge case: Whitespace and empty entries are dropped."""
+        assert _parse_csv("http://a.test, http://b.test,,") == [
+            "http://a.test",
+            "http://b.test",
+        ]
+
+
 class TestHealthEndpoints:
     """Test cases for health check endpoints."""
 
@@ -94,6 +217,26 @@ class TestMetricsEndpoints:
         # Basic check for Prometheus format
         assert "# HELP" in response.text or "# TYPE" in response.text
 
+    def test_metrics_response_matches_generate_latest(self, client: TestClient) -> None:
+        """Expected use case: Streamed exposition matches the registry output."""
+        from prometheus_client import generate_latest
+
+        response = client.get("/metrics")
+
+        streamed = response.text.splitlines()
+        expected = generate_latest().decode().splitlines()
+        assert [line for line in streamed if line.startswith("#")] == [
+            line for line in expected if line.startswith("#")
+        ]
+
+    def test_metrics_response_gzip_encoded(self, client: TestClient) -> None:
+        """Expected use case: Metrics are gzip-compressed when accepted."""
+        response = client.get("/metrics", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "# HELP" in response.text
+
 
 class TestRootEndpoint:
     """Test cases for root endpoint."""
@@ -117,3 +260,19 @@ class TestRootEndpoint:
         assert "version" in data
         assert "description" in data
         assert data["name"] == "Mindbridge"
+
+    async def test_root_endpoint_async_client(self, async_client: AsyncClient) -> None:
+        """Expected use case: The in-process async client reaches the app."""
+        response = await async_client.get("/")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "running"
+
+    def test_root_endpoint_serves_prebuilt_body(self, client: TestClient) -> None:
+        """Expected use case: The root body is the bytes serialized at import."""
+        from mindbridge.main import _ROOT_BODY
+
+        response = client.get("/")
+
+        assert response.content == _ROOT_BODY
+        assert response.headers["content-type"] == "application/json"